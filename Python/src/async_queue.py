@@ -0,0 +1,416 @@
+"""
+10/18/2026: J. BRANCH
+
+The goal is to create asyncio-native bounded queues from 'scratch', built on the CircularQueue and Dequeue classes.
+
+Plan:
+    - Datamodel:
+        (composite class) AsyncCircularQueue
+        (composite class) AsyncDequeue
+        (composite class) CircularQueue
+        (composite class) Dequeue
+
+        AsyncCircularQueue / AsyncDequeue
+            |
+        getters: deque[Future], putters: deque[Future], batch_waiters: deque[Future]
+            |
+        CircularQueue (capacity, overwrite_if_full) / Dequeue (backend="linkedlist" or "ring_buffer", optional maxsize)
+
+    - Coroutines run on one event loop thread, so no lock is needed: a coroutine only gives up control at an await,
+      and every check of the queue state is followed by the enqueue/dequeue it guards without an await in between
+    - A coroutine that cannot proceed parks a Future in getters (queue empty) or putters (queue full), a put resolves the first parked getter
+      and a get resolves the first parked putter. A woken coroutine re-checks the queue and parks again if another coroutine got there first
+    - Cancellation safety: a value is only removed from the queue by a coroutine that is running (never while it is parked), so cancelling
+      a get/get_batch never loses a value, and a put that is cancelled while parked has not added its value. A coroutine cancelled after it
+      was woken passes the wakeup on to the next parked coroutine so it is not lost
+    - Timeouts use asyncio.timeout, a put still full after its timeout raises OverflowError and a get still empty after its timeout
+      raises IndexError (the errors of CircularQueue/Dequeue and of the blocking queues)
+    - With overwrite_if_full=True an AsyncCircularQueue never parks producers, a put on a full queue overwrites the oldest element
+      (counted in the overwritten metric)
+    - get_batch(max_items, timeout) is meant for micro-batching: without a timeout it waits for at least one value and returns what is
+      queued (up to max_items), with a timeout it waits until max_items values are queued (or the queue is full) or the timeout
+      expires, then returns what is queued (possibly nothing). Values are only dequeued once it stops waiting, in one step
+
+    - AsyncCircularQueue / AsyncDequeue classes
+        - Public Methods:
+            1. put(self, value: Any, timeout: float | None = None): Coroutine, adds value to the end of the queue, waiting (up to timeout
+                seconds, forever if None) while the queue is full, raises OverflowError if still full
+                return: None
+
+            2. get(self, timeout: float | None = None): Coroutine, removes and returns the value at the front of the queue, waiting (up to
+                timeout seconds, forever if None) while the queue is empty, raises IndexError if still empty
+                return: Any
+
+            3. put_nowait(self, value: Any) / get_nowait(self): put/get without waiting, raise OverflowError/IndexError
+                return: None / Any
+
+            4. get_batch(self, max_items: int, timeout: float | None = None): Coroutine, micro-batching get (see above)
+                return: list[Any]
+
+            5. stats(self): Returns the puts/gets/waits/rejected_puts/empty_gets/overwritten counters, the size and its high-water mark
+                return: dict[str, Any]
+
+            6. is_empty(self) / is_full(self) / __len__ / __repr__
+                return: bool / bool / int / str
+
+        - AsyncDequeue only:
+            7. put_front(self, value: Any, timeout: float | None = None) / put_front_nowait(self, value: Any): put at the front of the queue
+                return: None
+
+            8. get_back(self, timeout: float | None = None) / get_back_nowait(self): get from the back of the queue
+                return: Any
+"""
+from typing import Any
+from abc import ABC, abstractmethod
+from collections import deque
+import asyncio
+
+if not __package__: # run as a script, or imported by a module run as a script
+    from circular_queue import CircularQueue
+    from dequeue import Dequeue
+else:
+    from src.circular_queue import CircularQueue
+    from src.dequeue import Dequeue
+
+class _AsyncQueueBase(ABC):
+    """Shared waiting, wakeup and metrics logic for AsyncCircularQueue and AsyncDequeue, subclasses implement the queue hooks"""
+
+    def __init__(self):
+        self._getters: deque[asyncio.Future] = deque()
+        self._putters: deque[asyncio.Future] = deque()
+        self._batch_waiters: deque[asyncio.Future] = deque()
+        self.puts: int = 0
+        self.gets: int = 0
+        self.put_waits: int = 0
+        self.get_waits: int = 0
+        self.rejected_puts: int = 0
+        self.empty_gets: int = 0
+        self.overwritten: int = 0
+        self.high_water_mark: int = 0
+
+    async def put(self, value: Any, timeout: float | None = None) -> None:
+        """Adds value to the end of the queue, waiting (up to timeout seconds, forever if None) while the queue is full.
+            Raises OverflowError if the queue is still full
+        """
+        await self._wait_not_full(timeout)
+        self._put_nowait(value, front=False)
+        return None
+
+    async def get(self, timeout: float | None = None) -> Any:
+        """Removes and returns the value at the front of the queue, waiting (up to timeout seconds, forever if None) while it is empty.
+            Raises IndexError if the queue is still empty
+        """
+        await self._wait_not_empty(timeout)
+        return self._get_nowait(back=False)
+
+    def put_nowait(self, value: Any) -> None:
+        """put without waiting, raises OverflowError if the queue is full"""
+        self._put_nowait(value, front=False)
+        return None
+
+    def get_nowait(self) -> Any:
+        """get without waiting, raises IndexError if the queue is empty"""
+        return self._get_nowait(back=False)
+
+    async def get_batch(self, max_items: int, timeout: float | None = None) -> list[Any]:
+        """Micro-batching get. Without a timeout, waits for at least one value and returns up to max_items of the queued values.
+            With a timeout, waits until max_items values are queued (or the queue is full) or the timeout expires and returns up to max_items of the
+            queued values (possibly none). The values are dequeued in one step once it stops waiting, so cancelling it never loses values
+        """
+        if (type(max_items) is not int) or (max_items < 1):
+            raise ValueError("max_items must be an int greater than 0.")
+        capacity: int | None = self._capacity()
+        target: int = max_items if capacity is None else min(max_items, capacity) # a full queue cannot grow to max_items
+        if timeout is None:
+            await self._wait_not_empty(None)
+        elif self._size() < target:
+            self.get_waits += 1
+            try:
+                async with asyncio.timeout(timeout):
+                    while self._size() < target:
+                        await self._park(self._batch_waiters)
+            except TimeoutError:
+                pass
+        values: list[Any] = self._dequeue_many(max_items)
+        if not values:
+            self.empty_gets += 1
+        self.gets += len(values)
+        for _ in range(len(values)):
+            self._wakeup_next(self._putters)
+        return values
+
+    def stats(self) -> dict[str, Any]:
+        """Returns the puts/gets/waits/rejected_puts/empty_gets/overwritten counters along with the size and its high-water mark"""
+        return {
+            "puts": self.puts,
+            "gets": self.gets,
+            "put_waits": self.put_waits,
+            "get_waits": self.get_waits,
+            "rejected_puts": self.rejected_puts,
+            "empty_gets": self.empty_gets,
+            "overwritten": self.overwritten,
+            "size": self._size(),
+            "high_water_mark": self.high_water_mark,
+        }
+
+    def is_empty(self) -> bool:
+        """Returns True if the queue is empty, otherwise returns False"""
+        return self._size() == 0
+
+    def is_full(self) -> bool:
+        """Returns True if a put would have to wait, otherwise returns False"""
+        return self._is_full()
+
+    def __len__(self) -> int:
+        """Dunder method to implement len(obj) functionality"""
+        return self._size()
+
+    def _put_nowait(self, value: Any, front: bool) -> None:
+        if self._is_full():
+            self.rejected_puts += 1
+            raise OverflowError("Cannot put into a full queue.")
+        self._enqueue(value, front)
+        self.puts += 1
+        size: int = self._size()
+        if size > self.high_water_mark:
+            self.high_water_mark = size
+        if self._getters:
+            self._wakeup_next(self._getters)
+        while self._batch_waiters: # every batch waiter re-checks whether its batch is complete
+            self._wakeup_next(self._batch_waiters)
+        return None
+
+    def _get_nowait(self, back: bool) -> Any:
+        if self._size() == 0:
+            self.empty_gets += 1
+            raise IndexError("Cannot get from an empty queue.")
+        value: Any = self._dequeue(back)
+        self.gets += 1
+        if self._putters:
+            self._wakeup_next(self._putters)
+        return value
+
+    async def _wait_not_full(self, timeout: float | None) -> None:
+        """Parks in putters until the queue is not full, raises OverflowError if timeout expires first"""
+        if not self._is_full():
+            return None
+        self.put_waits += 1
+        if timeout is None: # no asyncio.timeout context to enter and exit on every wait
+            while self._is_full():
+                await self._park(self._putters)
+            return None
+        try:
+            async with asyncio.timeout(timeout):
+                while self._is_full():
+                    await self._park(self._putters)
+        except TimeoutError:
+            self.rejected_puts += 1
+            raise OverflowError("Cannot put into a full queue.") from None
+        return None
+
+    async def _wait_not_empty(self, timeout: float | None) -> None:
+        """Parks in getters until the queue is not empty, raises IndexError if timeout expires first"""
+        if self._size() > 0:
+            return None
+        self.get_waits += 1
+        if timeout is None:
+            while self._size() == 0:
+                await self._park(self._getters)
+            return None
+        try:
+            async with asyncio.timeout(timeout):
+                while self._size() == 0:
+                    await self._park(self._getters)
+        except TimeoutError:
+            self.empty_gets += 1
+            raise IndexError("Cannot get from an empty queue.") from None
+        return None
+
+    async def _park(self, waiters: deque[asyncio.Future]) -> None:
+        """Waits until a Future parked in waiters is resolved, if cancelled after being woken the wakeup is passed to the next waiter"""
+        waiter: asyncio.Future = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError: # already removed by the wakeup
+                pass
+            if not waiter.cancelled():
+                self._wakeup_next(waiters)
+            raise
+        return None
+
+    @staticmethod
+    def _wakeup_next(waiters: deque[asyncio.Future]) -> None:
+        """Resolves the first parked Future that is still pending"""
+        while waiters:
+            waiter: asyncio.Future = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+        return None
+
+    @abstractmethod
+    def _size(self) -> int:
+        """Number of queued values"""
+
+    @abstractmethod
+    def _is_full(self) -> bool:
+        """True if put has to park, always False for a queue that overwrites"""
+
+    @abstractmethod
+    def _capacity(self) -> int | None:
+        """Most values the queue can hold at once (None if unbounded), caps what get_batch waits for"""
+
+    @abstractmethod
+    def _enqueue(self, value: Any, front: bool) -> None:
+        """Adds value at the back (or the front), counting overwritten elements"""
+
+    @abstractmethod
+    def _dequeue(self, back: bool) -> Any:
+        """Removes the front (or back) value, only called when the queue is not empty"""
+
+    @abstractmethod
+    def _dequeue_many(self, max_items: int) -> list[Any]:
+        """Removes up to max_items front values in one step"""
+
+
+class AsyncCircularQueue(_AsyncQueueBase):
+    """asyncio CircularQueue, overwrite_if_full=True makes put overwrite the oldest element instead of waiting"""
+
+    def __init__(self, capacity: int, overwrite_if_full: bool = False):
+        super().__init__()
+        self.queue = CircularQueue(capacity=capacity, overwrite_if_full=overwrite_if_full)
+
+    def __repr__(self) -> str:
+        """Dunder method to implement repr(obj) functionality"""
+        return f"class_name=AsyncCircularQueue, id={id(self)}, size={self.queue.size}, capacity={self.queue.capacity}," \
+            f" overwrite_if_full={self.queue.overwrite_if_full}"
+
+    def _size(self) -> int:
+        return self.queue.size
+
+    def _is_full(self) -> bool:
+        return (self.queue.size == self.queue.capacity) and (not self.queue.overwrite_if_full)
+
+    def _capacity(self) -> int | None:
+        return self.queue.capacity
+
+    def _enqueue(self, value: Any, front: bool) -> None:
+        if self.queue.size == self.queue.capacity: # only reachable with overwrite_if_full
+            self.overwritten += 1
+        self.queue.enqueue(value)
+
+    def _dequeue(self, back: bool) -> Any:
+        return self.queue.dequeue()
+
+    def _dequeue_many(self, max_items: int) -> list[Any]:
+        return [self.queue.dequeue() for _ in range(min(max_items, self.queue.size))]
+
+
+class AsyncDequeue(_AsyncQueueBase):
+    """asyncio Dequeue, unbounded unless maxsize is set, values can be put/got at both ends"""
+
+    def __init__(self, maxsize: int | None = None, backend: str = "linkedlist"):
+        if (maxsize is not None) and ((type(maxsize) is not int) or (maxsize < 1)):
+            raise ValueError("maxsize must be an int greater than 0.")
+        super().__init__()
+        self.maxsize: int | None = maxsize
+        self.queue = Dequeue(backend=backend)
+
+    async def put_front(self, value: Any, timeout: float | None = None) -> None:
+        """put at the front of the queue"""
+        await self._wait_not_full(timeout)
+        self._put_nowait(value, front=True)
+        return None
+
+    def put_front_nowait(self, value: Any) -> None:
+        """put_nowait at the front of the queue"""
+        self._put_nowait(value, front=True)
+        return None
+
+    async def get_back(self, timeout: float | None = None) -> Any:
+        """get from the back of the queue"""
+        await self._wait_not_empty(timeout)
+        return self._get_nowait(back=True)
+
+    def get_back_nowait(self) -> Any:
+        """get_nowait from the back of the queue"""
+        return self._get_nowait(back=True)
+
+    def __repr__(self) -> str:
+        """Dunder method to implement repr(obj) functionality"""
+        return f"class_name=AsyncDequeue, id={id(self)}, backend={self.queue.backend}, size={len(self.queue)}, maxsize={self.maxsize}"
+
+    def _size(self) -> int:
+        return len(self.queue)
+
+    def _is_full(self) -> bool:
+        return (self.maxsize is not None) and (len(self.queue) >= self.maxsize)
+
+    def _capacity(self) -> int | None:
+        return self.maxsize
+
+    def _enqueue(self, value: Any, front: bool) -> None:
+        if front:
+            self.queue.enqueue_front(value)
+        else:
+            self.queue.enqueue(value)
+
+    def _dequeue(self, back: bool) -> Any:
+        return self.queue.dequeue_back() if back else self.queue.dequeue()
+
+    def _dequeue_many(self, max_items: int) -> list[Any]:
+        return [self.queue.dequeue() for _ in range(min(max_items, len(self.queue)))]
+
+#--------------------------------------------------------
+def _benchmark_script(num_items: int = 200_000, num_producers: int = 4, num_consumers: int = 4, capacity: int = 1_024, batch_size: int = 64):
+    """Items/sec moved from num_producers to num_consumers coroutines through each bounded queue, against asyncio.Queue"""
+    import time
+
+    class AsyncioAdapter: # asyncio.Queue with get_batch built from get + get_nowait
+        def __init__(self):
+            self.queue = asyncio.Queue(maxsize=capacity)
+            self.put, self.get = self.queue.put, self.queue.get
+        async def get_batch(self, max_items: int, timeout: float | None = None) -> list[Any]:
+            values: list[Any] = [await self.queue.get()]
+            while (len(values) < max_items) and not self.queue.empty():
+                values.append(self.queue.get_nowait())
+            return values
+
+    async def run(shared_queue, batched: bool) -> float:
+        per_producer: int = num_items // num_producers
+        async def producer():
+            for value in range(1, per_producer + 1):
+                await shared_queue.put(value)
+        async def consumer():
+            while True:
+                values: list[Any] = await shared_queue.get_batch(batch_size) if batched else [await shared_queue.get()]
+                if -1 in values: # stop sentinel, one per consumer
+                    for _ in range(values.count(-1) - 1): # hand the other consumers' sentinels back
+                        await shared_queue.put(-1)
+                    break
+        start = time.perf_counter()
+        consumers = [asyncio.create_task(consumer()) for _ in range(num_consumers)]
+        await asyncio.gather(*(producer() for _ in range(num_producers)))
+        for _ in range(num_consumers):
+            await shared_queue.put(-1)
+        await asyncio.gather(*consumers)
+        return per_producer * num_producers / (time.perf_counter() - start)
+
+    print(f"{num_producers} producers -> {num_consumers} consumers (coroutines), {num_items} items, capacity {capacity}")
+    for label, build in (
+        ("AsyncCircularQueue", lambda: AsyncCircularQueue(capacity=capacity)),
+        ("AsyncDequeue (linkedlist)", lambda: AsyncDequeue(maxsize=capacity)),
+        ("AsyncDequeue (ring_buffer)", lambda: AsyncDequeue(maxsize=capacity, backend="ring_buffer")),
+        ("asyncio.Queue", AsyncioAdapter),
+    ):
+        single_rate: float = asyncio.run(run(build(), batched=False))
+        batched_rate: float = asyncio.run(run(build(), batched=True))
+        print(f"{label:>27}: get {single_rate / 1e3:7.1f} k items/s, get_batch({batch_size}) {batched_rate / 1e3:7.1f} k items/s")
+
+if __name__ == "__main__":
+    _benchmark_script()
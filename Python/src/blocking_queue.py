@@ -0,0 +1,341 @@
+"""
+10/18/2026: J. BRANCH
+
+The goal is to create thread-safe, blocking producer/consumer versions of the Queue and CircularQueue classes from 'scratch'.
+
+Plan:
+    - Datamodel:
+        (composite class) BlockingQueue
+        (composite class) BlockingCircularQueue
+        (composite class) Queue
+        (composite class) CircularQueue
+
+        BlockingQueue / BlockingCircularQueue
+            |
+        Lock <-- not_empty (Condition), not_full (Condition)
+            |
+        Queue (backend="linkedlist" or "ring_buffer", optional maxsize) / CircularQueue (capacity, overwrite_if_full)
+
+    - Every operation runs under one lock, consumers wait on not_empty and producers wait on not_full (both conditions share the lock),
+      so a put wakes exactly one waiting consumer and a get wakes one waiting producer (get_many wakes one per item removed)
+    - BlockingQueue is unbounded unless maxsize is set, BlockingCircularQueue is bounded by capacity
+    - With overwrite_if_full=True a BlockingCircularQueue never blocks producers, a put on a full queue overwrites the oldest element
+      (counted in the overwritten metric), exactly as CircularQueue.enqueue does
+    - Errors mirror the wrapped queues: a put that cannot complete (full after timeout, or full with put_nowait) raises OverflowError,
+      a get that cannot complete (empty after timeout, or empty with get_nowait) raises IndexError
+    - Backpressure metrics (stats): number of puts/gets, puts/gets that had to wait and the total seconds spent waiting,
+      puts rejected (OverflowError) and gets that found nothing, overwritten elements, the current size and its high-water mark
+
+    - BlockingQueue / BlockingCircularQueue classes
+        - Public Methods:
+            1. put(self, value: Any, block: bool = True, timeout: float | None = None): Adds value to the end of the queue, waiting
+                (up to timeout seconds, forever if None) while the queue is full, raises OverflowError if still full
+                return: None
+
+            2. get(self, block: bool = True, timeout: float | None = None): Removes and returns the value at the front of the queue,
+                waiting (up to timeout seconds, forever if None) while the queue is empty, raises IndexError if still empty
+                return: Any
+
+            3. put_nowait(self, value: Any) / get_nowait(self): put/get with block=False
+                return: None / Any
+
+            4. get_many(self, max_items: int, timeout: float | None = None): Waits (up to timeout seconds, forever if None, not at all if 0)
+                for at least one value, then removes and returns up to max_items values in the same lock acquisition
+                return: list[Any] (empty if the timeout expired)
+
+            5. stats(self): Returns the backpressure metrics
+                return: dict[str, Any]
+
+            6. is_empty(self) / is_full(self): Snapshot of the queue state (may be stale as soon as the lock is released)
+                return: bool
+
+            7. __len__ / __repr__: Dunder methods
+"""
+from typing import Any, Callable
+from abc import ABC, abstractmethod
+import threading
+import time
+
+if not __package__: # run as a script, or imported by a module run as a script
+    from queue import Queue
+    from circular_queue import CircularQueue
+else:
+    from src.queue import Queue
+    from src.circular_queue import CircularQueue
+
+class _BlockingQueueBase(ABC):
+    """Shared locking, waiting and metrics for BlockingQueue and BlockingCircularQueue, subclasses implement the queue hooks"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock: Callable[[], float] = clock
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+        self.puts: int = 0
+        self.gets: int = 0
+        self.put_waits: int = 0
+        self.get_waits: int = 0
+        self.put_wait_seconds: float = 0.0
+        self.get_wait_seconds: float = 0.0
+        self.rejected_puts: int = 0
+        self.empty_gets: int = 0
+        self.overwritten: int = 0
+        self.high_water_mark: int = 0
+
+    def put(self, value: Any, block: bool = True, timeout: float | None = None) -> None:
+        """Adds value to the end of the queue, waiting (up to timeout seconds, forever if None) while the queue is full.
+            Raises OverflowError if the queue is still full (immediately if block is False)
+        """
+        with self.not_full:
+            if self._is_full():
+                if (not block) or not self._wait(self.not_full, lambda: not self._is_full(), timeout, is_put=True):
+                    self.rejected_puts += 1
+                    raise OverflowError("Cannot put into a full queue.")
+            self._enqueue(value)
+            self.puts += 1
+            self.high_water_mark = max(self.high_water_mark, self._size())
+            self.not_empty.notify()
+        return None
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        """Removes and returns the value at the front of the queue, waiting (up to timeout seconds, forever if None) while it is empty.
+            Raises IndexError if the queue is still empty (immediately if block is False)
+        """
+        with self.not_empty:
+            if self._size() == 0:
+                if (not block) or not self._wait(self.not_empty, self._size, timeout, is_put=False):
+                    self.empty_gets += 1
+                    raise IndexError("Cannot get from an empty queue.")
+            value: Any = self._dequeue()
+            self.gets += 1
+            self.not_full.notify()
+        return value
+
+    def put_nowait(self, value: Any) -> None:
+        """put without waiting, raises OverflowError if the queue is full"""
+        return self.put(value, block=False)
+
+    def get_nowait(self) -> Any:
+        """get without waiting, raises IndexError if the queue is empty"""
+        return self.get(block=False)
+
+    def get_many(self, max_items: int, timeout: float | None = None) -> list[Any]:
+        """Waits (up to timeout seconds, forever if None, not at all if 0) for at least one value, then removes and returns
+            up to max_items values in the same lock acquisition. Returns an empty list if the timeout expired
+        """
+        if (type(max_items) is not int) or (max_items < 1):
+            raise ValueError("max_items must be an int greater than 0.")
+        with self.not_empty:
+            if self._size() == 0:
+                if (timeout == 0) or not self._wait(self.not_empty, self._size, timeout, is_put=False):
+                    self.empty_gets += 1
+                    return []
+            values: list[Any] = self._dequeue_many(max_items)
+            self.gets += len(values)
+            self.not_full.notify(len(values))
+        return values
+
+    def stats(self) -> dict[str, Any]:
+        """Returns the backpressure metrics along with the current size"""
+        with self.lock:
+            return {
+                "puts": self.puts,
+                "gets": self.gets,
+                "put_waits": self.put_waits,
+                "get_waits": self.get_waits,
+                "put_wait_seconds": self.put_wait_seconds,
+                "get_wait_seconds": self.get_wait_seconds,
+                "rejected_puts": self.rejected_puts,
+                "empty_gets": self.empty_gets,
+                "overwritten": self.overwritten,
+                "size": self._size(),
+                "high_water_mark": self.high_water_mark,
+            }
+
+    def is_empty(self) -> bool:
+        """Returns True if the queue is empty, otherwise returns False"""
+        with self.lock:
+            return self._size() == 0
+
+    def is_full(self) -> bool:
+        """Returns True if a put would have to wait, otherwise returns False"""
+        with self.lock:
+            return self._is_full()
+
+    def __len__(self) -> int:
+        """Dunder method to implement len(obj) functionality"""
+        with self.lock:
+            return self._size()
+
+    def _wait(self, condition: threading.Condition, predicate: Callable[[], Any], timeout: float | None, is_put: bool) -> bool:
+        """Waits on condition (lock held) until predicate is true or timeout expires, recording the wait in the metrics"""
+        start: float = self.clock()
+        ready: bool = bool(condition.wait_for(predicate, timeout))
+        if is_put:
+            self.put_waits += 1
+            self.put_wait_seconds += self.clock() - start
+        else:
+            self.get_waits += 1
+            self.get_wait_seconds += self.clock() - start
+        return ready
+
+    @abstractmethod
+    def _size(self) -> int:
+        """Number of queued values, called with the lock held"""
+
+    @abstractmethod
+    def _is_full(self) -> bool:
+        """True if put has to wait, always False for a queue that overwrites"""
+
+    @abstractmethod
+    def _enqueue(self, value: Any) -> None:
+        """Adds value to the wrapped queue, counting overwritten elements"""
+
+    @abstractmethod
+    def _dequeue(self) -> Any:
+        """Removes the front value of the wrapped queue, only called when it is not empty"""
+
+    @abstractmethod
+    def _dequeue_many(self, max_items: int) -> list[Any]:
+        """Removes up to max_items front values of the wrapped queue in one call"""
+
+
+class BlockingQueue(_BlockingQueueBase):
+    """Thread-safe Queue with blocking put/get, unbounded unless maxsize is set"""
+
+    def __init__(self, maxsize: int | None = None, backend: str = "linkedlist", clock: Callable[[], float] = time.monotonic):
+        if (maxsize is not None) and ((type(maxsize) is not int) or (maxsize < 1)):
+            raise ValueError("maxsize must be an int greater than 0.")
+        super().__init__(clock=clock)
+        self.maxsize: int | None = maxsize
+        self.queue = Queue(backend=backend)
+
+    def __repr__(self) -> str:
+        """Dunder method to implement repr(obj) functionality"""
+        return f"class_name=BlockingQueue, id={id(self)}, backend={self.queue.backend}, size={len(self)}, maxsize={self.maxsize}"
+
+    def _size(self) -> int:
+        return len(self.queue)
+
+    def _is_full(self) -> bool:
+        return (self.maxsize is not None) and (len(self.queue) >= self.maxsize)
+
+    def _enqueue(self, value: Any) -> None:
+        self.queue.enqueue(value)
+
+    def _dequeue(self) -> Any:
+        return self.queue.dequeue()
+
+    def _dequeue_many(self, max_items: int) -> list[Any]:
+        return self.queue.dequeue_many(max_items)
+
+
+class BlockingCircularQueue(_BlockingQueueBase):
+    """Thread-safe CircularQueue with blocking put/get, overwrite_if_full=True makes put overwrite the oldest element instead of waiting"""
+
+    def __init__(self, capacity: int, overwrite_if_full: bool = False, clock: Callable[[], float] = time.monotonic):
+        super().__init__(clock=clock)
+        self.queue = CircularQueue(capacity=capacity, overwrite_if_full=overwrite_if_full)
+
+    def __repr__(self) -> str:
+        """Dunder method to implement repr(obj) functionality"""
+        return f"class_name=BlockingCircularQueue, id={id(self)}, size={len(self)}, capacity={self.queue.capacity}," \
+            f" overwrite_if_full={self.queue.overwrite_if_full}"
+
+    def _size(self) -> int:
+        return self.queue.size
+
+    def _is_full(self) -> bool:
+        return (self.queue.size == self.queue.capacity) and (not self.queue.overwrite_if_full)
+
+    def _enqueue(self, value: Any) -> None:
+        if self.queue.size == self.queue.capacity: # only reachable with overwrite_if_full
+            self.overwritten += 1
+        self.queue.enqueue(value)
+
+    def _dequeue(self) -> Any:
+        return self.queue.dequeue()
+
+    def _dequeue_many(self, max_items: int) -> list[Any]:
+        return [self.queue.dequeue() for _ in range(min(max_items, self.queue.size))]
+
+#--------------------------------------------------------
+def _import_stdlib_queue():
+    """Returns the standard library queue module, which src/queue.py shadows when this file is run as a script"""
+    import importlib
+    import os
+    import sys
+    src_dir: str = os.path.dirname(os.path.abspath(__file__))
+    loaded = sys.modules.get("queue")
+    if (loaded is not None) and (os.path.dirname(os.path.abspath(getattr(loaded, "__file__", "") or "")) != src_dir):
+        return loaded
+    saved_path: list[str] = sys.path[:]
+    sys.path[:] = [path for path in sys.path if os.path.abspath(path or os.curdir) != src_dir]
+    sys.modules.pop("queue", None)
+    try:
+        return importlib.import_module("queue")
+    finally:
+        sys.path[:] = saved_path
+        if loaded is not None: # leave the shadowing module in place for the imports of this script
+            sys.modules["queue"] = loaded
+
+def _benchmark_script(num_items: int = 200_000, num_producers: int = 4, num_consumers: int = 4, capacity: int = 1_024, batch_size: int = 64):
+    """Items/sec moved from num_producers to num_consumers threads through each bounded queue, against queue.Queue"""
+    stdlib_queue = _import_stdlib_queue()
+
+    class StdlibAdapter: # queue.Queue with get_many built from get + get_nowait
+        def __init__(self):
+            self.queue = stdlib_queue.Queue(maxsize=capacity)
+            self.put, self.get = self.queue.put, self.queue.get
+        def get_many(self, max_items: int, timeout: float | None = None) -> list[Any]:
+            values: list[Any] = [self.queue.get(timeout=timeout)]
+            try:
+                while len(values) < max_items:
+                    values.append(self.queue.get_nowait())
+            except stdlib_queue.Empty:
+                pass
+            return values
+
+    def run(shared_queue, batched: bool) -> float:
+        per_producer: int = num_items // num_producers
+        def producer():
+            for value in range(1, per_producer + 1):
+                shared_queue.put(value)
+        def consumer():
+            while True:
+                values: list[Any] = shared_queue.get_many(batch_size) if batched else [shared_queue.get()]
+                if -1 in values: # stop sentinel, one per consumer
+                    for _ in range(values.count(-1) - 1): # hand the other consumers' sentinels back
+                        shared_queue.put(-1)
+                    break
+        threads = [threading.Thread(target=producer) for _ in range(num_producers)]
+        threads += [threading.Thread(target=consumer) for _ in range(num_consumers)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads[:num_producers]:
+            thread.join()
+        for _ in range(num_consumers):
+            shared_queue.put(-1)
+        for thread in threads[num_producers:]:
+            thread.join()
+        return per_producer * num_producers / (time.perf_counter() - start)
+
+    print(f"{num_producers} producers -> {num_consumers} consumers, {num_items} items, capacity {capacity}")
+    for label, build in (
+        ("BlockingQueue (linkedlist)", lambda: BlockingQueue(maxsize=capacity)),
+        ("BlockingQueue (ring_buffer)", lambda: BlockingQueue(maxsize=capacity, backend="ring_buffer")),
+        ("BlockingCircularQueue", lambda: BlockingCircularQueue(capacity=capacity)),
+        ("queue.Queue", StdlibAdapter),
+    ):
+        single_rate: float = run(build(), batched=False)
+        shared_queue = build()
+        batched_rate: float = run(shared_queue, batched=True)
+        waits: str = ""
+        if hasattr(shared_queue, "stats"):
+            stats: dict[str, Any] = shared_queue.stats()
+            waits = f", batched put waits {stats['put_waits']} ({stats['put_wait_seconds']:.2f} s)"
+        print(f"{label:>28}: get {single_rate / 1e3:7.1f} k items/s, get_many({batch_size}) {batched_rate / 1e3:7.1f} k items/s{waits}")
+
+if __name__ == "__main__":
+    _benchmark_script()
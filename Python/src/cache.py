@@ -0,0 +1,358 @@
+"""
+10/18/2026: J. BRANCH
+
+The goal is to create bounded LRU and LFU cache implementations from 'scratch', built on the HashMap and DoublyLinkedList classes.
+
+Plan:
+    - Datamodel:
+        (composite class) LRUCache
+        (composite class) LFUCache
+        (composite class) HashMap
+        (composite class) DoublyLinkedList
+        (class) Node
+        (class) _CacheEntry
+
+        LRUCache
+            |
+        HashMap: key --> Node ------------------------------------------------+
+            |                                                                   |
+        DoublyLinkedList: head(most recent) --> <--[Node(_CacheEntry)]--> <--...--> <-- tail(least recent)
+
+        LFUCache
+            |
+        HashMap: key --> Node(_CacheEntry)
+            |
+        DoublyLinkedList of frequency buckets (ascending frequency): head(lowest) --> <--[Node(_FrequencyBucket)]--> <--...
+                                                                                               |
+                                                            DoublyLinkedList: head(most recent) --> <--[Node(_CacheEntry)]--> <--...
+
+    - The HashMap maps each key directly to its list node, so a hit moves the node with O(1) pointer updates
+      (DoublyLinkedList._unlink_node/_link_node_*) instead of walking the list with DoublyLinkedList._get_node
+    - LFUCache keeps one entry list per access frequency, the frequency buckets themselves form an ordered linked list
+      (O(1) LFU: an entry only ever moves to the neighbouring bucket), ties are broken by least recent use
+    - Limits (both optional, at least one of them or ttl should be set for the cache to be bounded):
+        - max_entries: maximum number of entries
+        - max_weight: maximum total weight, each entry weighs weigher(key, value) (default: 1 per entry) or the weight passed to put
+    - ttl: default time-to-live in seconds (put may override it per entry), expired entries are dropped lazily when accessed
+      or eagerly via purge_expired
+    - Counters: hits, misses, evictions (removed to respect a limit) and expirations (removed because their ttl elapsed)
+
+    - _CacheEntry class (data-only class)
+        - key, value, weight, expires_at, and (LFUCache only) frequency bucket node
+
+    - LRUCache / LFUCache classes
+        - Public Methods:
+            1. get(self, key: ImmutableType, default(*optional)): Returns the cached value and marks the entry as used, returns default (None) on a miss
+                return: Any
+
+            2. put(self, key: ImmutableType, value: Any, weight(*optional), ttl(*optional)): Inserts or updates an entry, evicting entries as needed to respect the limits
+                Raises ValueError if the entry alone is heavier than max_weight
+                return: None
+
+            3. delete(self, key: ImmutableType): Removes the entry, raises KeyError if the key is not cached
+                return: None
+
+            4. evict(self): Evicts and returns the next entry chosen by the eviction policy (LRU: least recently used, LFU: least frequently used)
+                Raises IndexError if empty
+                return: tuple[key, value]
+
+            5. purge_expired(self): Removes every expired entry
+                return: int (number of entries removed)
+
+            6. stats(self): Returns the hit/miss/eviction/expiration counters along with the current size and weight
+                return: dict[str, Any]
+
+            7. clear(self): Removes every entry (counters are kept)
+                return: None
+
+            8. __len__ / __contains__ / __repr__: Dunder methods, expired entries count as absent for __contains__
+"""
+from typing import Any, Callable
+from abc import ABC, abstractmethod
+import time
+
+if not __package__: # run as a script, or imported by a module run as a script
+    from hashmap import HashMap, ImmutableType
+    from doubly_linked_list import DoublyLinkedList, Node
+else:
+    from src.hashmap import HashMap, ImmutableType
+    from src.doubly_linked_list import DoublyLinkedList, Node
+
+class _CacheEntry:
+    __slots__ = ("key", "value", "weight", "expires_at", "frequency_node")
+
+    def __init__(self, key: ImmutableType, value: Any, weight: float, expires_at: float | None):
+        self.key = key
+        self.value = value
+        self.weight = weight
+        self.expires_at = expires_at
+        self.frequency_node = None
+
+
+class _FrequencyBucket:
+    __slots__ = ("frequency", "entries")
+
+    def __init__(self, frequency: int):
+        self.frequency = frequency
+        self.entries = DoublyLinkedList()
+
+
+class _BoundedCache(ABC):
+    """Shared bookkeeping for LRUCache and LFUCache, subclasses implement the eviction policy hooks"""
+
+    def __init__(self, max_entries: int | None = None, max_weight: float | None = None,
+                 weigher: Callable[[ImmutableType, Any], float] | None = None, ttl: float | None = None,
+                 clock: Callable[[], float] = time.monotonic):
+        if (max_entries is not None) and ((type(max_entries) is not int) or (max_entries < 1)):
+            raise ValueError("max_entries must be an int greater than 0.")
+        if (max_weight is not None) and (max_weight <= 0):
+            raise ValueError("max_weight must be greater than 0.")
+        if (ttl is not None) and (ttl <= 0):
+            raise ValueError("ttl must be greater than 0.")
+        self.max_entries: int | None = max_entries
+        self.max_weight: float | None = max_weight
+        self.weigher: Callable[[ImmutableType, Any], float] | None = weigher
+        self.ttl: float | None = ttl
+        self.clock: Callable[[], float] = clock
+        self.map = HashMap()
+        self.weight: float = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def get(self, key: ImmutableType, default: Any | None = None) -> Any | None:
+        """Returns the cached value and marks the entry as used, returns default (None) on a miss"""
+        node: Node | None = self.map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        entry: _CacheEntry = node.value
+        if self._is_expired(entry):
+            self._remove_node(node)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._on_access(node)
+        self.hits += 1
+        return entry.value
+
+    def put(self, key: ImmutableType, value: Any, weight: float | None = None, ttl: float | None = None) -> None:
+        """Inserts or updates an entry, evicting entries as needed to respect the limits"""
+        if weight is None:
+            weight = self.weigher(key, value) if self.weigher else 1
+        if (self.max_weight is not None) and (weight > self.max_weight):
+            raise ValueError(f"Entry weight {weight} exceeds max_weight {self.max_weight}.")
+        if ttl is None:
+            ttl = self.ttl
+        expires_at: float | None = (self.clock() + ttl) if ttl is not None else None
+
+        node: Node | None = self.map.get(key)
+        if node is not None:
+            entry: _CacheEntry = node.value
+            self.weight += weight - entry.weight
+            entry.value, entry.weight, entry.expires_at = value, weight, expires_at
+            self._on_access(node)
+        else:
+            node = Node(_CacheEntry(key=key, value=value, weight=weight, expires_at=expires_at))
+            self.map.add(key, node)
+            self.weight += weight
+            self._on_insert(node)
+
+        while self._is_over_limit():
+            victim: Node = self._next_victim(exclude=node)
+            self._remove_node(victim)
+            self.evictions += 1
+        return None
+
+    def delete(self, key: ImmutableType) -> None:
+        """Removes the entry, raises KeyError if the key is not cached"""
+        node: Node | None = self.map.get(key)
+        if node is None:
+            raise KeyError(key)
+        self._remove_node(node)
+        return None
+
+    def evict(self) -> tuple[ImmutableType, Any]:
+        """Evicts and returns the next (key, value) chosen by the eviction policy, raises IndexError if empty"""
+        if len(self.map) == 0:
+            raise IndexError("Cannot evict from an empty cache.")
+        node: Node = self._next_victim(exclude=None)
+        self._remove_node(node)
+        self.evictions += 1
+        return node.value.key, node.value.value
+
+    def purge_expired(self) -> int:
+        """Removes every expired entry, returns the number of entries removed"""
+        expired_nodes: list[Node] = [node for node in self.map.values() if self._is_expired(node.value)]
+        for node in expired_nodes:
+            self._remove_node(node)
+        self.expirations += len(expired_nodes)
+        return len(expired_nodes)
+
+    def stats(self) -> dict[str, Any]:
+        """Returns the hit/miss/eviction/expiration counters along with the current size and weight"""
+        lookups: int = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self.map),
+            "weight": self.weight,
+        }
+
+    def clear(self) -> None:
+        """Removes every entry (counters are kept)"""
+        for node in list(self.map.values()):
+            self._remove_node(node)
+        return None
+
+    def __len__(self) -> int:
+        """Dunder method to implement len(obj) functionality"""
+        return len(self.map)
+
+    def __contains__(self, key: object) -> bool:
+        """Dunder method to implement key in obj, does not count as a use of the entry"""
+        node: Node | None = self.map.get(key) if isinstance(key, (str, int, tuple)) else None
+        return (node is not None) and not self._is_expired(node.value)
+
+    def __repr__(self) -> str:
+        """Dunder method to implement repr(obj) functionality"""
+        return f"class_name={type(self).__name__}, id={id(self)}, entries={len(self.map)}, weight={self.weight}," \
+            f" max_entries={self.max_entries}, max_weight={self.max_weight}, ttl={self.ttl}"
+
+    def _is_expired(self, entry: _CacheEntry) -> bool:
+        return (entry.expires_at is not None) and (self.clock() >= entry.expires_at)
+
+    def _is_over_limit(self) -> bool:
+        return ((self.max_entries is not None) and (len(self.map) > self.max_entries)) \
+            or ((self.max_weight is not None) and (self.weight > self.max_weight))
+
+    def _remove_node(self, node: Node) -> None:
+        entry: _CacheEntry = node.value
+        self.map.delete(entry.key)
+        self.weight -= entry.weight
+        self._on_remove(node)
+        return None
+
+    @abstractmethod
+    def _on_insert(self, node: Node) -> None:
+        """Starts tracking a newly inserted entry"""
+
+    @abstractmethod
+    def _on_access(self, node: Node) -> None:
+        """Records a hit (or an update) of the entry"""
+
+    @abstractmethod
+    def _on_remove(self, node: Node) -> None:
+        """Stops tracking an entry removed by delete, expiry or eviction"""
+
+    @abstractmethod
+    def _next_victim(self, exclude: Node | None) -> Node:
+        """Returns the entry the policy evicts next, other than exclude (the entry being inserted)"""
+
+
+class LRUCache(_BoundedCache):
+    """Bounded cache evicting the least recently used entry first"""
+
+    def __init__(self, max_entries: int | None = None, max_weight: float | None = None,
+                 weigher: Callable[[ImmutableType, Any], float] | None = None, ttl: float | None = None,
+                 clock: Callable[[], float] = time.monotonic):
+        super().__init__(max_entries=max_entries, max_weight=max_weight, weigher=weigher, ttl=ttl, clock=clock)
+        self.list = DoublyLinkedList() # head: most recently used, tail: least recently used
+
+    def _on_insert(self, node: Node) -> None:
+        self.list._link_node_first(node)
+        return None
+
+    def _on_access(self, node: Node) -> None:
+        if node is not self.list.head:
+            self.list._unlink_node(node)
+            self.list._link_node_first(node)
+        return None
+
+    def _on_remove(self, node: Node) -> None:
+        self.list._unlink_node(node)
+        return None
+
+    def _next_victim(self, exclude: Node | None) -> Node:
+        victim: Node = self.list.tail
+        if victim is exclude:
+            victim = victim.prev
+        return victim
+
+
+class LFUCache(_BoundedCache):
+    """Bounded cache evicting the least frequently used entry first (least recently used among equally frequent entries)"""
+
+    def __init__(self, max_entries: int | None = None, max_weight: float | None = None,
+                 weigher: Callable[[ImmutableType, Any], float] | None = None, ttl: float | None = None,
+                 clock: Callable[[], float] = time.monotonic):
+        super().__init__(max_entries=max_entries, max_weight=max_weight, weigher=weigher, ttl=ttl, clock=clock)
+        self.frequencies = DoublyLinkedList() # Node(_FrequencyBucket) in ascending frequency order
+
+    def frequency(self, key: ImmutableType) -> int:
+        """Returns the access frequency of a cached key (1 after insertion), raises KeyError if the key is not cached"""
+        node: Node | None = self.map.get(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value.frequency_node.value.frequency
+
+    def _on_insert(self, node: Node) -> None:
+        first_bucket_node: Node | None = self.frequencies.head
+        if (first_bucket_node is None) or (first_bucket_node.value.frequency != 1):
+            first_bucket_node = Node(_FrequencyBucket(frequency=1))
+            self.frequencies._link_node_first(first_bucket_node)
+        first_bucket_node.value.entries._link_node_first(node)
+        node.value.frequency_node = first_bucket_node
+        return None
+
+    def _on_access(self, node: Node) -> None:
+        bucket_node: Node = node.value.frequency_node
+        next_frequency: int = bucket_node.value.frequency + 1
+        next_bucket_node: Node | None = bucket_node.next
+        if (next_bucket_node is None) or (next_bucket_node.value.frequency != next_frequency):
+            next_bucket_node = Node(_FrequencyBucket(frequency=next_frequency))
+            self.frequencies._link_node_after(bucket_node, next_bucket_node)
+
+        self._on_remove(node)
+        next_bucket_node.value.entries._link_node_first(node)
+        node.value.frequency_node = next_bucket_node
+        return None
+
+    def _on_remove(self, node: Node) -> None:
+        bucket_node: Node = node.value.frequency_node
+        bucket_node.value.entries._unlink_node(node)
+        if bucket_node.value.entries.length == 0:
+            self.frequencies._unlink_node(bucket_node)
+        node.value.frequency_node = None
+        return None
+
+    def _next_victim(self, exclude: Node | None) -> Node:
+        bucket_node: Node = self.frequencies.head
+        victim: Node = bucket_node.value.entries.tail
+        if victim is exclude:
+            # the entry just inserted is never its own victim, fall back to the next least frequently used entry
+            victim = victim.prev if victim.prev is not None else bucket_node.next.value.entries.tail
+        return victim
+
+#--------------------------------------------------------
+def _benchmark_script(num_ops: int = 200_000, max_entries: int = 10_000, key_space: int = 20_000):
+    """Measures get/put throughput and hit rate of both caches on a skewed (80/20) key distribution"""
+    import random
+    hot_keys: int = key_space // 5
+    keys = [random.randrange(hot_keys) if random.random() < 0.8 else random.randrange(key_space) for _ in range(num_ops)]
+
+    for cache in (LRUCache(max_entries=max_entries), LFUCache(max_entries=max_entries)):
+        start = time.perf_counter()
+        for key in keys:
+            if cache.get(key) is None:
+                cache.put(key, key+1)
+        elapsed: float = time.perf_counter() - start
+        stats = cache.stats()
+        print(f"{type(cache).__name__:>9}: {num_ops / elapsed:10.0f} ops/s, hit_rate={stats['hit_rate']:.3f}, evictions={stats['evictions']}")
+
+if __name__ == "__main__":
+    _benchmark_script()
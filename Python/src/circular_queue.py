@@ -69,6 +69,8 @@ class CircularQueue:
             raise OverflowError("Enqueue attempted after size has reached capacity.")
         if (self.list[self.rear] is not None) and (not self.overwrite_if_full):
             raise RuntimeError("Internal error in CircularQueue instance when attempting to enqueue.")
+        if (self.size == self.capacity): # overwriting the oldest element, the front moves on to the next oldest
+            self.front = (self.front + 1) % self.capacity
         self.list[self.rear] = value
         self.rear = (self.rear + 1) % self.capacity
         self.size = min((self.size + 1), self.capacity)
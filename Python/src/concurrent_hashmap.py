@@ -0,0 +1,245 @@
+"""
+10/18/2026: J. BRANCH
+
+The goal is to create a thread-safe HashMap from 'scratch' that lets threads working on different keys proceed in parallel.
+
+Plan:
+    - Datamodel:
+        (composite class) ConcurrentHashMap
+        (composite class) HashMap
+
+        ConcurrentHashMap
+            |
+        stripes: [ (HashMap, Lock, version), (HashMap, Lock, version), ..., (HashMap, Lock, version) ]
+
+    - The key space is partitioned into num_stripes stripes by hash(key), every stripe is an independent HashMap
+      guarded by its own lock, so writers only contend when their keys fall in the same stripe
+      (each stripe resizes/rehashes on its own, which is why the stripes are separate HashMaps rather than lock ranges
+      over one shared bucket list that would need every lock to resize)
+    - Lock-free reads use a per-stripe sequence counter (seqlock):
+        - writers increment the stripe's version before and after modifying it (odd version = write in progress)
+        - readers read the version, look the key up without the lock (HashMap._lookup never modifies the HashMap),
+          and only trust the result if the version was even and unchanged afterwards, otherwise they retry under the lock
+      On builds where the GIL is disabled (free-threaded CPython) reads take the stripe lock by default,
+      lock_free_reads=True/False overrides the default
+    - get_or_add/compute run entirely under the stripe lock, so they are atomic with respect to every other operation on the key
+
+    - Public Methods:
+        1. add(self, key: ImmutableType, value: Any): Adds the k-v pair, overwrites the value of an existing key
+            return: None
+
+        2. get(self, key: ImmutableType, default(*optional)): Returns the value for the key if it exists, else returns default (None)
+            return: Any
+
+        3. delete(self, key: ImmutableType, target_value(*optional)): Removes the k-v pair, see HashMap.delete
+            return: None(*raises KeyError if key is not found)
+
+        4. get_or_add(self, key: ImmutableType, value: Any): Atomically returns the existing value, or adds value and returns it
+            return: Any
+
+        5. compute(self, key: ImmutableType, remapping: Callable[[key, old value or None], new value or None]): Atomically replaces
+            the key's value with remapping(key, old_value), a None result removes the key
+            return: Any (the new value, or None)
+
+        6. items(self): Returns a list of (key, value) pairs, each stripe is copied under its lock (consistent per stripe)
+            return: list[tuple[ImmutableType, Any]]
+
+        7. __len__ / __contains__ / __getitem__ / __setitem__ / __delitem__ / __repr__: Dunder methods,
+            len sums the stripe sizes without locking and is exact only while no writer is active
+"""
+from typing import Any, Callable
+import sys
+import threading
+import time
+
+if not __package__: # run as a script, or imported by a module run as a script
+    from hashmap import HashMap, ImmutableType
+else:
+    from src.hashmap import HashMap, ImmutableType
+
+_MISSING = object()
+_RETRY = object() # lock-free read that has to be repeated under the lock, never a caller's default
+
+def _gil_enabled() -> bool:
+    is_gil_enabled: Callable[[], bool] | None = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+class ConcurrentHashMap:
+    def __init__(self, num_stripes: int = 16, lock_free_reads: bool | None = None, **hashmap_kwargs):
+        if (type(num_stripes) is not int):
+            raise TypeError("num_stripes for the ConcurrentHashMap object must be specified as int.")
+        if (num_stripes < 1):
+            raise ValueError("num_stripes for ConcurrentHashMap must be greater than 0.")
+        if hashmap_kwargs.get("multimap"):
+            raise ValueError("ConcurrentHashMap does not support multimap mode, the containers returned by get would be shared unguarded.")
+        self.num_stripes: int = num_stripes
+        self.lock_free_reads: bool = _gil_enabled() if lock_free_reads is None else lock_free_reads
+        self._maps: list[HashMap] = [HashMap(**hashmap_kwargs) for _ in range(num_stripes)]
+        self._locks: list[threading.Lock] = [threading.Lock() for _ in range(num_stripes)]
+        self._versions: list[int] = [0] * num_stripes
+
+    def add(self, key: ImmutableType, value: Any) -> None:
+        """Adds the k-v pair, overwrites the value of an existing key"""
+        stripe: int = self._stripe(key)
+        with self._locks[stripe]:
+            self._versions[stripe] += 1
+            try:
+                self._maps[stripe].add(key, value)
+            finally:
+                self._versions[stripe] += 1
+        return None
+
+    def get(self, key: ImmutableType, default: Any | None = None) -> Any | None:
+        """Returns the value for the key if it exists, else returns default (None)"""
+        stripe: int = self._stripe(key)
+        if self.lock_free_reads:
+            version: int = self._versions[stripe]
+            if version % 2 == 0:
+                try:
+                    value: Any = self._maps[stripe]._lookup(key=key, default=default)
+                except Exception:
+                    value = _RETRY # torn read of a stripe being resized, retry under the lock
+                if (value is not _RETRY) and (self._versions[stripe] == version):
+                    return value
+        with self._locks[stripe]:
+            return self._maps[stripe]._lookup(key=key, default=default)
+
+    def delete(self, key: ImmutableType, target_value: Any | None = None) -> None:
+        """Removes the k-v pair, see HashMap.delete. Raises KeyError if the key is not found."""
+        stripe: int = self._stripe(key)
+        with self._locks[stripe]:
+            self._versions[stripe] += 1
+            try:
+                self._maps[stripe].delete(key, target_value=target_value)
+            finally:
+                self._versions[stripe] += 1
+        return None
+
+    def get_or_add(self, key: ImmutableType, value: Any) -> Any:
+        """Atomically returns the existing value for the key, or adds value and returns it"""
+        stripe: int = self._stripe(key)
+        with self._locks[stripe]:
+            existing_value: Any = self._maps[stripe]._lookup(key=key, default=_MISSING)
+            if existing_value is not _MISSING:
+                return existing_value
+            self._versions[stripe] += 1
+            try:
+                self._maps[stripe].add(key, value)
+            finally:
+                self._versions[stripe] += 1
+            return value
+
+    def compute(self, key: ImmutableType, remapping: Callable[[ImmutableType, Any | None], Any | None]) -> Any | None:
+        """Atomically replaces the key's value with remapping(key, old_value) (old_value is None for a missing key),
+            a None result removes the key. Returns the new value.
+            remapping runs while the stripe is locked, so it must not access this ConcurrentHashMap.
+        """
+        stripe: int = self._stripe(key)
+        with self._locks[stripe]:
+            hashmap: HashMap = self._maps[stripe]
+            old_value: Any | None = hashmap._lookup(key=key, default=None)
+            new_value: Any | None = remapping(key, old_value)
+            if (new_value is None) and (old_value is None):
+                return None
+            self._versions[stripe] += 1
+            try:
+                if new_value is None:
+                    hashmap.delete(key)
+                else:
+                    hashmap.add(key, new_value)
+            finally:
+                self._versions[stripe] += 1
+            return new_value
+
+    def items(self) -> list[tuple[ImmutableType, Any]]:
+        """Returns a list of (key, value) pairs, each stripe is copied under its lock (consistent per stripe)"""
+        kv_pairs: list[tuple[ImmutableType, Any]] = []
+        for stripe in range(self.num_stripes):
+            with self._locks[stripe]:
+                kv_pairs.extend(self._maps[stripe]._iter_items())
+        return kv_pairs
+
+    def __len__(self) -> int:
+        """Dunder method to implement len(obj) functionality, exact only while no writer is active"""
+        return sum(len(hashmap) for hashmap in self._maps)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, (str, int, tuple)):
+            return False
+        return self.get(key, default=_MISSING) is not _MISSING
+
+    def __getitem__(self, key: ImmutableType) -> Any:
+        value: Any = self.get(key, default=_MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: ImmutableType, value: Any) -> None:
+        self.add(key, value)
+
+    def __delitem__(self, key: ImmutableType) -> None:
+        self.delete(key)
+
+    def __repr__(self) -> str:
+        """Dunder method to implement repr(obj) functionality"""
+        return f"class_name=ConcurrentHashMap, id={id(self)}, length={len(self)}, num_stripes={self.num_stripes}," \
+            f" lock_free_reads={self.lock_free_reads}"
+
+    def _stripe(self, key: ImmutableType) -> int:
+        """Returns the index of the stripe owning the key"""
+        if not isinstance(key, (str, int, tuple)):
+            raise TypeError
+        return hash(key) % self.num_stripes
+
+#--------------------------------------------------------
+class _GlobalLockHashMap:
+    """Baseline for the benchmark: a single HashMap with every operation behind one lock"""
+    def __init__(self):
+        self._map = HashMap()
+        self._lock = threading.Lock()
+
+    def add(self, key: ImmutableType, value: Any) -> None:
+        with self._lock:
+            self._map.add(key, value)
+
+    def get(self, key: ImmutableType, default: Any | None = None) -> Any | None:
+        with self._lock:
+            return self._map.get(key, default)
+
+def _benchmark_script(thread_counts: tuple[int, ...] = (1, 2, 4, 8, 16, 32), ops_per_thread: int = 20_000, write_ratio: float = 0.1):
+    """Measures total throughput of a mixed get/add workload against a single globally locked HashMap"""
+    import random
+    print(f"GIL enabled: {_gil_enabled()}")
+    print(f"{'threads':>8} {'global lock ops/s':>18} {'ConcurrentHashMap ops/s':>24}")
+
+    for num_threads in thread_counts:
+        results: list[float] = []
+        for hashmap in (_GlobalLockHashMap(), ConcurrentHashMap()):
+            for key in range(10_000):
+                hashmap.add(key, key+1)
+            workloads = [
+                [(random.random() < write_ratio, random.randrange(20_000)) for _ in range(ops_per_thread)]
+                for _ in range(num_threads)
+            ]
+            barrier = threading.Barrier(num_threads + 1)
+
+            def worker(workload):
+                barrier.wait()
+                for is_write, key in workload:
+                    if is_write:
+                        hashmap.add(key, key+1)
+                    else:
+                        hashmap.get(key)
+
+            threads = [threading.Thread(target=worker, args=(workload,)) for workload in workloads]
+            for thread in threads:
+                thread.start()
+            barrier.wait()
+            start = time.perf_counter()
+            for thread in threads:
+                thread.join()
+            results.append((num_threads * ops_per_thread) / (time.perf_counter() - start))
+        print(f"{num_threads:>8} {results[0]:>18.0f} {results[1]:>24.0f}")
+
+if __name__ == "__main__":
+    _benchmark_script()
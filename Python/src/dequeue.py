@@ -8,12 +8,19 @@ Plan:
         (composite class) Dequeue
         (composite class) DoublyLinkedList
         (class) Node
+        (class) RingBuffer
         
-          Dequeue
+          Dequeue (backend="linkedlist")
             |
         DoublyLinkedList
             |
            head --> <--[prev][Node(value)][next]--> <--[prev][Node(value)][next]--> <--...--> <-- tail 
+
+          Dequeue (backend="ring_buffer")
+            |
+        RingBuffer
+            |
+        Python list (power-of-two capacity, grows and shrinks) 
     
     - Node class (data-only class)
         - contains a member to store a node value 
@@ -25,8 +32,15 @@ Plan:
         - contains a length member that keeps track of the current length of the linkedlist
         - read internal docs for API info
 
+    - RingBuffer class
+        - growable power-of-two circular buffer, one list slot per element instead of a three-field Node
+        - read internal docs for API info
+
     -Deueue class
-        -contains a DoublyLinkedList member used as the underlying data structure for the Dequeue
+        - contains a DoublyLinkedList (backend="linkedlist", default) or RingBuffer (backend="ring_buffer") member used as the
+          underlying data structure for the Dequeue, selected at construction
+        - operations at both ends are O(1) (amortized for the ring buffer), indexed access is O(1) with the ring buffer
+          and walks from the closest end with the linkedlist
 
         - Public Methods:
             1. enqueue(self, value: Any): Adds an element to the back of the queue
@@ -46,33 +60,49 @@ Plan:
 
             6. peek_back(self): Returns the value from the back of the queue without removing it, raises IndexError if empty
                 return: Any
+
+            7. extend(self, values: Iterable[Any]): Adds every value to the back of the queue
+                return: None
+
+            8. extendleft(self, values: Iterable[Any]): Adds every value to the front of the queue in turn (they end up in reverse order)
+                return: None
+
+            9. rotate(self, steps: int = 1): Rotates the queue steps places to the right (to the left if negative), as deque.rotate
+                return: None
     
-            7. is_empty(self): Returns True if the queue is empty, otherwise returns False
+            10. is_empty(self): Returns True if the queue is empty, otherwise returns False
                 return: bool
     
-            8. __len__(self): Dunder method to implement len(linkedlist obj) functionality
+            11. __len__(self): Dunder method to implement len(linkedlist obj) functionality
                 return: int
     
-            9. __iter__(self): Dunder method to make linkedlist objects iterable, e.g. allows object to be iterated over for-loops
+            12. __iter__(self): Dunder method to make linkedlist objects iterable, e.g. allows object to be iterated over for-loops
                 return: iterator
+
+            13. __getitem__(self, index: int): Dunder method to implement dequeue[index] (negative indices count from the end),
+                raises IndexError if out of range
+                return: Any
     
-            10. __repr__(self): Dunder method to implement repr(linkedlist obj) functionality
+            14. __repr__(self): Dunder method to implement repr(linkedlist obj) functionality
                 return: str
-    
-        - Internal Methods:
-            11. _validate_not_empty(self): Internal helper method used to validate if queue is currently non-empty
-                return: bool
 """
-from typing import Any
+from typing import Any, Iterable
 
-if __name__ == "__main__":
+if not __package__: # run as a script, or imported by a module run as a script
     from doubly_linked_list import DoublyLinkedList
+    from ring_buffer import RingBuffer
 else:
     from src.doubly_linked_list import DoublyLinkedList
+    from src.ring_buffer import RingBuffer
+
+_BACKENDS = ("linkedlist", "ring_buffer")
 
 class Dequeue:
-    def __init__(self):
-        self.list = DoublyLinkedList()
+    def __init__(self, backend: str = "linkedlist"):
+        if backend not in _BACKENDS:
+            raise ValueError(f"backend must be one of {_BACKENDS}.")
+        self.backend: str = backend
+        self.list: DoublyLinkedList | RingBuffer = DoublyLinkedList() if backend == "linkedlist" else RingBuffer()
     
     def enqueue(self, value: Any) -> None:
         """Adds an element to the back of the queue"""
@@ -86,37 +116,56 @@ class Dequeue:
 
     def dequeue(self) -> Any:
         """Removes and returns the value from the front of the queue, raises IndexError if empty"""
-        if not (self._validate_not_empty()):
+        if len(self.list) == 0:
             raise IndexError("Cannot dequeue from an empty queue.")
-        value : Any = self.list.get(0)
-        self.list.remove(0)
-        return value
+        return self.list.pop_first() # O(1) for both backends, no walk to the index
     
     def dequeue_back(self) -> Any:
         """Removes and returns the value from the back of the queue, raises IndexError if empty"""
-        if not (self._validate_not_empty()):
+        if len(self.list) == 0:
             raise IndexError("Cannot dequeue from an empty queue.")
-        value : Any = self.list.get(self.list.length-1)
-        self.list.remove(self.list.length-1)
-        return value
+        return self.list.pop()
 
     def peek(self) -> Any:
         """Returns the value from the front of the queue without removing it, raises IndexError if empty"""
-        if not (self._validate_not_empty()):
+        if len(self.list) == 0:
             raise IndexError("Cannot peek from an empty queue.")
-        value : Any = self.list.get(0)
-        return value
+        if self.backend == "ring_buffer":
+            return self.list.peek_first()
+        return self.list.head.value
     
     def peek_back(self) -> Any:
         """Returns the value from the back of the queue without removing it, raises IndexError if empty"""
-        if not (self._validate_not_empty()):
+        if len(self.list) == 0:
             raise IndexError("Cannot peek from an empty queue.")
-        value : Any = self.list.get(self.list.length-1)
-        return value
+        if self.backend == "ring_buffer":
+            return self.list.peek_last()
+        return self.list.tail.value
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Adds every value to the back of the queue"""
+        self.list.extend(values)
+        return None
+
+    def extendleft(self, values: Iterable[Any]) -> None:
+        """Adds every value to the front of the queue in turn, so they end up in reverse order (as deque.extendleft)"""
+        if self.backend == "ring_buffer":
+            self.list.extend_front(values)
+            return None
+        for value in values:
+            self.list.prepend(value)
+        return None
+
+    def rotate(self, steps: int = 1) -> None:
+        """Rotates the queue steps places to the right (to the left if negative), as deque.rotate.
+            The linkedlist backend only relinks its ends, after walking min(steps, length - steps) nodes
+        """
+        self.list.rotate(steps)
+        return None
 
     def is_empty(self) -> bool:
         """Returns True if the queue is empty, otherwise returns False"""
-        return self.list._is_empty()
+        return len(self.list) == 0
 
     def __len__(self) -> int:
         """Dunder method to implement len(obj) functionality"""
@@ -127,15 +176,22 @@ class Dequeue:
         Dunder method to make object iterable, e.g. allows object to be iterated over for-loops
         Note: Iteration implementation returns the element at the front of the queue first and iterates to the end of the queue
         """
+        if self.backend == "ring_buffer":
+            return iter(self.list)
         return (node.value for node in self.list) 
+
+    def __getitem__(self, index: int) -> Any:
+        """Dunder method to implement dequeue[index] (negative indices count from the end), raises IndexError if out of range.
+            O(1) with the ring buffer, the linkedlist walks from its closest end
+        """
+        if isinstance(index, slice):
+            raise TypeError("Dequeue indices must be integers.")
+        return self.list[index]
     
     def __repr__(self) -> str:
         """Dunder method to implement repr(obj) functionality"""
-        return f"class_name=Dequeue, id={id(self)}, length={len(self.list)}, front={self.list.get(0)}"
-
-    def _validate_not_empty(self) -> bool:
-        """Internal helper method used to validate if queue is currently non-empty"""
-        return not (self.list._is_empty()) # True -> not empty
+        front: Any = self.peek() if len(self.list) else None
+        return f"class_name=Dequeue, id={id(self)}, backend={self.backend}, length={len(self.list)}, front={front}"
 
 #--------------------------------------------------------
 def _functional_test_script_01():
@@ -158,7 +214,7 @@ def _functional_test_script_01():
     print("\n", repr(dequeue))
     print(f"Is dequeue empty: {dequeue.is_empty()}", "\n")
     
-    for _ in dequeue:
+    for _ in range(len(dequeue)):
         print(f"Attempting to dequeue value from the front: {dequeue.dequeue()}")
 
     print("test execution complete, cleaning up", "\n")
@@ -186,12 +242,68 @@ def _functional_test_script_02():
     print("\n", repr(dequeue))
     print(f"Is dequeue empty: {dequeue.is_empty()}", "\n")
     
-    for _ in dequeue:
+    for _ in range(len(dequeue)):
         print(f"Attempting to dequeue value from the back: {dequeue.dequeue_back()}")
 
     print("test execution complete, cleaning up", "\n")
     del dequeue
 
+def _benchmark_script(num_items: int = 200_000, num_rotations: int = 1_000):
+    """Bytes per element and ops/sec of both backends against collections.deque"""
+    from collections import deque
+    import random
+    import time
+    import tracemalloc
+
+    class DequeAdapter: # collections.deque under the Dequeue method names, for the same workload
+        def __init__(self):
+            self.deque = deque()
+            self.enqueue, self.enqueue_front = self.deque.append, self.deque.appendleft
+            self.dequeue, self.dequeue_back = self.deque.popleft, self.deque.pop
+            self.rotate = self.deque.rotate
+        def __getitem__(self, index: int) -> Any:
+            return self.deque[index]
+
+    builders = (
+        ("Dequeue (linkedlist)", Dequeue),
+        ("Dequeue (ring_buffer)", lambda: Dequeue(backend="ring_buffer")),
+        ("collections.deque", DequeAdapter),
+    )
+    print(f"Dequeue, {num_items} items (value=None for memory, payload excluded)")
+    print(f"{'':>22} {'bytes/element':>14} {'push/pop both ends':>19} {'random index':>13} {f'rotate x{num_rotations}':>13}")
+    for label, build in builders:
+        tracemalloc.start()
+        queue = build()
+        for _ in range(num_items):
+            queue.enqueue(None)
+        bytes_per_element: float = tracemalloc.get_traced_memory()[0] / num_items
+        tracemalloc.stop()
+        del queue
+
+        queue = build()
+        start = time.perf_counter()
+        for value in range(num_items // 2):
+            queue.enqueue(value)
+            queue.enqueue_front(value)
+        for _ in range(num_items // 2):
+            queue.dequeue()
+            queue.dequeue_back()
+        push_pop_rate: float = 2 * num_items / (time.perf_counter() - start)
+
+        for value in range(num_items):
+            queue.enqueue(value)
+        indices: list[int] = [random.randrange(num_items) for _ in range(1_000)]
+        start = time.perf_counter()
+        for index in indices:
+            queue[index]
+        index_rate: float = 1_000 / (time.perf_counter() - start)
+        start = time.perf_counter()
+        for steps in range(num_rotations):
+            queue.rotate(steps - num_rotations // 2)
+        rotate_rate: float = num_rotations / (time.perf_counter() - start)
+        print(f"{label:>22} {bytes_per_element:14.1f} {push_pop_rate / 1e6:13.2f} Mop/s {index_rate:9.0f} op/s {rotate_rate:8.0f} op/s")
+
 if __name__ == "__main__":
     _functional_test_script_01()
-    _functional_test_script_02()
\ No newline at end of file
+    _functional_test_script_02()
+    _benchmark_script()
\ No newline at end of file
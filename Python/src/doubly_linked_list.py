@@ -7,6 +7,7 @@ Plan:
     - Datamodel: 
         (class) DoublyLinkedList 
         (class) Node
+        (class) Cursor
         
         DoublyLinkedList
             |
@@ -16,11 +17,31 @@ Plan:
         - contains a member to store a node value 
         - contains a member to store a reference to the prev node
         - contains a member to store a reference to the next node
+        - declares __slots__, so nodes have no per-instance __dict__ (see _memory_benchmark_script for bytes per element)
     
     - DoublyLinkedList class
         - contains a head member that is either None or points to the first node in the linkedlist
         - contains a tail member that is either None or points to the last node in the linkedlist
         - contains a length member that keeps track of the current length of the linkedlist
+        - contains a version member that is incremented by every structural change (nodes linked/unlinked), iterators
+          compare it after every step and raise RuntimeError if the linkedlist was modified during iteration
+        - optionally (node_pool_size > 0) keeps up to node_pool_size removed nodes on a free-list chained through next,
+          new nodes are taken from the free-list before allocating. Removed nodes are reused, so only enable the pool when
+          callers do not hold on to nodes after removing them
+        - contains a positional cache (the last node located by _get_node and its index, valid until the next structural change),
+          _get_node starts walking from whichever of head, tail and the cached node is closest, so accessing neighbouring
+          indices one after another costs O(1) per access. insert/remove cache the node that ends up at the edited index
+        - optionally (indexed=True, disabled by default) keeps a secondary index, a multimap HashMap (container="set") from each value
+          (or index_key(value) if an index_key function is given) to the nodes holding it. contains/remove_value/move_to_front/move_to_back
+          then look the node up in O(1) instead of walking. Every mutation (append/insert/set/remove/extend/splice/cursor edits ...) keeps
+          the index consistent, values (or keys) must be HashMap keys (str, int, tuple). Looking up a value that is not a HashMap key
+          (e.g. 1.0) falls back to walking, so the index never changes the answer. slice/merge_sorted return non-indexed linkedlists
+
+    - Cursor class
+        - contains a reference to its DoublyLinkedList, the node under the cursor (None only if the linkedlist is empty) and its index
+        - move_next/move_prev/insert_before/insert_after/remove_here/set_value work on the held node in O(1)
+        - records the linkedlist's version after each of its own edits, a change made to the linkedlist other than through the cursor
+          makes its next call raise RuntimeError
 
         - Public Methods:
             1. append(self, value: Any): Creates and inserts a new node at the end of the linkedlist
@@ -47,55 +68,205 @@ Plan:
             8. set(self, index: int, value: Any): Updates the value at the specified index
                 return: None
     
-            9. find(self, value: Any): Returns the index of the first occurence of value, if not found returns -1
+            9. find(self, value: Any): Returns the index of the first occurence of value (single pass, stops at the first match), if not found returns -1
                 return: int
     
-            10. contains(self, value: Any): Returns True if the specified value is in the linkedlist, otherwise returns False
+            10. contains(self, value: Any): Returns True if the specified value is in the linkedlist, otherwise returns False (O(1) if indexed)
                 return: bool
+
+            11. remove_value(self, value: Any): Removes the first occurence of value, raises ValueError if not found (O(1) if indexed
+                and value is unique)
+                return: None
+
+            12. move_to_front(self, value: Any) / move_to_back(self, value: Any): Relinks the first node holding value at the beginning/end
+                of the linkedlist, raises ValueError if not found (O(1) if indexed and value is unique)
+                return: None
+
+            13. find_all(self, value: Any): Returns the indices of every occurence of value in a single pass
+                return: list[int]
+
+            14. count(self, value: Any): Returns the number of occurences of value
+                return: int
+
+            15. index(self, value: Any, start: int = 0, stop: int | None = None): Returns the index of the first occurence of value in [start, stop),
+                raises ValueError if not found
+                return: int
     
-            11. to_list(self, return_nodes: bool = False): Returns a Python list of the linkedlist node values (default) or nodes
+            16. to_list(self, return_nodes: bool = False, copy: str = "none"): Returns a Python list of the linkedlist node values (default) or nodes,
+                values are copied according to copy ("none", "shallow" or "deep")
                 return: list[Any]
     
-            12. __len__(self): Dunder method to implement len(linkedlist obj) functionality
+            17. extend(self, values: Iterable[Any]): Appends every value in one pass
+                return: None
+
+            18. concat(self, other: DoublyLinkedList): Moves every node of other to the end of this linkedlist in O(1), other is left empty
+                return: None
+
+            19. splice(self, other: DoublyLinkedList, index: int): Moves every node of other into this linkedlist at index (O(1) relinking
+                after the walk to index), other is left empty
+                return: None
+
+            20. slice(self, start: int | None = None, stop: int | None = None, step: int | None = None): Returns a new linkedlist
+                holding the values at [start:stop:step], walking the nodes once
+                return: DoublyLinkedList
+
+            21. remove_range(self, start: int, stop: int): Removes the nodes at [start:stop], walking the nodes once
+                return: None
+
+            22. reverse(self): Reverses the linkedlist in place by relinking the nodes
+                return: None
+
+            23. rotate(self, steps: int = 1): Rotates the values steps places to the right (to the left if negative), as deque.rotate.
+                Joins tail to head and cuts the ring before the new head, walking min(steps, length - steps) nodes from the closest end
+                return: None
+
+            24. sort(self, key: Callable | None = None, reverse: bool = False): Stable in-place bottom-up merge sort that relinks the nodes,
+                O(n log n) time and O(1) extra space
+                return: None
+
+            25. sorted_insert(self, value: Any, key: Callable | None = None, reverse: bool = False): Inserts value into a linkedlist
+                already sorted with the same key/reverse (after any equal values)
+                return: int (the index of the new value)
+
+            26. merge_sorted(cls, linkedlists: Iterable[DoublyLinkedList], key: Callable | None = None, reverse: bool = False): Classmethod, k-way merge
+                of sorted linkedlists through a heap, relinks their nodes into a new linkedlist and leaves them empty
+                return: DoublyLinkedList
+
+            27. cursor(self, index: int = 0): Returns a Cursor positioned on the node at index
+                return: Cursor
+
+            28. __len__(self): Dunder method to implement len(linkedlist obj) functionality
                 return: int
     
-            13. __iter__(self): Dunder method to make linkedlist objects iterable, e.g. allows object to be iterated over for-loops
+            29. __iter__(self): Dunder method to make linkedlist objects iterable, lazily yields the nodes from head to tail by walking next
+                return: iterator
+
+            30. __reversed__(self): Dunder method to implement reversed(linkedlist obj), lazily yields the nodes from tail to head by walking prev
                 return: iterator
     
-            14. __repr__(self): Dunder method to implement repr(linkedlist obj) functionality
+            31. __getitem__(self, index: int | slice): Dunder method to implement linkedlist[index] and linkedlist[start:stop:step]
+                return: Any or DoublyLinkedList
+
+            32. __repr__(self): Dunder method to implement repr(linkedlist obj) functionality
                 return: str
     
         - Internal Methods:
             
-            15. _get_node(self, index: int): Return the node specified at index
+            33. _get_node(self, index: int): Return the node specified at index, walking from the closest of head, tail and the cached node
                 return: Node
+
+            34. _set_cache(self, node: Node, index: int): Records node as the node at index for the current version
+                return: None
     
-            16. _validate_index(self, index: int, allow_last_index: bool = False): Returns True if the Node is in valid bounds, otherwise returns False
+            35. _validate_index(self, index: int, allow_last_index: bool = False): Returns True if the Node is in valid bounds, otherwise returns False
                 return: bool
     
-            17. _is_empty(self): Returns True if the linkedlist is empty, otherwise returns False
+            36. _is_empty(self): Returns True if the linkedlist is empty, otherwise returns False
+                return: bool
+
+            37. _unlink_node(self, node: Node): Removes a node known to be in this linkedlist in O(1), without walking from head/tail
+                return: Node
+
+            38. _link_node_first(self, node: Node): Inserts an existing (unlinked) node at the beginning of the linkedlist in O(1)
+                return: None
+
+            39. _link_node_last(self, node: Node): Inserts an existing (unlinked) node at the end of the linkedlist in O(1)
+                return: None
+
+            40. _link_node_after(self, prev_node: Node, node: Node): Inserts an existing (unlinked) node right after prev_node in O(1)
+                return: None
+
+            41. _new_node(self, value: Any): Returns a node holding value, recycled from the free-list when one is available
+                return: Node
+
+            42. _release_node(self, node: Node): Drops the references held by a removed node and keeps it on the free-list if the pool is not full
+                return: None
+
+            43. _link_chain(self, prev_node: Node | None, first_node: Node, last_node: Node, count: int): Links a chain of count
+                nodes right after prev_node (at the beginning if prev_node is None) in O(1)
+                return: None
+
+            44. _index_add(self, node: Node) / _index_discard(self, node: Node): Adds/removes node under the key of its value in the index
+                return: None
+
+            45. _index_replace(self, node: Node, value: Any): Sets the value of an indexed node and moves it to the key of the new value
+                return: None
+
+            46. _find_value_node(self, value: Any): Returns the first node holding value (through the index if indexed), or None
+                return: Node | None
+
+    - Cursor Methods:
+            1. value: Property, the value of the node under the cursor
+                return: Any
+
+            2. move_next(self) / move_prev(self): Moves to the next/previous node, returns False (and stays put) at the end of the linkedlist
                 return: bool
+
+            3. insert_before(self, value: Any) / insert_after(self, value: Any): Inserts value next to the node under the cursor,
+                the cursor stays on its node
+                return: None
+
+            4. remove_here(self): Removes the node under the cursor and returns its value, the cursor moves to the next node
+                (or the previous node if the last node was removed)
+                return: Any
+
+            5. set_value(self, value: Any): Updates the value of the node under the cursor
+                return: None
 """
 
-from typing import Any
-import copy
+from typing import Any, Callable, Iterable, Iterator
+from copy import copy as shallow_copy, deepcopy
+import heapq
+
+if not __package__: # run as a script, or imported by a module run as a script
+    from hashmap import HashMap
+else:
+    from src.hashmap import HashMap
+
+_COPY_MODES = ("none", "shallow", "deep")
 
 class Node:
+    __slots__ = ("value", "prev", "next")
+
     def __init__(self, value: Any):
         self.value = value
         self.prev = None
         self.next = None
 
 
+def _identity(value: Any) -> Any:
+    return value
+
+def _walk_nodes(node: Node | None) -> Iterator[Node]:
+    """Yields the nodes of a chain, reading each node's next before yielding it so the caller may relink the yielded node"""
+    while node is not None:
+        next_node = node.next
+        yield node
+        node = next_node
+
+
 class DoublyLinkedList:
-    def __init__(self):
+    def __init__(self, node_pool_size: int = 0, indexed: bool = False, index_key: Callable[[Any], Any] | None = None):
+        if (type(node_pool_size) is not int) or (node_pool_size < 0):
+            raise ValueError("node_pool_size must be a non-negative int.")
+        if (index_key is not None) and (not indexed):
+            raise ValueError("index_key requires indexed=True.")
         self.head = None
         self.tail = None
         self.length = 0
+        self._version = 0
+        self.node_pool_size = node_pool_size
+        self._free_head = None # free-list of removed nodes, chained through next
+        self._free_count = 0
+        self._cache_node = None # last node located by _get_node, valid while _cache_version == _version
+        self._cache_index = -1
+        self._cache_version = -1
+        self._index = HashMap(multimap=True, container="set") if indexed else None # key -> set of nodes holding it
+        self._index_key: Callable[[Any], Any] = _identity if index_key is None else index_key
 
     def append(self, value: Any) -> None:
         """Creates and inserts a new node at the end of the linkedlist"""
-        new_node = Node(value)
+        new_node = self._new_node(value)
 
         if (self._is_empty()):
             self.head = self.tail = new_node
@@ -105,11 +276,12 @@ class DoublyLinkedList:
             self.tail = new_node
         
         self.length += 1
+        self._version += 1
         return
 
     def prepend(self, value: Any) -> None:
         """Creates and inserts a new node at the beginning of the linkedlist"""
-        new_node = Node(value)
+        new_node = self._new_node(value)
 
         if (self._is_empty()):
             self.head = self.tail = new_node
@@ -119,6 +291,7 @@ class DoublyLinkedList:
             self.head = new_node
         
         self.length += 1
+        self._version += 1
         return
         
     def insert(self, index: int, value: Any) -> None:
@@ -131,13 +304,15 @@ class DoublyLinkedList:
         elif(index == self.length):
             self.append(value)
         else:
-            new_node = Node(value)
+            new_node = self._new_node(value)
             prev_node = self._get_node(index-1)
             new_node.prev = prev_node
             new_node.next = prev_node.next
             prev_node.next = new_node
             new_node.next.prev = new_node
-            self.length += 1 
+            self.length += 1
+            self._version += 1
+            self._set_cache(new_node, index)
         return
 
     def remove(self, index: int) -> None: 
@@ -158,6 +333,7 @@ class DoublyLinkedList:
             next_node = node_to_delete.next
             prev_node.next = next_node
             next_node.prev = prev_node
+            cached_node = next_node # the node that moves into index
         else:
             node_to_delete = self.tail
             self.tail = self.tail.prev
@@ -165,8 +341,11 @@ class DoublyLinkedList:
                 self.tail.next = None
             else:
                 self.head = None
-        del node_to_delete
+        self._release_node(node_to_delete)
         self.length -= 1
+        self._version += 1
+        if (0 < index < self.length):
+            self._set_cache(cached_node, index)
         return
 
     def pop(self) -> Any | None:
@@ -199,38 +378,390 @@ class DoublyLinkedList:
             raise IndexError("Error, invalid index specified")
         
         retrieved_node = self._get_node(index)
-        retrieved_node.value = value
+        if self._index is not None:
+            self._index_replace(retrieved_node, value)
+        else:
+            retrieved_node.value = value
         return
 
     def find(self, value: Any) -> int:
         """Returns the index of the first occurence of value, if not found returns -1"""
-        try:
-            return self.to_list().index(value)
-        except ValueError:
-            return -1
+        for idx, node in enumerate(self):
+            if (node.value is value) or (node.value == value):
+                return idx
+        return -1
 
     def contains(self, value: Any) -> bool:
-        """Returns true if the specified value is in the linkedlist, otherwise returns False"""
-        return (value in self.to_list()) 
+        """Returns True if the specified value is in the linkedlist, otherwise returns False. O(1) if the linkedlist is indexed"""
+        if self._index is not None:
+            return self._find_value_node(value) is not None
+        return (self.find(value) > -1)
+
+    def remove_value(self, value: Any) -> None:
+        """Removes the first occurence of value (as list.remove), raises ValueError if not found.
+            O(1) if the linkedlist is indexed and value is unique, otherwise walks to the first occurence
+        """
+        node = self._find_value_node(value)
+        if node is None:
+            raise ValueError(f"{value!r} is not in linkedlist")
+        self._unlink_node(node)
+        self._release_node(node)
+        return
 
-    def to_list(self, return_nodes: bool = False) -> list[Any]:
-        """Returns a Python list of the linkedlist node values"""
-        return_list : list[Any] = []
+    def move_to_front(self, value: Any) -> None:
+        """Relinks the first node holding value at the beginning of the linkedlist, raises ValueError if not found.
+            O(1) if the linkedlist is indexed and value is unique
+        """
+        node = self._find_value_node(value)
+        if node is None:
+            raise ValueError(f"{value!r} is not in linkedlist")
+        if node is not self.head:
+            self._link_node_first(self._unlink_node(node))
+        return
 
-        for i in range(self.length):
-            if (return_nodes):
-                return_list.append(copy.deepcopy(self._get_node(index=i)))
+    def move_to_back(self, value: Any) -> None:
+        """Relinks the first node holding value at the end of the linkedlist, raises ValueError if not found.
+            O(1) if the linkedlist is indexed and value is unique
+        """
+        node = self._find_value_node(value)
+        if node is None:
+            raise ValueError(f"{value!r} is not in linkedlist")
+        if node is not self.tail:
+            self._link_node_last(self._unlink_node(node))
+        return
+
+    def find_all(self, value: Any) -> list[int]:
+        """Returns the indices of every occurence of value in a single pass"""
+        return [idx for idx, node in enumerate(self) if (node.value is value) or (node.value == value)]
+
+    def count(self, value: Any) -> int:
+        """Returns the number of occurences of value"""
+        return sum(1 for node in self if (node.value is value) or (node.value == value))
+
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        """Returns the index of the first occurence of value in [start, stop) (negative bounds count from the end, as list.index),
+            raises ValueError if not found
+        """
+        start, stop, _ = slice(start, stop).indices(self.length)
+        node = self._get_node(start)
+        for idx in range(start, stop):
+            if (node.value is value) or (node.value == value):
+                return idx
+            node = node.next
+        raise ValueError(f"{value!r} is not in linkedlist")
+
+    def to_list(self, return_nodes: bool = False, copy: str = "none") -> list[Any]:
+        """Returns a Python list of the linkedlist node values, copy selects how values are copied: "none" (default), "shallow" or "deep".
+            return_nodes returns the linkedlist's own nodes instead (only with copy="none", copying a node would copy every node after it)
+        """
+        if copy not in _COPY_MODES:
+            raise ValueError(f"copy must be one of {_COPY_MODES}.")
+        if return_nodes:
+            if copy != "none":
+                raise ValueError("return_nodes only supports copy=\"none\".")
+            return list(self)
+        if copy == "shallow":
+            return [shallow_copy(node.value) for node in self]
+        elif copy == "deep":
+            return [deepcopy(node.value) for node in self]
+        return [node.value for node in self]
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Appends every value in one pass, the new nodes are linked only after the whole iterable has been consumed"""
+        first_node = last_node = None
+        count: int = 0
+        try:
+            for value in values:
+                node = self._new_node(value)
+                if last_node is None:
+                    first_node = node
+                else:
+                    last_node.next = node
+                    node.prev = last_node
+                last_node = node
+                count += 1
+        except BaseException:
+            if self._index is not None: # nothing was linked, drop the chain's nodes from the index again
+                for node in _walk_nodes(first_node):
+                    self._index_discard(node)
+            raise
+        if first_node is not None:
+            self._link_chain(self.tail, first_node, last_node, count)
+        return
+
+    def concat(self, other: "DoublyLinkedList") -> None:
+        """Moves every node of other to the end of this linkedlist in O(1), other is left empty"""
+        self.splice(other, self.length)
+        return
+
+    def splice(self, other: "DoublyLinkedList", index: int) -> None:
+        """Moves every node of other into this linkedlist at the specified index (0 <= index <= length), other is left empty.
+            Relinking is O(1), locating index is a _get_node walk
+        """
+        if type(other) is not type(self):
+            raise TypeError("Can only splice a DoublyLinkedList.")
+        if other is self:
+            raise ValueError("Cannot splice a linkedlist into itself.")
+        if (not self._validate_index(index)) and (index != self.length):
+            raise IndexError("Invalid index")
+        if other._is_empty():
+            return
+        if self._index is not None:
+            indexed_nodes: list[Node] = []
+            try:
+                for node in other:
+                    self._index_add(node)
+                    indexed_nodes.append(node)
+            except BaseException:
+                for node in indexed_nodes:
+                    self._index_discard(node)
+                raise
+        if other._index is not None:
+            other._index.clear()
+        first_node, last_node, count = other.head, other.tail, other.length
+        other.head = other.tail = None
+        other.length = 0
+        other._version += 1
+        self._link_chain(None if index == 0 else self._get_node(index-1), first_node, last_node, count)
+        return
+
+    def slice(self, start: int | None = None, stop: int | None = None, step: int | None = None) -> "DoublyLinkedList":
+        """Returns a new linkedlist holding the values at [start:stop:step] (list slice semantics), walking the nodes once"""
+        indices: range = range(*slice(start, stop, step).indices(self.length))
+        sliced = DoublyLinkedList()
+        if not indices:
+            return sliced
+        low: int = min(indices[0], indices[-1])
+        high: int = max(indices[0], indices[-1])
+        stride: int = abs(indices.step)
+        node = self._get_node(low)
+        values: list[Any] = []
+        for offset in range(high - low + 1):
+            if offset % stride == 0:
+                values.append(node.value)
+            node = node.next
+        if indices.step < 0:
+            values.reverse()
+        sliced.extend(values)
+        return sliced
+
+    def remove_range(self, start: int, stop: int) -> None:
+        """Removes the nodes at [start:stop] (list slice semantics, negative indices count from the end), walking the nodes once"""
+        start, stop, _ = slice(start, stop).indices(self.length)
+        if start >= stop:
+            return
+        prev_node = None if start == 0 else self._get_node(start-1)
+        node = self.head if prev_node is None else prev_node.next
+        for _ in range(stop - start):
+            next_node = node.next
+            self._release_node(node)
+            node = next_node
+        if prev_node is None:
+            self.head = node
+        else:
+            prev_node.next = node
+        if node is None:
+            self.tail = prev_node
+        else:
+            node.prev = prev_node
+        self.length -= stop - start
+        self._version += 1
+        return
+
+    def reverse(self) -> None:
+        """Reverses the linkedlist in place by relinking the nodes"""
+        node = self.head
+        while node is not None:
+            node.prev, node.next = node.next, node.prev
+            node = node.prev
+        self.head, self.tail = self.tail, self.head
+        self._version += 1
+        return
+
+    def rotate(self, steps: int = 1) -> None:
+        """Rotates the values steps places to the right (to the left if negative), as deque.rotate.
+            Only the ends are relinked, after walking min(steps, length - steps) nodes to the new head from the closest end
+        """
+        if self.length < 2:
+            return
+        steps %= self.length
+        if steps == 0:
+            return
+        if steps <= self.length >> 1:
+            new_head = self.tail
+            for _ in range(steps - 1):
+                new_head = new_head.prev
+        else:
+            new_head = self.head
+            for _ in range(self.length - steps):
+                new_head = new_head.next
+        self.tail.next = self.head
+        self.head.prev = self.tail
+        self.tail = new_head.prev
+        self.tail.next = new_head.prev = None
+        self.head = new_head
+        self._version += 1
+        return
+
+    def sort(self, key: Callable[[Any], Any] | None = None, reverse: bool = False) -> None:
+        """Stable in-place bottom-up merge sort that relinks the nodes, O(n log n) time and O(1) extra space.
+            key is called during comparisons (keys are not cached, to keep the extra space O(1)).
+            As list.sort, reverse=True sorts in descending order and keeps equal values in their original order
+        """
+        if self.length < 2:
+            return
+        key_fn: Callable[[Any], Any] = _identity if key is None else key
+        head = self.head
+        width: int = 1
+        while True:
+            merged_head = merged_tail = None
+            left = head
+            num_merges: int = 0
+            while left is not None:
+                num_merges += 1
+                # split off a run of width nodes (left) followed by up to width nodes (right)
+                right = left
+                left_size: int = 0
+                while (left_size < width) and (right is not None):
+                    left_size += 1
+                    right = right.next
+                right_size: int = width
+                while (left_size > 0) or ((right_size > 0) and (right is not None)):
+                    if left_size == 0:
+                        take_left = False
+                    elif (right_size == 0) or (right is None):
+                        take_left = True
+                    elif reverse:
+                        take_left = not (key_fn(left.value) < key_fn(right.value))
+                    else:
+                        take_left = not (key_fn(right.value) < key_fn(left.value))
+                    if take_left:
+                        node = left
+                        left = left.next
+                        left_size -= 1
+                    else:
+                        node = right
+                        right = right.next
+                        right_size -= 1
+                    if merged_tail is None:
+                        merged_head = node
+                    else:
+                        merged_tail.next = node
+                    merged_tail = node
+                left = right
+            merged_tail.next = None
+            head = merged_head
+            if num_merges <= 1:
+                break
+            width *= 2
+        self.head = head
+        self.tail = merged_tail
+        prev_node = None
+        node = head
+        while node is not None:
+            node.prev = prev_node
+            prev_node = node
+            node = node.next
+        self._version += 1
+        return
+
+    def sorted_insert(self, value: Any, key: Callable[[Any], Any] | None = None, reverse: bool = False) -> int:
+        """Inserts value into a linkedlist already sorted with the same key/reverse, after any equal values, returns its index"""
+        key_fn: Callable[[Any], Any] = _identity if key is None else key
+        value_key: Any = key_fn(value)
+        prev_node = None
+        node = self.head
+        index: int = 0
+        while node is not None:
+            node_key: Any = key_fn(node.value)
+            if (node_key < value_key) if reverse else (value_key < node_key):
+                break
+            prev_node = node
+            node = node.next
+            index += 1
+        new_node = self._new_node(value)
+        self._link_chain(prev_node, new_node, new_node, 1)
+        return index
+
+    @classmethod
+    def merge_sorted(cls, linkedlists: Iterable["DoublyLinkedList"], key: Callable[[Any], Any] | None = None, reverse: bool = False) -> "DoublyLinkedList":
+        """k-way merge of linkedlists that are each sorted with the same key/reverse, using a heap (heapq.merge, O(n log k)).
+            The nodes are relinked into the returned linkedlist and the input linkedlists are left empty.
+            The merge is stable, equal values keep the order of the input linkedlists
+        """
+        linkedlists = list(linkedlists)
+        if any(type(linkedlist) is not cls for linkedlist in linkedlists):
+            raise TypeError("Can only merge DoublyLinkedList objects.")
+        if len({id(linkedlist) for linkedlist in linkedlists}) != len(linkedlists):
+            raise ValueError("Cannot merge a linkedlist with itself.")
+        key_fn: Callable[[Any], Any] = _identity if key is None else key
+        chains: list[Iterator[Node]] = []
+        count: int = 0
+        for linkedlist in linkedlists:
+            chains.append(_walk_nodes(linkedlist.head))
+            count += linkedlist.length
+            linkedlist.head = linkedlist.tail = None
+            linkedlist.length = 0
+            linkedlist._version += 1
+            if linkedlist._index is not None:
+                linkedlist._index.clear()
+
+        merged = cls()
+        last_node = None
+        for node in heapq.merge(*chains, key=lambda node: key_fn(node.value), reverse=reverse):
+            if last_node is None:
+                merged.head = node
             else:
-                return_list.append(copy.deepcopy(self._get_node(index=i).value))
-        return return_list
+                last_node.next = node
+            node.prev = last_node
+            last_node = node
+        if last_node is not None:
+            last_node.next = None
+            merged.tail = last_node
+        merged.length = count
+        return merged
+
+    def cursor(self, index: int = 0) -> "Cursor":
+        """Returns a Cursor positioned on the node at index (on nothing if the linkedlist is empty)"""
+        if (not self._validate_index(index)) and not (index == 0 and self._is_empty()):
+            raise IndexError("Error, invalid index specified")
+        return Cursor(self, self._get_node(index), index)
 
     def __len__(self) -> int:
         """Dunder method to implement len(linkedlist obj) functionality"""
         return self.length
 
-    def __iter__(self):
-        """Dunder method to make linkedlist objects iterable, e.g. allows object to be iterated over for-loops"""
-        return iter(self.to_list(return_nodes=True))
+    def __iter__(self) -> Iterator[Node]:
+        """Dunder method to make linkedlist objects iterable, lazily yields the nodes from head to tail"""
+        version: int = self._version
+        node = self.head
+        while node is not None:
+            yield node
+            if self._version != version:
+                raise RuntimeError("DoublyLinkedList changed size during iteration")
+            node = node.next
+
+    def __reversed__(self) -> Iterator[Node]:
+        """Dunder method to implement reversed(linkedlist obj), lazily yields the nodes from tail to head"""
+        version: int = self._version
+        node = self.tail
+        while node is not None:
+            yield node
+            if self._version != version:
+                raise RuntimeError("DoublyLinkedList changed size during iteration")
+            node = node.prev
+
+    def __getitem__(self, index: "int | slice") -> Any:
+        """Dunder method to implement linkedlist[index] (negative indices count from the end, raises IndexError if out of range)
+            and linkedlist[start:stop:step] (returns a new linkedlist, see slice)
+        """
+        if isinstance(index, slice):
+            return self.slice(index.start, index.stop, index.step)
+        if index < 0:
+            index += self.length
+        if (not self._validate_index(index)):
+            raise IndexError("DoublyLinkedList index out of range")
+        return self._get_node(index).value
 
     def __repr__(self) -> str:
         """Dunder method to implement repr(linkedlist obj) functionality"""
@@ -241,16 +772,34 @@ class DoublyLinkedList:
         if (not self._validate_index(index)):
             return None
         
-        if index < (self.length // 2):
+        # start from whichever of head, tail and the last located node is closest
+        distance_from_tail: int = self.length - index - 1
+        if (self._cache_version == self._version) and (abs(index - self._cache_index) < min(index, distance_from_tail)):
+            retrieved_node = self._cache_node
+            if index > self._cache_index:
+                for _ in range(index - self._cache_index):
+                    retrieved_node = retrieved_node.next
+            else:
+                for _ in range(self._cache_index - index):
+                    retrieved_node = retrieved_node.prev
+        elif index < (self.length // 2):
             retrieved_node = self.head 
             for _ in range(index):
                 retrieved_node = retrieved_node.next
         else:
             retrieved_node = self.tail 
-            for _ in range( (self.length - index - 1) ):
+            for _ in range(distance_from_tail):
                 retrieved_node = retrieved_node.prev
+        self._set_cache(retrieved_node, index)
         return retrieved_node
 
+    def _set_cache(self, node: Node, index: int) -> None:
+        """Records node as the node at index for the current version, later _get_node calls may start walking from it"""
+        self._cache_node = node
+        self._cache_index = index
+        self._cache_version = self._version
+        return
+
     def _validate_index(self, index: int, allow_last_index = False) -> bool:
         """Returns True if the Node is in valid bounds, otherwise returns False"""
         upper_constraint = self.length
@@ -273,4 +822,477 @@ class DoublyLinkedList:
             if (self.length > 0):
                 return False
             else:
-                raise ValueError("Error, either head or tail is not None but length is less than or equal to zero")
\ No newline at end of file
+                raise ValueError("Error, either head or tail is not None but length is less than or equal to zero")
+
+    def _unlink_node(self, node: Node) -> Node:
+        """Removes a node known to be in this linkedlist in O(1), without walking from head/tail"""
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+        self.length -= 1
+        self._version += 1
+        return node
+
+    def _link_node_first(self, node: Node) -> None:
+        """Inserts an existing (unlinked) node at the beginning of the linkedlist in O(1)"""
+        if (self._is_empty()):
+            self.head = self.tail = node
+        else:
+            node.next = self.head
+            self.head.prev = node
+            self.head = node
+        self.length += 1
+        self._version += 1
+        return
+
+    def _link_node_last(self, node: Node) -> None:
+        """Inserts an existing (unlinked) node at the end of the linkedlist in O(1)"""
+        if (self._is_empty()):
+            self.head = self.tail = node
+        else:
+            node.prev = self.tail
+            self.tail.next = node
+            self.tail = node
+        self.length += 1
+        self._version += 1
+        return
+
+    def _link_node_after(self, prev_node: Node, node: Node) -> None:
+        """Inserts an existing (unlinked) node right after prev_node in O(1)"""
+        if prev_node is self.tail:
+            self._link_node_last(node)
+            return
+        node.prev = prev_node
+        node.next = prev_node.next
+        prev_node.next.prev = node
+        prev_node.next = node
+        self.length += 1
+        self._version += 1
+        return
+
+    def _new_node(self, value: Any) -> Node:
+        """Returns a node holding value, recycled from the free-list when one is available"""
+        node = self._free_head
+        if node is None:
+            node = Node(value)
+        else:
+            self._free_head = node.next
+            self._free_count -= 1
+            node.value = value
+            node.next = None
+        if self._index is not None:
+            self._index_add(node)
+        return node
+
+    def _release_node(self, node: Node) -> None:
+        """Drops the references held by a removed node (and its index entry) and keeps it on the free-list if the pool is not full"""
+        if self._index is not None:
+            self._index_discard(node)
+        node.value = None
+        node.prev = None
+        if self._free_count < self.node_pool_size:
+            node.next = self._free_head
+            self._free_head = node
+            self._free_count += 1
+        else:
+            node.next = None
+        return
+
+    def _link_chain(self, prev_node: Node | None, first_node: Node, last_node: Node, count: int) -> None:
+        """Links a chain of count nodes (first_node ... last_node, already linked through next/prev) right after prev_node
+            (at the beginning if prev_node is None) in O(1)
+        """
+        next_node = self.head if prev_node is None else prev_node.next
+        first_node.prev = prev_node
+        last_node.next = next_node
+        if prev_node is None:
+            self.head = first_node
+        else:
+            prev_node.next = first_node
+        if next_node is None:
+            self.tail = last_node
+        else:
+            next_node.prev = last_node
+        self.length += count
+        self._version += 1
+        return
+
+    def _index_add(self, node: Node) -> None:
+        """Adds node to the index under the key of its value, raises TypeError if the key is not a HashMap key"""
+        self._index.add(self._index_key(node.value), node)
+        return
+
+    def _index_discard(self, node: Node) -> None:
+        """Removes node from the index entry of the key of its value"""
+        self._index.delete(self._index_key(node.value), node)
+        return
+
+    def _index_replace(self, node: Node, value: Any) -> None:
+        """Sets the value of an indexed node, moving it to the key of the new value (the index is unchanged if adding the new key fails)"""
+        old_key: Any = self._index_key(node.value)
+        new_key: Any = self._index_key(value)
+        if new_key != old_key:
+            self._index.add(new_key, node)
+            self._index.delete(old_key, node)
+        node.value = value
+        return
+
+    def _find_value_node(self, value: Any) -> Node | None:
+        """Returns the first node holding value, or None. Indexed linkedlists look the key up in O(1),
+            only walking (to the first of the nodes) when several nodes share the key. A value whose key is not a HashMap key
+            (e.g. 1.0, which still equals an indexed 1) is searched by walking, exactly as in a non-indexed linkedlist
+        """
+        if self._index is not None:
+            try:
+                nodes: set[Node] | None = self._index.get(self._index_key(value))
+            except TypeError:
+                nodes = None
+            else:
+                if not nodes:
+                    return None
+                if len(nodes) == 1:
+                    return next(iter(nodes))
+                for node in self:
+                    if node in nodes:
+                        return node
+                return None
+        for node in self:
+            if (node.value is value) or (node.value == value):
+                return node
+        return None
+
+class Cursor:
+    """Holds a live reference to a node of a DoublyLinkedList, so moving and editing around it is O(1).
+        Changes made to the linkedlist other than through this cursor invalidate it (RuntimeError on the next call).
+    """
+    __slots__ = ("linkedlist", "node", "index", "_version")
+
+    def __init__(self, linkedlist: DoublyLinkedList, node: Node | None, index: int):
+        self.linkedlist = linkedlist
+        self.node = node
+        self.index = index
+        self._version = linkedlist._version
+
+    @property
+    def value(self) -> Any:
+        """The value of the node under the cursor"""
+        self._check()
+        if self.node is None:
+            raise IndexError("Cursor of an empty linkedlist has no value.")
+        return self.node.value
+
+    def move_next(self) -> bool:
+        """Moves to the next node, returns False (and stays put) if the cursor is on the last node"""
+        self._check()
+        if (self.node is None) or (self.node.next is None):
+            return False
+        self.node = self.node.next
+        self.index += 1
+        return True
+
+    def move_prev(self) -> bool:
+        """Moves to the previous node, returns False (and stays put) if the cursor is on the first node"""
+        self._check()
+        if (self.node is None) or (self.node.prev is None):
+            return False
+        self.node = self.node.prev
+        self.index -= 1
+        return True
+
+    def insert_before(self, value: Any) -> None:
+        """Inserts value right before the node under the cursor, the cursor stays on its node (on the new node if the list was empty)"""
+        self._check()
+        linkedlist = self.linkedlist
+        new_node = linkedlist._new_node(value)
+        if self.node is None:
+            linkedlist._link_node_last(new_node)
+            self.node = new_node
+        elif self.node.prev is None:
+            linkedlist._link_node_first(new_node)
+            self.index += 1
+        else:
+            linkedlist._link_node_after(self.node.prev, new_node)
+            self.index += 1
+        self._version = linkedlist._version
+        return
+
+    def insert_after(self, value: Any) -> None:
+        """Inserts value right after the node under the cursor, the cursor stays on its node (on the new node if the list was empty)"""
+        self._check()
+        linkedlist = self.linkedlist
+        new_node = linkedlist._new_node(value)
+        if self.node is None:
+            linkedlist._link_node_last(new_node)
+            self.node = new_node
+        else:
+            linkedlist._link_node_after(self.node, new_node)
+        self._version = linkedlist._version
+        return
+
+    def remove_here(self) -> Any:
+        """Removes the node under the cursor and returns its value. The cursor moves to the next node,
+            or to the previous node if the removed node was the last one
+        """
+        self._check()
+        if self.node is None:
+            raise IndexError("Cannot remove from an empty linkedlist.")
+        linkedlist = self.linkedlist
+        node = self.node
+        value: Any = node.value
+        if node.next is not None:
+            self.node = node.next
+        else:
+            self.node = node.prev
+            self.index -= 1
+        linkedlist._unlink_node(node)
+        linkedlist._release_node(node)
+        if self.node is None:
+            self.index = 0
+        self._version = linkedlist._version
+        return value
+
+    def set_value(self, value: Any) -> None:
+        """Updates the value of the node under the cursor"""
+        self._check()
+        if self.node is None:
+            raise IndexError("Cursor of an empty linkedlist has no value.")
+        if self.linkedlist._index is not None:
+            self.linkedlist._index_replace(self.node, value)
+        else:
+            self.node.value = value
+        return
+
+    def __repr__(self) -> str:
+        """Dunder method to implement repr(obj) functionality"""
+        return f"class_name=Cursor, id={id(self)}, index={self.index}, node={self.node}"
+
+    def _check(self) -> None:
+        """Raises RuntimeError if the linkedlist was changed other than through this cursor"""
+        if self._version != self.linkedlist._version:
+            raise RuntimeError("DoublyLinkedList changed outside of the cursor")
+
+#--------------------------------------------------------
+def _memory_benchmark_script(num_elements: int = 200_000):
+    """Reports the bytes per element (payload excluded) of a DoublyLinkedList, compared with an unslotted node and the builtin containers"""
+    from collections import deque
+    import tracemalloc
+
+    class DictNode: # the node layout before __slots__, for comparison
+        def __init__(self, value: Any):
+            self.value = value
+            self.prev = None
+            self.next = None
+    def bytes_per_element(build) -> float:
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        container = build()
+        used = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+        del container
+        return used / num_elements
+
+    def build_unslotted():
+        head = node = DictNode(None)
+        for _ in range(num_elements - 1):
+            node.next = DictNode(None)
+            node = node.next
+        return head
+
+    def build_linkedlist():
+        linkedlist = DoublyLinkedList()
+        for _ in range(num_elements):
+            linkedlist.append(None)
+        return linkedlist
+
+    def recycled_bytes_per_element() -> float:
+        # after filling and emptying a pooled linkedlist every node comes from the free-list, so the rebuild allocates no new nodes
+        linkedlist = DoublyLinkedList(node_pool_size=num_elements)
+        for _ in range(num_elements):
+            linkedlist.append(None)
+        for _ in range(num_elements):
+            linkedlist.remove(0)
+        tracemalloc.start()
+        for _ in range(num_elements):
+            linkedlist.append(None)
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return used / num_elements
+
+    print(f"elements: {num_elements} (value=None, payload excluded)")
+    for label, build in (
+        ("unslotted node (__dict__)", build_unslotted),
+        ("DoublyLinkedList (__slots__)", build_linkedlist),
+        ("list", lambda: [None for _ in range(num_elements)]),
+        ("collections.deque", lambda: deque(None for _ in range(num_elements))),
+    ):
+        print(f"{label:>36}: {bytes_per_element(build):6.1f} bytes/element")
+    print(f"{'DoublyLinkedList (rebuild from pool)':>36}: {recycled_bytes_per_element():6.1f} new bytes/element")
+
+def _cursor_benchmark_script(num_elements: int = 20_000):
+    """Times a front-to-back pass that reads every value and removes every other node, by index vs with a cursor"""
+    import time
+
+    linkedlist = DoublyLinkedList()
+    for i in range(num_elements):
+        linkedlist.append(i)
+    start = time.perf_counter()
+    index = 0
+    while index < len(linkedlist):
+        linkedlist.get(index)
+        if linkedlist.get(index) % 2:
+            linkedlist.remove(index)
+        else:
+            index += 1
+    print(f"{'index based (cached _get_node)':>32}: {time.perf_counter() - start:8.3f} s")
+
+    linkedlist = DoublyLinkedList()
+    for i in range(num_elements):
+        linkedlist.append(i)
+    start = time.perf_counter()
+    cursor = linkedlist.cursor()
+    while True:
+        if cursor.value % 2:
+            cursor.remove_here()
+            if cursor.node.value % 2 == 0 and not cursor.move_next():
+                break
+        elif not cursor.move_next():
+            break
+    print(f"{'cursor':>32}: {time.perf_counter() - start:8.3f} s")
+
+def _bulk_benchmark_script(num_elements: int = 20_000, chunk: int = 1_000):
+    """Times the bulk operations against their element-wise equivalents"""
+    import time
+
+    def build(size: int) -> DoublyLinkedList:
+        linkedlist = DoublyLinkedList()
+        linkedlist.extend(range(size))
+        return linkedlist
+
+    def timed(operation) -> float:
+        start = time.perf_counter()
+        operation()
+        return time.perf_counter() - start
+
+    middle: int = num_elements // 2
+    results: list[tuple[str, float, float]] = []
+
+    def append_loop():
+        linkedlist = DoublyLinkedList()
+        for value in range(num_elements):
+            linkedlist.append(value)
+    results.append((f"extend({num_elements})", timed(lambda: DoublyLinkedList().extend(range(num_elements))), timed(append_loop)))
+
+    linkedlist, other = build(num_elements), build(chunk)
+    concat_seconds = timed(lambda: linkedlist.concat(other))
+    linkedlist, other = build(num_elements), build(chunk)
+    def concat_loop():
+        while len(other):
+            linkedlist.append(other.get(0))
+            other.remove(0)
+    results.append((f"concat({chunk})", concat_seconds, timed(concat_loop)))
+
+    linkedlist, other = build(num_elements), build(chunk)
+    splice_seconds = timed(lambda: linkedlist.splice(other, middle))
+    linkedlist, other = build(num_elements), build(chunk)
+    def insert_loop():
+        for offset, value in enumerate(other.to_list()):
+            linkedlist.insert(middle + offset, value)
+    results.append((f"splice({chunk}, middle)", splice_seconds, timed(insert_loop)))
+
+    linkedlist = build(num_elements)
+    results.append((f"slice({chunk} at middle)", timed(lambda: linkedlist.slice(middle, middle + chunk)),
+                    timed(lambda: [linkedlist.get(index) for index in range(middle, middle + chunk)])))
+
+    linkedlist = build(num_elements)
+    remove_range_seconds = timed(lambda: linkedlist.remove_range(middle, middle + chunk))
+    linkedlist = build(num_elements)
+    def remove_loop():
+        for _ in range(chunk):
+            linkedlist.remove(middle)
+    results.append((f"remove_range({chunk} at middle)", remove_range_seconds, timed(remove_loop)))
+
+    linkedlist = build(num_elements)
+    def prepend_copy():
+        reversed_list = DoublyLinkedList()
+        for node in linkedlist:
+            reversed_list.prepend(node.value)
+    results.append((f"reverse({num_elements})", timed(linkedlist.reverse), timed(prepend_copy)))
+
+    print(f"DoublyLinkedList, {num_elements} elements")
+    print(f"{'operation':>28} {'bulk (s)':>10} {'element-wise (s)':>17}")
+    for label, bulk_seconds, loop_seconds in results:
+        print(f"{label:>28} {bulk_seconds:10.4f} {loop_seconds:17.4f}")
+
+def _sort_benchmark_script(num_elements: int = 100_000, num_lists: int = 8):
+    """Times the in-place merge sort against copying out, sorting and rebuilding, and merge_sorted against concat + sort"""
+    import random
+    import time
+
+    values = [random.random() for _ in range(num_elements)]
+    linkedlist = DoublyLinkedList()
+    linkedlist.extend(values)
+    start = time.perf_counter()
+    linkedlist.sort()
+    sort_seconds = time.perf_counter() - start
+
+    linkedlist = DoublyLinkedList()
+    linkedlist.extend(values)
+    start = time.perf_counter()
+    rebuilt = DoublyLinkedList()
+    rebuilt.extend(sorted(linkedlist.to_list(copy="deep")))
+    rebuild_seconds = time.perf_counter() - start
+
+    chunks = [sorted(values[idx::num_lists]) for idx in range(num_lists)]
+    linkedlists = [DoublyLinkedList() for _ in chunks]
+    for chunk, chunk_list in zip(chunks, linkedlists):
+        chunk_list.extend(chunk)
+    start = time.perf_counter()
+    DoublyLinkedList.merge_sorted(linkedlists)
+    merge_seconds = time.perf_counter() - start
+
+    for chunk, chunk_list in zip(chunks, linkedlists):
+        chunk_list.extend(chunk)
+    start = time.perf_counter()
+    for chunk_list in linkedlists[1:]:
+        linkedlists[0].concat(chunk_list)
+    linkedlists[0].sort()
+    concat_sort_seconds = time.perf_counter() - start
+
+    print(f"DoublyLinkedList, {num_elements} elements")
+    print(f"{'in-place merge sort':>36}: {sort_seconds:8.3f} s")
+    print(f"{'to_list(copy=deep) + sorted + extend':>36}: {rebuild_seconds:8.3f} s (O(n) extra space)")
+    print(f"{f'merge_sorted of {num_lists} sorted lists':>36}: {merge_seconds:8.3f} s")
+    print(f"{f'concat of {num_lists} sorted lists + sort':>36}: {concat_sort_seconds:8.3f} s")
+
+def _index_benchmark_script(num_elements: int = 20_000, num_operations: int = 2_000):
+    """Times contains/move_to_front/remove_value on random values with and without the value index"""
+    import random
+    import time
+
+    targets = random.sample(range(num_elements), num_operations)
+    print(f"DoublyLinkedList, {num_elements} elements, {num_operations} operations each")
+    for indexed in (False, True):
+        linkedlist = DoublyLinkedList(indexed=indexed)
+        start = time.perf_counter()
+        linkedlist.extend(range(num_elements))
+        extend_seconds = time.perf_counter() - start
+        timings: list[str] = [f"extend {extend_seconds:7.3f} s"]
+        for operation in (linkedlist.contains, linkedlist.move_to_front, linkedlist.remove_value):
+            start = time.perf_counter()
+            for value in targets:
+                operation(value)
+            timings.append(f"{operation.__name__} {time.perf_counter() - start:7.3f} s")
+        print(f"{'indexed' if indexed else 'not indexed':>12}: " + ", ".join(timings))
+
+if __name__ == "__main__":
+    _memory_benchmark_script()
+    _cursor_benchmark_script()
+    _bulk_benchmark_script()
+    _sort_benchmark_script()
+    _index_benchmark_script()
@@ -5,129 +5,742 @@ The goal is to create an implementation for a HashMap data structure from 'scrat
 
 Plan:
     - List datatype used as the container for implementing the hashmap
-        - data elements will be stored in an internal list of k-v pairs (tuples)
-        - e.g., hashmap = [ [(k1,v1), (k1, v2), ...(k1, vn)], [(k2,v1), (k2, v2), ...(k2, vn)],... ]
-    - Hash function will be taking the ASCII sum for the characters in the key and mod'ing it with the size of the list
+        - data elements will be stored in an internal list of k-v pairs (tuples), one entry per key
+        - e.g., hashmap = [ [(k1,v1,h1), (k3,v3,h3)], None, [(k2,v2,h2)],... ]
+    - Hash function is pluggable (hash_function constructor argument), the resulting hash code is mod'ed with the size of the list
+        - builtin_hash (default): Python's hash() passed through a 64-bit avalanche mixer so that every bit of the bucket index depends on the whole key
+        - fnv1a_hash: deterministic 64-bit FNV-1a over a type-tagged byte encoding of the key (stable across processes/runs, unlike hash() for str)
+        - ascii_sum_hash: the original ASCII sum of the characters in the key (kept for comparison, anagrams collide)
+    - Each k-v pair is stored as a (key, value, hash_code) tuple so the hash code is computed once per key:
+        lookups compare the cached hash code before the key, and rehashing reuses it instead of re-hashing the key
     - Collisions will be handled with chaining (easy method since python's default mutable collection object is a list)
+    - Two modes, selected at construction:
+        - single-value (default): add overwrites the value of an existing key
+        - multimap (multimap=True): each key owns a single value container, add adds the value to it and get returns the container itself
+            - container="list": values in insertion order (duplicates allowed)
+            - container="set": distinct, hashable values, delete(key, value) is O(1)
+            - container="bag": collections.Counter of hashable values to their number of occurrences, delete(key, value) is O(1)
+    - The bucket list is resized based on a configurable load factor (see Resizing below)
     - Will create a wrapper class with associated methods for implementing hash functionality
+    - HashMap is a collections.abc.MutableMapping: the mapping protocol (hashmap[key], key in hashmap, len(hashmap), for key in hashmap,
+      keys/values/items views, pop/popitem/setdefault/update/==) works alongside the add/get/delete API
+        - hashmap[key] returns the same value as get (multimap mode: the container) but raises KeyError if missing
+        - hashmap[key] = value overwrites the value (multimap mode: replaces the container with one holding only value)
+        - del hashmap[key] removes the key (multimap mode: with its whole container)
+        - len(hashmap) is the number of keys, maintained as a counter
 
     - Public Methods:
-        - add(self, key: ImmutableType, value: Any): Adds the k-v tuple, appends to the list of k-v tuples if entries already exist.
+        - add(self, key: ImmutableType, value: Any): Adds the k-v pair, overwrites the value of an existing key (multimap mode: adds the value to the key's container).
             return: None
 
-        - get(self, key: ImmutableType): Returns the value for the key if it exists, else returns None.
-            return: Value(Type: Any) or None(*if key is not found)
+        - get(self, key: ImmutableType, default(*optional)): Returns the value (multimap mode: the container) for the key if it exists, else returns default (None).
+            return: Value(Type: Any) or default(*if key is not found)
 
         - delete(self, key: ImmutableType, value(*optional)): Removes the key-value pair associated with the key passed into the function.
             If an argument for the optional value param is passed then the deletion only occurs if the value passed in matches the value of a k-v pair.
+            In multimap mode the optional value is removed from the key's container, the key itself is removed once its container is empty.
             Raises KeyError if the key isn't found. 
             return: None(*raises KeyError if key is not found)
 
+        - add_many(self, kv_pairs: Iterable[tuple[ImmutableType, Any]]): Bulk version of add, presizes the bucket list for the whole input,
+            hashes/validates every pair in one pass before writing (nothing is added if any pair is invalid) and writes grouped by bucket.
+            return: None
+
+        - get_many(self, keys: Iterable[ImmutableType]): Bulk version of get, returns the results in the same order as keys.
+            return: list[Any | None]
+
+        - delete_many(self, keys: Iterable[ImmutableType]): Bulk version of delete (without target_value), a missing key raises KeyError
+            after restoring the keys already deleted by the call (all or nothing).
+            return: None(*raises KeyError if a key is not found)
+
+        - from_pairs(cls, kv_pairs, **kwargs): Class method, builds a presized HashMap from an iterable of k-v pairs via add_many.
+            return: HashMap
+
         -print_kv_pairs(): Prints all k-v pairs currently in the hashmap.
             return: None
 
+        -bucket_stats(): Returns bucket distribution statistics (chain lengths, empty buckets, load factor) for verifying a hash function against a key set.
+            return: dict[str, Any]
+
+        - keys(self) / values(self) / items(self): Lazy views, iterating them walks the buckets with a generator (no intermediate lists).
+            return: KeysView / ValuesView / ItemsView
+
+        - clear(self): Removes every k-v pair and resets the bucket list to its initial size.
+            return: None
+
+        - __getitem__ / __setitem__ / __delitem__ / __contains__ / __len__ / __iter__ / __repr__: Dunder methods for the mapping protocol.
+            Iterating while keys are added or removed raises RuntimeError.
+
+    - Resizing:
+        - HashMap(size: int = 10, load_factor: float = 0.75, min_load_factor: float | None = None, rehash_step: int = 4, hash_function = builtin_hash,
+                  multimap: bool = False, container: str = "list")
+        - The hashmap tracks its entry (key) count and grows (doubles) its bucket list once count/size exceeds load_factor
+        - If min_load_factor is set, the bucket list shrinks (halves, never below the initial size) once count/size drops below it
+        - Rehashing is incremental: a resize allocates the new bucket list and every subsequent add/get/delete migrates
+          rehash_step buckets from the old list, so no single call pays for a full rebuild
+        - While a rehash is in progress, a key lives in the old bucket list if its old bucket has not been migrated yet,
+          otherwise in the new bucket list
+
     - Internal Methods:
-        - _hashify(self, key): Performs the hashing on the key and returns the hashed value. 
+        - _iter_items(self): Generator walking the buckets and yielding (key, value) pairs.
+            return: iterator
+
+        - _lookup(self, key, default(*optional)): Read-only part of get, never advances an in-flight rehash.
+            return: Any
+
+        - _add_to_bucket(self, buckets, hash_key, key, value, hash_code): Overwrites/adds to the key's entry in the bucket, or appends a new entry.
+            return: None
+
+        - _find_in_bucket(self, kv_pairs, key, hash_code): Returns the index of the key's entry within the bucket, or -1.
+            return: int
+
+        - _restore_entries(self, removed): Puts entries popped by an aborted delete_many back into their buckets.
+            return: None
+
+        - _new_container / _add_to_container / _remove_from_container: Multimap value container helpers.
+
+        - _hash_code(self, key): Validates the key type and returns the full (un-mod'ed) hash code from the hash function.
+            return: int
+
+        - _hashify(self, key, size(*optional)): Performs the hashing on the key and returns the hashed value (bucket index). 
             return: Hash-key(Type: int)
+
+        - _get_bucket_location(self, hash_code): Returns the bucket list and bucket index currently holding the key.
+            return: tuple[list, int]
+
+        - _start_resize(self, new_size): Allocates a new bucket list and begins an incremental rehash into it.
+            return: None
+
+        - _rehash_step(self, num_buckets(*optional)): Migrates up to num_buckets buckets from the old bucket list into the new one.
+            return: None
+
+        - _maybe_resize(self): Starts a grow or shrink rehash if the load factor bounds have been crossed.
+            return: None
+
+        - _presize(self, num_new_entries): Grows the bucket list up front (one full rehash) so num_new_entries more entries stay under load_factor.
+            return: None
 """
-from typing import Union, Any
+from typing import Union, Any, Callable, Iterable, Iterator
+from collections import Counter
+from collections.abc import MutableMapping, ValuesView, ItemsView
+import gc
+import itertools
+import random
+import time
 
 ImmutableType = Union[str, int, tuple]
 
-class HashMap():
+_CONTAINER_TYPES: dict[str, type] = {"list": list, "set": set, "bag": Counter} # multimap value containers
+
+_MISSING = object() # sentinel default for get, distinguishes "not found" from a stored value
+
+_MASK_64: int = (1 << 64) - 1
+_FNV_OFFSET_BASIS_64: int = 0xcbf29ce484222325
+_FNV_PRIME_64: int = 0x100000001b3
+
+def _mix64(value: int) -> int:
+    """64-bit avalanche finalizer (MurmurHash3 fmix64), every output bit depends on every input bit"""
+    value &= _MASK_64
+    value ^= value >> 33
+    value = (value * 0xff51afd7ed558ccd) & _MASK_64
+    value ^= value >> 33
+    value = (value * 0xc4ceb9fe1a85ec53) & _MASK_64
+    value ^= value >> 33
+    return value
+
+def _key_to_bytes(key: ImmutableType) -> bytes:
+    """Type-tagged, length-prefixed byte encoding of a key, e.g. "1", 1 and ("1",) all encode differently"""
+    if isinstance(key, str):
+        encoded: bytes = key.encode("utf-8")
+        return b"s" + len(encoded).to_bytes(4, "little") + encoded
+    elif isinstance(key, int):
+        encoded = key.to_bytes((key.bit_length() + 8) // 8, "little", signed=True)
+        return b"i" + len(encoded).to_bytes(4, "little") + encoded
+    elif isinstance(key, tuple):
+        return b"t" + len(key).to_bytes(4, "little") + b"".join(_key_to_bytes(item) for item in key)
+    else:
+        raise TypeError(f"HashMap keys must be str, int or tuple, not {type(key).__name__}.")
+
+def builtin_hash(key: ImmutableType) -> int:
+    """Default hash function: Python's hash() run through a 64-bit mixer (hash() of an int is the int itself)"""
+    return _mix64(hash(key))
+
+def fnv1a_hash(key: ImmutableType) -> int:
+    """Deterministic 64-bit FNV-1a hash, stable across processes and runs (str hash() is randomized per process)"""
+    hash_code: int = _FNV_OFFSET_BASIS_64
+    for byte in _key_to_bytes(key):
+        hash_code = ((hash_code ^ byte) * _FNV_PRIME_64) & _MASK_64
+    return _mix64(hash_code)
+
+def ascii_sum_hash(key: ImmutableType) -> int:
+    """The original hash function: sum of the character ordinals of the key (nested tuples are summed recursively)"""
+    if isinstance(key, int):
+        return key
+    elif isinstance(key, str):
+        return sum([ord(char) for char in key])
+    elif isinstance(key, tuple):
+        return sum([ascii_sum_hash(item) for item in key])
+    else:
+        raise TypeError(f"HashMap keys must be str, int or tuple, not {type(key).__name__}.")
+
+class _HashMapValuesView(ValuesView):
+    def __iter__(self):
+        for _, value in self._mapping._iter_items():
+            yield value
 
-    def __init__(self, size: int = 10):
-        self._size:int = size
-        self._hashmap: list = [None for _ in range(self._size)] 
+class _HashMapItemsView(ItemsView):
+    def __iter__(self):
+        yield from self._mapping._iter_items()
+
+class HashMap(MutableMapping):
+
+    def __init__(self, size: int = 10, load_factor: float = 0.75, min_load_factor: float | None = None, rehash_step: int = 4, 
+                 hash_function: Callable[[ImmutableType], int] = builtin_hash, multimap: bool = False, container: str = "list"):
+        if (type(size) is not int) or (type(rehash_step) is not int):
+            raise TypeError("size and rehash_step for the HashMap object must be specified as int.")
+        if not callable(hash_function):
+            raise TypeError("hash_function for the HashMap object must be callable.")
+        if (size < 1) or (rehash_step < 1):
+            raise ValueError("size and rehash_step for HashMap must be greater than 0.")
+        if (load_factor <= 0):
+            raise ValueError("load_factor for HashMap must be greater than 0.")
+        if (min_load_factor is not None) and not (0 < min_load_factor < (load_factor / 2)):
+            raise ValueError("min_load_factor for HashMap must be greater than 0 and less than half of load_factor.")
+        if container not in _CONTAINER_TYPES:
+            raise ValueError(f"container for HashMap must be one of {tuple(_CONTAINER_TYPES)}.")
+        self._size: int = size
+        self._initial_size: int = size
+        self._hashmap: list = [None] * self._size
+        self._count: int = 0 # number of keys, each key owns exactly one entry
+        self._version: int = 0 # bumped whenever keys are added/removed or a rehash starts, used to fail fast during iteration
+        self._load_factor: float = load_factor
+        self._min_load_factor: float | None = min_load_factor
+        self._rehash_step_size: int = rehash_step
+        self._hash_function: Callable[[ImmutableType], int] = hash_function
+        self._multimap: bool = multimap
+        self._container: str = container
+        self._old_hashmap: list | None = None # bucket list being migrated away from during an incremental rehash
+        self._old_size: int = 0
+        self._rehash_idx: int = 0 # buckets of the old bucket list below this index have already been migrated
     
-    def _hashify(self, key: ImmutableType) -> int: 
+    def _hash_code(self, key: ImmutableType) -> int:
         if not isinstance(key, (str, int, tuple)):
             raise TypeError
-        return (self._hashify_helper_to_ascii(key) % self._size)
-        
-    def _hashify_helper_to_ascii(self, value: ImmutableType) -> int:
-        if isinstance(value, int):
-            return ord(chr(value))
-        elif isinstance(value, str):
-            return sum([ord(char) for char in value])
-        elif isinstance(value, tuple):
-            intermediate_result = []
-
-            for item in value:
-                if isinstance(item, tuple):
-                    intermediate_result.extend(self._hashify_helper_to_ascii(value=item))
-                else:
-                    intermediate_result.append(self._hashify_helper_to_ascii(value=item))
-            return sum(intermediate_result)
-        else:
-            raise TypeError     
+        return self._hash_function(key)
+
+    def _hashify(self, key: ImmutableType, size: int | None = None) -> int: 
+        if size is None:
+            size = self._size
+        return (self._hash_code(key) % size)
     
     def add(self, key: ImmutableType, value: Any) -> None:
-        """Adds the k-v tuple, appends to the list of k-v tuples (chaining) if entries already exist for a particular key."""
-        hash_key: int = self._hashify(key=key)
-        
-        if not value: 
+        """Adds the k-v pair. In single-value mode an existing value for the key is overwritten, 
+            in multimap mode the value is added to the key's value container.
+        """
+        if value is None: # None is what get returns for a missing key
             raise ValueError
         
-        if self._hashmap[hash_key]:
-            self._hashmap[hash_key].append((key,value))
-        else:
-            self._hashmap[hash_key] = [(key,value)]
-
+        self._rehash_step_if_needed()
+        hash_code: int = self._hash_code(key)
+        buckets, hash_key = self._get_bucket_location(hash_code=hash_code)
+        self._add_to_bucket(buckets=buckets, hash_key=hash_key, key=key, value=value, hash_code=hash_code)
+        self._maybe_resize()
         return None
 
-    def get(self, key: ImmutableType) -> Any | None:
-        """Returns the value for the key if it exists, else returns None."""
-        target_hash_key: int = self._hashify(key=key)
-        kv_pairs: Any | None = self._hashmap[target_hash_key] 
-        
-        if kv_pairs:
-            if len(kv_pairs)==1:
-                return kv_pairs[0][1]
-            values = []    
-            for kv in kv_pairs:
-                values.append(kv[1])
-            return values
-        else:
-            return None
+    def get(self, key: ImmutableType, default: Any | None = None) -> Any | None:
+        """Returns the value (multimap mode: the value container) for the key if it exists, else returns default (None)."""
+        self._rehash_step_if_needed()
+        return self._lookup(key=key, default=default)
     
     def delete(self, key: ImmutableType, target_value: Any | None = None) -> None:
         """Removes the key-value pair associated with the key passed into the function.
             If an argument for the optional target_value parameter is passed into the function, then deletion only occurs if the target_value passed in matches the value of a k-v pair.
-            If multiple values are chained to a single key, the target_value parameter is required for a deletion to occur.
+            In multimap mode target_value removes a single value from the key's container (the key is removed once its container is empty),
+            without target_value the key and its whole container are removed.
             This function raises a KeyError if the key is not found in the hashmap. 
         """
-        target_hash_key: int = self._hashify(key=key)
-        kv_pairs: Any | None = self._hashmap[target_hash_key] 
-        target_kv_pair = (key, target_value)
+        self._rehash_step_if_needed()
+        hash_code: int = self._hash_code(key)
+        buckets, target_hash_key = self._get_bucket_location(hash_code=hash_code)
+        kv_pairs: Any | None = buckets[target_hash_key] 
+        idx: int = self._find_in_bucket(kv_pairs, key, hash_code)
+
+        if idx == -1:
+            raise KeyError(key)
+        
+        if target_value is not None:
+            value: Any = kv_pairs[idx][1]
+            if not self._multimap:
+                if value != target_value:
+                    return None
+            elif not self._remove_from_container(container=value, value=target_value) or value:
+                return None # value not in the container, or the container still holds other values
         
+        kv_pairs.pop(idx)
         if not kv_pairs:
-            raise KeyError
+            buckets[target_hash_key] = None
+        self._count -= 1
+        self._version += 1
+        self._maybe_resize()
+        return None
+
+    def add_many(self, kv_pairs: Iterable[tuple[ImmutableType, Any]]) -> None:
+        """Bulk version of add. Presizes the bucket list for the whole input, hashes and validates every pair in one pass
+            (nothing is added if any pair is invalid), then writes the entries grouped by bucket.
+        """
+        hash_function: Callable[[ImmutableType], int] = self._hash_function
+        entries: list[tuple[ImmutableType, Any, int]] = []
+        for key, value in kv_pairs:
+            if not isinstance(key, (str, int, tuple)):
+                raise TypeError
+            if value is None:
+                raise ValueError
+            entries.append((key, value, hash_function(key)))
+        if not entries:
+            return None
+
+        self._presize(num_new_entries=len(entries))
+        if self._old_hashmap is not None:
+            self._rehash_step(num_buckets=self._old_size)
         
-        if len(kv_pairs)==1:
-            if not target_value:
-                self._hashmap[target_hash_key] = None
+        size: int = self._size
+        buckets: list = self._hashmap
+        entries.sort(key=lambda kv: kv[2] % size) # stable, so later values for a key are still applied last
+        
+        idx: int = 0
+        while idx < len(entries):
+            hash_key: int = entries[idx][2] % size
+            end: int = idx + 1
+            while (end < len(entries)) and (entries[end][2] % size == hash_key):
+                end += 1
+            for key, value, hash_code in entries[idx:end]:
+                self._add_to_bucket(buckets=buckets, hash_key=hash_key, key=key, value=value, hash_code=hash_code)
+            idx = end
+        return None
+
+    def get_many(self, keys: Iterable[ImmutableType]) -> list[Any | None]:
+        """Bulk version of get, returns the results in the same order as keys."""
+        keys = list(keys)
+        self._rehash_step(num_buckets=self._rehash_step_size * len(keys))
+        hash_function: Callable[[ImmutableType], int] = self._hash_function
+        results: list[Any | None] = []
+
+        for key in keys:
+            if not isinstance(key, (str, int, tuple)):
+                raise TypeError
+            hash_code: int = hash_function(key)
+            if self._old_hashmap is None:
+                kv_pairs = self._hashmap[hash_code % self._size]
             else:
-                if kv_pairs[0][1] != target_value:
-                    pass
-                else:
-                    kv_pairs = None
-        else:
-            if not target_value:
-                pass
+                buckets, hash_key = self._get_bucket_location(hash_code=hash_code)
+                kv_pairs = buckets[hash_key]
+            
+            value: Any | None = None
+            if kv_pairs:
+                for kv in kv_pairs:
+                    if kv[2] == hash_code and kv[0] == key:
+                        value = kv[1]
+                        break
+            results.append(value)
+        return results
+
+    def delete_many(self, keys: Iterable[ImmutableType]) -> None:
+        """Bulk version of delete (without target_value). Keys are deleted in a single pass,
+            if a key is missing the keys already deleted are restored before the KeyError is raised.
+        """
+        keys = list(keys)
+        self._rehash_step(num_buckets=self._rehash_step_size * len(keys))
+        hash_function: Callable[[ImmutableType], int] = self._hash_function
+        removed: list[tuple[list, int, tuple]] = []
+
+        for key in keys:
+            if not isinstance(key, (str, int, tuple)):
+                self._restore_entries(removed)
+                raise TypeError
+            hash_code: int = hash_function(key)
+            if self._old_hashmap is None:
+                buckets, hash_key = self._hashmap, hash_code % self._size
             else:
-                if target_kv_pair in kv_pairs:
-                    kv_pairs.pop(kv_pairs.index(target_kv_pair))
+                buckets, hash_key = self._get_bucket_location(hash_code=hash_code)
+            kv_pairs: list | None = buckets[hash_key]
+            idx: int = self._find_in_bucket(kv_pairs, key, hash_code)
+            if idx == -1:
+                if any(kv[2] == hash_code and kv[0] == key for _, _, kv in removed):
+                    continue # key repeated in keys and already deleted
+                self._restore_entries(removed)
+                raise KeyError(key)
+            removed.append((buckets, hash_key, kv_pairs.pop(idx)))
+            if not kv_pairs:
+                buckets[hash_key] = None
+
+        self._count -= len(removed)
+        self._version += 1
+        self._maybe_resize()
         return None
+
+    @classmethod
+    def from_pairs(cls, kv_pairs: Iterable[tuple[ImmutableType, Any]], **kwargs) -> "HashMap":
+        """Builds a presized HashMap from an iterable of k-v pairs, kwargs are passed through to the constructor."""
+        hashmap = cls(**kwargs)
+        hashmap.add_many(kv_pairs)
+        return hashmap
         
     def print_kv_pairs(self) -> None:
+        for key, value in self._iter_items():
+            if self._multimap:
+                print(f"k: {key}, v: ", end="")
+                print(*(value.elements() if self._container == "bag" else value), sep=", ")
+            else:
+                print(f"k: {key}, v: {value}")
+        return None
+
+    def bucket_stats(self) -> dict[str, Any]:
+        """Returns bucket distribution statistics (chain lengths, empty buckets, load factor) for verifying a hash function against a key set."""
+        chain_length_histogram: dict[int, int] = {}
+        num_buckets: int = 0
+        for buckets in (self._old_hashmap, self._hashmap):
+            if buckets is None:
+                continue
+            num_buckets += len(buckets)
+            for kv_pairs in buckets:
+                chain_length: int = len(kv_pairs) if kv_pairs else 0
+                chain_length_histogram[chain_length] = chain_length_histogram.get(chain_length, 0) + 1
+
+        if self._old_hashmap is not None:
+            # migrated buckets of the old bucket list are always empty and would skew the empty bucket count
+            num_buckets -= self._rehash_idx
+            chain_length_histogram[0] -= self._rehash_idx
+
+        empty_buckets: int = chain_length_histogram.get(0, 0)
+        non_empty_buckets: int = num_buckets - empty_buckets
+        return {
+            "num_buckets": num_buckets,
+            "num_entries": self._count,
+            "load_factor": self._count / num_buckets,
+            "empty_buckets": empty_buckets,
+            "max_chain_length": max(chain_length_histogram),
+            "mean_chain_length": (self._count / non_empty_buckets) if non_empty_buckets else 0.0,
+            "chain_length_histogram": dict(sorted(chain_length_histogram.items())),
+        }
+
+    def values(self) -> ValuesView:
+        """Lazy view of the values, iterating it walks the buckets directly instead of looking every key up again"""
+        return _HashMapValuesView(self)
+
+    def items(self) -> ItemsView:
+        """Lazy view of the (key, value) pairs, iterating it walks the buckets directly"""
+        return _HashMapItemsView(self)
+
+    def clear(self) -> None:
+        """Removes every k-v pair and resets the bucket list to its initial size"""
+        self._size = self._initial_size
+        self._hashmap = [None] * self._size
+        self._old_hashmap = None
+        self._old_size = 0
+        self._rehash_idx = 0
+        self._count = 0
+        self._version += 1
+        return None
+
+    def __getitem__(self, key: ImmutableType) -> Any:
+        """Dunder method to implement hashmap[key], returns the same value as get but raises KeyError if the key is not found"""
+        value: Any = self.get(key, default=_MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: ImmutableType, value: Any) -> None:
+        """Dunder method to implement hashmap[key] = value, in multimap mode the key's container is replaced by one holding only value"""
+        if value is None:
+            raise ValueError
+        
+        self._rehash_step_if_needed()
+        hash_code: int = self._hash_code(key)
+        buckets, hash_key = self._get_bucket_location(hash_code=hash_code)
+        idx: int = self._find_in_bucket(buckets[hash_key], key, hash_code)
+        
+        if idx == -1:
+            self._add_to_bucket(buckets=buckets, hash_key=hash_key, key=key, value=value, hash_code=hash_code)
+            self._maybe_resize()
+        else:
+            stored_value: Any = self._new_container(value) if self._multimap else value
+            buckets[hash_key][idx] = (key,stored_value,hash_code)
+        return None
+
+    def __delitem__(self, key: ImmutableType) -> None:
+        """Dunder method to implement del hashmap[key], removes the key (multimap mode: with its whole container)"""
+        self.delete(key)
+        return None
+
+    def __contains__(self, key: object) -> bool:
+        """Dunder method to implement key in hashmap"""
+        if not isinstance(key, (str, int, tuple)):
+            return False
+        hash_code: int = self._hash_function(key)
+        buckets, hash_key = self._get_bucket_location(hash_code=hash_code)
+        return self._find_in_bucket(buckets[hash_key], key, hash_code) != -1
+
+    def __len__(self) -> int:
+        """Dunder method to implement len(obj) functionality, returns the number of keys"""
+        return self._count
+
+    def __iter__(self) -> Iterator[ImmutableType]:
+        """Dunder method to make object iterable, yields each key once"""
+        for key, _ in self._iter_items():
+            yield key
+
+    def __repr__(self) -> str:
+        """Dunder method to implement repr(obj) functionality"""
+        return f"class_name=HashMap, id={id(self)}, length={self._count}, buckets={self._size}, multimap={self._multimap}"
+
+    def _iter_items(self) -> Iterator[tuple[ImmutableType, Any]]:
+        """Generator walking the buckets and yielding (key, value) pairs"""
+        if self._old_hashmap is not None:
+            # finish the in-flight rehash so entries can't migrate from an unvisited bucket into a visited one mid-iteration
+            self._rehash_step(num_buckets=self._old_size)
+        version: int = self._version
+        
         for kv_pairs in self._hashmap:
+            if not kv_pairs:
+                continue
+            for kv in kv_pairs:
+                yield kv[0], kv[1]
+                if self._version != version:
+                    raise RuntimeError("HashMap changed size during iteration")
+
+    def _lookup(self, key: ImmutableType, default: Any | None = None) -> Any | None:
+        """Read-only part of get: never advances an in-flight rehash, so it does not modify the hashmap"""
+        hash_code: int = self._hash_code(key)
+        buckets, target_hash_key = self._get_bucket_location(hash_code=hash_code)
+        kv_pairs: Any | None = buckets[target_hash_key] 
+        
+        if kv_pairs:
+            for kv in kv_pairs:
+                if kv[2] == hash_code and kv[0] == key:
+                    return kv[1]
+        return default
+
+    def _add_to_bucket(self, buckets: list, hash_key: int, key: ImmutableType, value: Any, hash_code: int) -> None:
+        """Overwrites the key's value (multimap mode: adds to its container) or appends a new entry for the key"""
+        kv_pairs: list | None = buckets[hash_key]
+        idx: int = self._find_in_bucket(kv_pairs, key, hash_code)
+
+        if idx != -1:
+            if self._multimap:
+                self._add_to_container(container=kv_pairs[idx][1], value=value)
+            else:
+                kv_pairs[idx] = (key,value,hash_code)
+            return None
+        
+        stored_value: Any = self._new_container(value) if self._multimap else value
+        if kv_pairs:
+            kv_pairs.append((key,stored_value,hash_code))
+        else:
+            buckets[hash_key] = [(key,stored_value,hash_code)]
+        self._count += 1
+        self._version += 1
+        return None
+
+    def _restore_entries(self, removed: list[tuple[list, int, tuple]]) -> None:
+        """Puts entries popped by an aborted delete_many back into their buckets"""
+        for buckets, hash_key, kv in reversed(removed):
+            if buckets[hash_key]:
+                buckets[hash_key].append(kv)
+            else:
+                buckets[hash_key] = [kv]
+        return None
+
+    def _find_in_bucket(self, kv_pairs: list | None, key: ImmutableType, hash_code: int) -> int:
+        """Returns the index of the key's entry within the bucket, or -1 if the key is not in the bucket"""
+        if kv_pairs:
+            for idx, kv in enumerate(kv_pairs):
+                if kv[2] == hash_code and kv[0] == key:
+                    return idx
+        return -1
+
+    def _new_container(self, value: Any) -> list | set | Counter:
+        """Creates a multimap value container holding value"""
+        container: list | set | Counter = _CONTAINER_TYPES[self._container]()
+        self._add_to_container(container=container, value=value)
+        return container
+
+    def _add_to_container(self, container: list | set | Counter, value: Any) -> None:
+        """Adds value to a multimap value container"""
+        if self._container == "list":
+            container.append(value)
+        elif self._container == "set":
+            container.add(value)
+        else:
+            container[value] += 1
+        return None
+
+    def _remove_from_container(self, container: list | set | Counter, value: Any) -> bool:
+        """Removes one occurrence of value from a multimap value container, returns False if value was not in the container"""
+        if self._container == "list":
+            if value not in container:
+                return False
+            container.remove(value)
+        elif self._container == "set":
+            if value not in container:
+                return False
+            container.discard(value)
+        else:
+            if container[value] < 1:
+                return False
+            container[value] -= 1
+            if container[value] == 0:
+                del container[value]
+        return True
+
+    def _get_bucket_location(self, hash_code: int) -> tuple[list, int]:
+        """Returns the bucket list and bucket index currently holding the key with the given hash code"""
+        if self._old_hashmap is not None:
+            old_hash_key: int = hash_code % self._old_size
+            if old_hash_key >= self._rehash_idx:
+                return self._old_hashmap, old_hash_key
+        return self._hashmap, hash_code % self._size
+
+    def _start_resize(self, new_size: int) -> None:
+        """Allocates a new bucket list and begins an incremental rehash into it"""
+        if self._old_hashmap is not None:
+            # a previous rehash is still in flight, finish it before starting another one
+            self._rehash_step(num_buckets=self._old_size)
+        self._old_hashmap = self._hashmap
+        self._old_size = self._size
+        self._rehash_idx = 0
+        self._size = new_size
+        self._hashmap = [None] * self._size
+        self._version += 1
+        return None
+
+    def _rehash_step_if_needed(self) -> None:
+        if self._old_hashmap is not None:
+            self._rehash_step()
+        return None
+
+    def _rehash_step(self, num_buckets: int | None = None) -> None:
+        """Migrates up to num_buckets buckets (default: rehash_step) from the old bucket list into the new one"""
+        if self._old_hashmap is None:
+            return None
+        if num_buckets is None:
+            num_buckets = self._rehash_step_size
+        
+        # empty buckets are cheap to skip, but cap the number visited so a sparse old list can't stall a single call
+        max_empty_visits: int = num_buckets * 10
+        old_hashmap: list = self._old_hashmap
+        
+        while (num_buckets > 0) and (self._rehash_idx < self._old_size):
+            kv_pairs = old_hashmap[self._rehash_idx]
             if kv_pairs:
-                print(f"k: {kv_pairs[0][0]}, v: ", end="")
-                for idx, kv in enumerate(kv_pairs):
-                    if idx == len(kv_pairs)-1:
-                        term_char = "\n"
+                for kv in kv_pairs:
+                    hash_key: int = kv[2] % self._size # cached hash code, the key is not re-hashed
+                    if self._hashmap[hash_key]:
+                        self._hashmap[hash_key].append(kv)
                     else:
-                        term_char = ", " 
-                    print(kv[1], end=term_char)
-        return None
\ No newline at end of file
+                        self._hashmap[hash_key] = [kv]
+                old_hashmap[self._rehash_idx] = None
+                num_buckets -= 1
+            else:
+                max_empty_visits -= 1
+                if max_empty_visits == 0:
+                    num_buckets -= 1
+                    max_empty_visits = self._rehash_step_size * 10
+            self._rehash_idx += 1
+        
+        if self._rehash_idx >= self._old_size:
+            self._old_hashmap = None
+            self._old_size = 0
+            self._rehash_idx = 0
+        return None
+
+    def _maybe_resize(self) -> None:
+        """Starts a grow or shrink rehash if the load factor bounds have been crossed"""
+        if self._old_hashmap is not None:
+            return None
+        if self._count > (self._size * self._load_factor):
+            self._start_resize(new_size=self._size * 2)
+        elif (self._min_load_factor is not None) and (self._size > self._initial_size) \
+            and (self._count < (self._size * self._min_load_factor)):
+            self._start_resize(new_size=max(self._initial_size, self._size // 2))
+        return None
+
+    def _presize(self, num_new_entries: int) -> None:
+        """Grows the bucket list up front (one full rehash) so num_new_entries more entries stay under load_factor"""
+        num_entries: int = self._count + num_new_entries
+        new_size: int = self._size
+        while num_entries > (new_size * self._load_factor):
+            new_size *= 2
+        if new_size == self._size:
+            return None
+        self._start_resize(new_size=new_size)
+        self._rehash_step(num_buckets=self._old_size)
+        return None
+
+#--------------------------------------------------------
+def _benchmark_script(max_exponent: int = 7, num_lookups: int = 100_000):
+    """Shows that lookup latency stays flat as the number of keys grows from 1e3 to 10**max_exponent"""
+    print(f"{'num_keys':>12} {'buckets':>12} {'ns/get':>10} {'max add (us)':>14}")
+    gc_was_enabled: bool = gc.isenabled()
+    gc.disable() # same as timeit, keeps cyclic gc pauses out of the per-call timings
+    for exponent in range(3, max_exponent+1):
+        num_keys: int = 10**exponent
+        hashmap = HashMap()
+        max_add_time: float = 0.0
+
+        for key in range(num_keys):
+            start = time.perf_counter()
+            hashmap.add(key=key, value=key+1)
+            max_add_time = max(max_add_time, time.perf_counter() - start)
+        
+        lookup_keys = [random.randrange(num_keys) for _ in range(num_lookups)]
+        start = time.perf_counter()
+        for key in lookup_keys:
+            hashmap.get(key)
+        elapsed: float = time.perf_counter() - start
+
+        print(f"{num_keys:>12} {hashmap._size:>12} {elapsed / num_lookups * 1e9:>10.0f} {max_add_time * 1e6:>14.1f}")
+        del hashmap
+    if gc_was_enabled:
+        gc.enable()
+
+def _hash_distribution_script(num_keys: int = 10_000):
+    """Compares bucket chain lengths of the available hash functions on short, anagram-heavy string keys"""
+    keys = ["".join(chars) for chars in itertools.islice(itertools.permutations("abcdefgh", 5), num_keys)]
+    for hash_function in (ascii_sum_hash, builtin_hash, fnv1a_hash):
+        hashmap = HashMap(hash_function=hash_function)
+        for key in keys:
+            hashmap.add(key=key, value=1)
+        stats = hashmap.bucket_stats()
+        print(f"{hash_function.__name__:>16}: buckets={stats['num_buckets']}, empty={stats['empty_buckets']}, "
+              f"max_chain={stats['max_chain_length']}, mean_chain={stats['mean_chain_length']:.2f}")
+        del hashmap
+
+def _bulk_benchmark_script(num_keys: int = 100_000):
+    """Compares add_many/get_many/delete_many/from_pairs against looped single calls"""
+    kv_pairs = [(f"key-{idx}", idx+1) for idx in range(num_keys)]
+    keys = [key for key, _ in kv_pairs]
+    gc_was_enabled: bool = gc.isenabled()
+    gc.disable()
+
+    def timed(func) -> float:
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+
+    looped, bulk = HashMap(), HashMap()
+    results = {
+        "add": (timed(lambda: [looped.add(key=key, value=value) for key, value in kv_pairs]), timed(lambda: bulk.add_many(kv_pairs))),
+        "get": (timed(lambda: [looped.get(key) for key in keys]), timed(lambda: bulk.get_many(keys))),
+        "delete": (timed(lambda: [looped.delete(key) for key in keys]), timed(lambda: bulk.delete_many(keys))),
+    }
+    results["from_pairs"] = (results["add"][0], timed(lambda: HashMap.from_pairs(kv_pairs)))
+
+    for name, (looped_time, bulk_time) in results.items():
+        print(f"{name:>12}: looped={looped_time * 1e3:8.1f} ms, bulk={bulk_time * 1e3:8.1f} ms, speedup={looped_time / bulk_time:5.2f}x")
+    if gc_was_enabled:
+        gc.enable()
+
+if __name__ == "__main__":
+    _benchmark_script()
+    _hash_distribution_script()
+    _bulk_benchmark_script()
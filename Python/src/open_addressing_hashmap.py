@@ -0,0 +1,265 @@
+"""
+10/18/2026: J. BRANCH
+
+The goal is to create an open-addressing alternative to the chaining HashMap from 'scratch'.
+
+Plan:
+    - Datamodel:
+        (class) OpenAddressingHashMap
+
+        OpenAddressingHashMap
+            |
+        _keys   = [k0,   None, k2,  <tombstone>, ...]
+        _values = [v0,   None, v2,  None,        ...]
+        _hashes = array('Q', [h0, 0, h2, 0,   ...])
+
+    - Keys and values are kept in two parallel flat lists and the cached hash codes (masked to 64 bits) in an unsigned 64-bit
+      array (one slot per entry), instead of one list object plus one tuple per entry as in the chaining HashMap.
+      The array stores raw 8-byte words, so a cached hash code costs 8 bytes instead of a separate int object
+    - Collisions are resolved with linear probing over a power-of-two capacity (index = hash_code & (capacity - 1))
+    - Deletion leaves a tombstone so probe sequences running through the slot are not cut short,
+      tombstones are reused by later adds and purged whenever the lists are rebuilt
+    - The lists are rebuilt (grown when needed) once used slots (entries + tombstones) exceed load_factor * capacity
+    - Each key owns a single slot: as with the (single-value mode) HashMap, adding an existing key overwrites its value
+    - Hash functions are shared with the chaining HashMap (builtin_hash default, fnv1a_hash, ascii_sum_hash)
+
+    - Public Methods:
+        - add(self, key: ImmutableType, value: Any): Adds the k-v pair, overwrites the value if the key already exists.
+            return: None
+
+        - get(self, key: ImmutableType): Returns the value for the key if it exists, else returns None.
+            return: Value(Type: Any) or None(*if key is not found)
+
+        - delete(self, key: ImmutableType, target_value(*optional)): Removes the k-v pair associated with the key passed into the function.
+            If an argument for the optional target_value param is passed then the deletion only occurs if it matches the stored value.
+            return: None(*raises KeyError if key is not found)
+
+        - print_kv_pairs(self): Prints all k-v pairs currently in the hashmap.
+            return: None
+
+        - probe_stats(self): Returns probe length statistics (distance of each entry from its home slot) and slot usage.
+            return: dict[str, Any]
+
+        - memory_usage(self): Returns the bytes used by the slot lists and the hash array (excludes the key/value objects).
+            return: int
+
+    - Internal Methods:
+        - _find_slot(self, key, hash_code): Returns the slot index holding the key, or -1 if not found.
+            return: int
+
+        - _resize(self, new_capacity): Rebuilds the slot lists at new_capacity, dropping tombstones.
+            return: None
+"""
+from typing import Any, Callable
+from array import array
+import gc
+import random
+import sys
+import time
+
+if not __package__: # run as a script, or imported by a module run as a script
+    from hashmap import HashMap, ImmutableType, builtin_hash
+else:
+    from src.hashmap import HashMap, ImmutableType, builtin_hash
+
+class _Tombstone:
+    def __repr__(self) -> str:
+        return "<tombstone>"
+
+_TOMBSTONE = _Tombstone()
+_MASK_64: int = (1 << 64) - 1
+
+class OpenAddressingHashMap:
+    def __init__(self, size: int = 8, load_factor: float = 0.7, hash_function: Callable[[ImmutableType], int] = builtin_hash):
+        if (type(size) is not int):
+            raise TypeError("size for the OpenAddressingHashMap object must be specified as int.")
+        if not callable(hash_function):
+            raise TypeError("hash_function for the OpenAddressingHashMap object must be callable.")
+        if (size < 1):
+            raise ValueError("size for OpenAddressingHashMap must be greater than 0.")
+        if not (0 < load_factor < 1):
+            raise ValueError("load_factor for OpenAddressingHashMap must be between 0 and 1 (exclusive).")
+        capacity: int = 1
+        while capacity < size:
+            capacity <<= 1
+        self._capacity: int = capacity
+        self._keys: list[Any] = [None] * capacity
+        self._values: list[Any] = [None] * capacity
+        self._hashes: array = array("Q", bytes(8 * capacity))
+        self._count: int = 0
+        self._tombstones: int = 0
+        self._load_factor: float = load_factor
+        self._hash_function: Callable[[ImmutableType], int] = hash_function
+
+    def _hash_code(self, key: ImmutableType) -> int:
+        if not isinstance(key, (str, int, tuple)):
+            raise TypeError
+        return self._hash_function(key) & _MASK_64 # custom hash functions may return negative or wider ints
+
+    def add(self, key: ImmutableType, value: Any) -> None:
+        """Adds the k-v pair, overwrites the value if the key already exists."""
+        if value is None: # None is what get returns for a missing key
+            raise ValueError
+        
+        hash_code: int = self._hash_code(key)
+        mask: int = self._capacity - 1
+        idx: int = hash_code & mask
+        first_tombstone: int = -1
+        keys: list[Any] = self._keys
+
+        while True:
+            slot_key = keys[idx]
+            if slot_key is None:
+                break
+            if slot_key is _TOMBSTONE:
+                if first_tombstone == -1:
+                    first_tombstone = idx
+            elif (self._hashes[idx] == hash_code) and (slot_key == key):
+                self._values[idx] = value
+                return None
+            idx = (idx + 1) & mask
+
+        if first_tombstone != -1:
+            idx = first_tombstone
+            self._tombstones -= 1
+        keys[idx] = key
+        self._values[idx] = value
+        self._hashes[idx] = hash_code
+        self._count += 1
+
+        if (self._count + self._tombstones) > (self._capacity * self._load_factor):
+            self._resize(new_capacity=self._capacity * 2 if self._count > (self._capacity * self._load_factor / 2) else self._capacity)
+        return None
+
+    def get(self, key: ImmutableType) -> Any | None:
+        """Returns the value for the key if it exists, else returns None."""
+        idx: int = self._find_slot(key=key, hash_code=self._hash_code(key))
+        if idx == -1:
+            return None
+        return self._values[idx]
+
+    def delete(self, key: ImmutableType, target_value: Any | None = None) -> None:
+        """Removes the k-v pair associated with the key passed into the function.
+            If an argument for the optional target_value parameter is passed into the function, then deletion only occurs if it matches the stored value.
+            This function raises a KeyError if the key is not found in the hashmap.
+        """
+        idx: int = self._find_slot(key=key, hash_code=self._hash_code(key))
+        if idx == -1:
+            raise KeyError(key)
+        if (target_value is not None) and (self._values[idx] != target_value):
+            return None
+        self._keys[idx] = _TOMBSTONE
+        self._values[idx] = None
+        self._hashes[idx] = 0
+        self._count -= 1
+        self._tombstones += 1
+        return None
+
+    def print_kv_pairs(self) -> None:
+        for key, value in zip(self._keys, self._values):
+            if (key is not None) and (key is not _TOMBSTONE):
+                print(f"k: {key}, v: {value}")
+        return None
+
+    def probe_stats(self) -> dict[str, Any]:
+        """Returns probe length statistics (distance of each entry from its home slot) and slot usage."""
+        mask: int = self._capacity - 1
+        probe_lengths: list[int] = [
+            (idx - (self._hashes[idx] & mask)) & mask
+            for idx, key in enumerate(self._keys)
+            if (key is not None) and (key is not _TOMBSTONE)
+        ]
+        return {
+            "capacity": self._capacity,
+            "num_entries": self._count,
+            "tombstones": self._tombstones,
+            "load_factor": self._count / self._capacity,
+            "max_probe_length": max(probe_lengths, default=0),
+            "mean_probe_length": (sum(probe_lengths) / len(probe_lengths)) if probe_lengths else 0.0,
+        }
+
+    def memory_usage(self) -> int:
+        """Returns the bytes used by the slot lists and the hash array (excludes the key/value objects)."""
+        return sys.getsizeof(self._keys) + sys.getsizeof(self._values) + sys.getsizeof(self._hashes)
+
+    def _find_slot(self, key: ImmutableType, hash_code: int) -> int:
+        """Returns the slot index holding the key, or -1 if not found"""
+        mask: int = self._capacity - 1
+        idx: int = hash_code & mask
+        keys: list[Any] = self._keys
+
+        while True:
+            slot_key = keys[idx]
+            if slot_key is None:
+                return -1
+            if (slot_key is not _TOMBSTONE) and (self._hashes[idx] == hash_code) and (slot_key == key):
+                return idx
+            idx = (idx + 1) & mask
+
+    def _resize(self, new_capacity: int) -> None:
+        """Rebuilds the slot lists at new_capacity, dropping tombstones"""
+        old_keys, old_values, old_hashes = self._keys, self._values, self._hashes
+        self._capacity = new_capacity
+        self._keys = [None] * new_capacity
+        self._values = [None] * new_capacity
+        self._hashes = array("Q", bytes(8 * new_capacity))
+        self._tombstones = 0
+        mask: int = new_capacity - 1
+
+        for key, value, hash_code in zip(old_keys, old_values, old_hashes):
+            if (key is None) or (key is _TOMBSTONE):
+                continue
+            idx: int = hash_code & mask
+            while self._keys[idx] is not None:
+                idx = (idx + 1) & mask
+            self._keys[idx] = key
+            self._values[idx] = value
+            self._hashes[idx] = hash_code
+        return None
+
+#--------------------------------------------------------
+def _chaining_memory_usage(hashmap: HashMap) -> int:
+    """Bytes used by a chaining HashMap's bucket lists, chain lists and entry tuples (excludes the key/value objects)"""
+    total: int = 0
+    for buckets in (hashmap._old_hashmap, hashmap._hashmap):
+        if buckets is None:
+            continue
+        total += sys.getsizeof(buckets)
+        for kv_pairs in buckets:
+            if kv_pairs:
+                total += sys.getsizeof(kv_pairs) + sum(sys.getsizeof(kv) + sys.getsizeof(kv[2]) for kv in kv_pairs)
+    return total
+
+def _benchmark_script(num_keys: int = 100_000, num_lookups: int = 100_000):
+    """Compares memory per entry, probe/chain lengths and lookup latency against the chaining HashMap"""
+    keys = [f"key-{idx}" for idx in range(num_keys)]
+    lookup_keys = [random.choice(keys) for _ in range(num_lookups)]
+    gc_was_enabled: bool = gc.isenabled()
+    gc.disable()
+
+    chaining = HashMap()
+    open_addressing = OpenAddressingHashMap()
+    for key in keys:
+        chaining.add(key=key, value=1)
+        open_addressing.add(key=key, value=1)
+
+    for name, hashmap in (("HashMap", chaining), ("OpenAddressingHashMap", open_addressing)):
+        start = time.perf_counter()
+        for key in lookup_keys:
+            hashmap.get(key)
+        elapsed: float = time.perf_counter() - start
+        if isinstance(hashmap, HashMap):
+            memory: int = _chaining_memory_usage(hashmap)
+            stats = hashmap.bucket_stats()
+            lengths = f"mean_chain={stats['mean_chain_length']:.2f}, max_chain={stats['max_chain_length']}"
+        else:
+            memory = hashmap.memory_usage()
+            stats = hashmap.probe_stats()
+            lengths = f"mean_probe={stats['mean_probe_length']:.2f}, max_probe={stats['max_probe_length']}"
+        print(f"{name:>22}: {memory / num_keys:6.1f} bytes/entry, {elapsed / num_lookups * 1e9:6.0f} ns/get, {lengths}")
+
+    if gc_was_enabled:
+        gc.enable()
+
+if __name__ == "__main__":
+    _benchmark_script()
@@ -0,0 +1,418 @@
+"""
+10/18/2026: J. BRANCH
+
+The goal is to create a disk-backed HashMap from 'scratch' that can be opened and queried without deserializing it.
+
+Plan:
+    - Datamodel:
+        (class) PersistentHashMap
+
+        file = [ header | bucket array | record | record | ... | (unused, preallocated) ]
+
+        header (64 bytes):   magic(8s) | num_buckets(u64) | count(u64) | data_end(u64) | reserved
+        bucket array:        num_buckets * offset(u64), the file offset of the newest record in the bucket's chain (0 = empty bucket)
+        record:              next_offset(u64) | hash_code(u64) | flags(u8) | key_len(u32) | value_len(u32) | key bytes | value bytes
+
+    - The file is accessed through mmap: opening a map only reads the 64 byte header, get hashes the key, reads one bucket
+      offset and walks that bucket's chain of records, so only the pages touched by the lookup are ever read from disk
+    - Keys are restricted to the HashMap key types (str, int, tuple) and encoded with the same type-tagged byte encoding
+      used by hashmap.fnv1a_hash, which is also the hash function (stable across processes, unlike hash())
+    - Values are stored pickled and are only unpickled by the lookup that returns them
+    - Append-only write path: add/delete never modify a record in place, they append a new record (delete appends a tombstone)
+      and point the bucket at it, so the newest record for a key shadows the older ones further down the chain
+    - The number of buckets is fixed when the file is created, compaction rewrites the live entries into a fresh file
+      (optionally with a different number of buckets) and drops shadowed records and tombstones
+    - The file grows geometrically (remapped on growth) and is trimmed to data_end on close
+
+    - Public Methods:
+        1. add(self, key: ImmutableType, value: Any): Appends a record for the k-v pair, overwrites the value of an existing key
+            return: None
+
+        2. get(self, key: ImmutableType, default(*optional)): Returns the value for the key if it exists, else returns default (None)
+            return: Any
+
+        3. delete(self, key: ImmutableType, target_value(*optional)): Appends a tombstone for the key, if target_value is passed
+            the deletion only occurs if it matches the stored value, raises KeyError if the key is not found
+            return: None
+
+        4. items(self) / keys(self) / values(self) / __iter__(self): Generators walking the bucket chains (newest record per key wins),
+            writing to the map (or a refresh that remaps it) during iteration raises RuntimeError
+            return: iterator
+
+        5. flush(self): Flushes the mmap to disk
+            return: None
+
+        6. refresh(self): Re-reads the header (count, data_end) written by another process, for read-only instances
+            return: None
+
+        7. close(self): Flushes, trims the file to its used size and closes the mmap/file (also via the context manager protocol)
+            return: None
+
+        8. __getitem__ / __setitem__ / __delitem__ / __contains__ / __len__ / __repr__: Mapping protocol, as for HashMap
+
+    - Module Functions:
+        9. compact(path, out_path(*optional), num_buckets(*optional)): Rewrites only the live entries of a map file,
+            in place (via a temporary file and an atomic rename) unless out_path is given
+            return: None
+
+        Command line: python persistent_hashmap.py compact PATH [--out OUT_PATH] [--buckets NUM_BUCKETS]
+"""
+from typing import Any, Iterator
+from collections.abc import MutableMapping
+import argparse
+import mmap
+import os
+import pickle
+import struct
+import time
+
+if not __package__: # run as a script, or imported by a module run as a script
+    from hashmap import HashMap, ImmutableType, fnv1a_hash, _key_to_bytes
+else:
+    from src.hashmap import HashMap, ImmutableType, fnv1a_hash, _key_to_bytes
+
+_MAGIC: bytes = b"PHMAP\x00\x01\x00"
+_HEADER = struct.Struct("<8sQQQ") # magic, num_buckets, count, data_end
+_HEADER_SIZE: int = 64
+_OFFSET = struct.Struct("<Q")
+_RECORD_HEADER = struct.Struct("<QQBII") # next_offset, hash_code, flags, key_len, value_len
+_TOMBSTONE_FLAG: int = 1
+_MIN_GROWTH: int = 1 << 20
+
+_MISSING = object()
+
+def _bytes_to_key(data: bytes, pos: int = 0) -> tuple[ImmutableType, int]:
+    """Decodes one key encoded by hashmap._key_to_bytes starting at pos, returns the key and the position after it"""
+    tag: bytes = data[pos:pos+1]
+    length: int = int.from_bytes(data[pos+1:pos+5], "little")
+    pos += 5
+    if tag == b"s":
+        return data[pos:pos+length].decode("utf-8"), pos + length
+    elif tag == b"i":
+        return int.from_bytes(data[pos:pos+length], "little", signed=True), pos + length
+    elif tag == b"t":
+        items: list[ImmutableType] = []
+        for _ in range(length):
+            item, pos = _bytes_to_key(data, pos)
+            items.append(item)
+        return tuple(items), pos
+    else:
+        raise ValueError(f"Corrupt key encoding (tag={tag!r}).")
+
+class PersistentHashMap(MutableMapping):
+    def __init__(self, path: str, num_buckets: int = 1 << 16, readonly: bool = False):
+        if (type(num_buckets) is not int):
+            raise TypeError("num_buckets for the PersistentHashMap object must be specified as int.")
+        if (num_buckets < 1):
+            raise ValueError("num_buckets for PersistentHashMap must be greater than 0.")
+        self.path: str = path
+        self.readonly: bool = readonly
+
+        if not (os.path.exists(path) and os.path.getsize(path) > 0):
+            if readonly:
+                raise FileNotFoundError(path)
+            self._create_file(path=path, num_buckets=num_buckets)
+
+        self._file = open(path, "rb" if readonly else "r+b")
+        self._mmap: mmap.mmap = self._map_file()
+        self._version: int = 0 # incremented by every write and remap, iterators raise RuntimeError if it changes
+        magic, self.num_buckets, self._count, self._data_end = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC:
+            self._mmap.close()
+            self._file.close()
+            raise ValueError(f"{path} is not a PersistentHashMap file.")
+
+    def add(self, key: ImmutableType, value: Any) -> None:
+        """Appends a record for the k-v pair, overwrites the value of an existing key"""
+        if value is None: # None is what get returns for a missing key
+            raise ValueError
+        self._check_writable()
+        encoded_key: bytes = _key_to_bytes(key)
+        hash_code: int = fnv1a_hash(key)
+        is_new_key: bool = self._find_record(encoded_key=encoded_key, hash_code=hash_code) is None
+        self._append_record(encoded_key=encoded_key, hash_code=hash_code, value=pickle.dumps(value), flags=0)
+        if is_new_key:
+            self._set_count(self._count + 1)
+        return None
+
+    def get(self, key: ImmutableType, default: Any | None = None) -> Any | None:
+        """Returns the value for the key if it exists, else returns default (None)"""
+        record = self._find_record(encoded_key=_key_to_bytes(key), hash_code=fnv1a_hash(key))
+        if record is None:
+            return default
+        value_start, value_end = record
+        return pickle.loads(self._mmap[value_start:value_end])
+
+    def delete(self, key: ImmutableType, target_value: Any | None = None) -> None:
+        """Appends a tombstone for the key. If target_value is passed, the deletion only occurs if it matches the stored value.
+            Raises a KeyError if the key is not found.
+        """
+        self._check_writable()
+        encoded_key: bytes = _key_to_bytes(key)
+        hash_code: int = fnv1a_hash(key)
+        record = self._find_record(encoded_key=encoded_key, hash_code=hash_code)
+        if record is None:
+            raise KeyError(key)
+        if (target_value is not None) and (pickle.loads(self._mmap[record[0]:record[1]]) != target_value):
+            return None
+        self._append_record(encoded_key=encoded_key, hash_code=hash_code, value=b"", flags=_TOMBSTONE_FLAG)
+        self._set_count(self._count - 1)
+        return None
+
+    def items(self) -> Iterator[tuple[ImmutableType, Any]]:
+        """Generator walking the bucket chains, yields the newest (key, value) of every live key"""
+        for encoded_key, value_start, value_end in self._iter_live_records():
+            yield _bytes_to_key(encoded_key)[0], pickle.loads(self._mmap[value_start:value_end])
+
+    def keys(self) -> Iterator[ImmutableType]:
+        for encoded_key, _, _ in self._iter_live_records():
+            yield _bytes_to_key(encoded_key)[0]
+
+    def values(self) -> Iterator[Any]:
+        for _, value_start, value_end in self._iter_live_records():
+            yield pickle.loads(self._mmap[value_start:value_end])
+
+    def flush(self) -> None:
+        """Flushes the mmap to disk"""
+        if not self.readonly:
+            self._mmap.flush()
+        return None
+
+    def refresh(self) -> None:
+        """Re-reads the header (count, data_end) written by another process, for read-only instances"""
+        _, _, self._count, self._data_end = _HEADER.unpack_from(self._mmap, 0)
+        if self._data_end > len(self._mmap):
+            self._remap()
+        return None
+
+    def close(self) -> None:
+        """Flushes, trims the file to its used size and closes the mmap/file"""
+        if self._file.closed:
+            return None
+        self.flush()
+        self._mmap.close()
+        if not self.readonly:
+            self._file.truncate(self._data_end)
+        self._file.close()
+        return None
+
+    def __enter__(self) -> "PersistentHashMap":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __getitem__(self, key: ImmutableType) -> Any:
+        value: Any = self.get(key, default=_MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: ImmutableType, value: Any) -> None:
+        self.add(key, value)
+
+    def __delitem__(self, key: ImmutableType) -> None:
+        self.delete(key)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, (str, int, tuple)):
+            return False
+        return self._find_record(encoded_key=_key_to_bytes(key), hash_code=fnv1a_hash(key)) is not None
+
+    def __len__(self) -> int:
+        """Dunder method to implement len(obj) functionality"""
+        return self._count
+
+    def __iter__(self) -> Iterator[ImmutableType]:
+        return self.keys()
+
+    def __repr__(self) -> str:
+        """Dunder method to implement repr(obj) functionality"""
+        return f"class_name=PersistentHashMap, id={id(self)}, path={self.path}, length={self._count}," \
+            f" buckets={self.num_buckets}, data_end={self._data_end}, readonly={self.readonly}"
+
+    def _create_file(self, path: str, num_buckets: int) -> None:
+        data_start: int = _HEADER_SIZE + num_buckets * _OFFSET.size
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, num_buckets, 0, data_start).ljust(_HEADER_SIZE, b"\x00"))
+            file.truncate(data_start + _MIN_GROWTH) # zero-filled bucket array plus room for the first records
+        return None
+
+    def _map_file(self) -> mmap.mmap:
+        return mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE)
+
+    def _remap(self) -> None:
+        self._version += 1
+        self._mmap.close()
+        self._mmap = self._map_file()
+        return None
+
+    def _check_writable(self) -> None:
+        if self.readonly:
+            raise PermissionError("PersistentHashMap was opened read-only.")
+        return None
+
+    def _bucket_offset(self, hash_code: int) -> int:
+        """Returns the file offset of the bucket slot holding the head of the key's chain"""
+        return _HEADER_SIZE + (hash_code % self.num_buckets) * _OFFSET.size
+
+    def _find_record(self, encoded_key: bytes, hash_code: int) -> tuple[int, int] | None:
+        """Walks the key's bucket chain, returns the (start, end) offsets of the newest live value, None if missing or deleted"""
+        data: mmap.mmap = self._mmap
+        record_offset: int = _OFFSET.unpack_from(data, self._bucket_offset(hash_code))[0]
+        key_len: int = len(encoded_key)
+
+        while record_offset:
+            if record_offset + _RECORD_HEADER.size > len(data):
+                self._remap() # another process appended past the end of this mapping
+                data = self._mmap
+            next_offset, record_hash, flags, record_key_len, value_len = _RECORD_HEADER.unpack_from(data, record_offset)
+            key_start: int = record_offset + _RECORD_HEADER.size
+            if key_start + record_key_len + value_len > len(data):
+                self._remap()
+                data = self._mmap
+            if (record_hash == hash_code) and (record_key_len == key_len) and (data[key_start:key_start+key_len] == encoded_key):
+                if flags & _TOMBSTONE_FLAG:
+                    return None
+                return key_start + key_len, key_start + key_len + value_len
+            record_offset = next_offset
+        return None
+
+    def _append_record(self, encoded_key: bytes, hash_code: int, value: bytes, flags: int) -> None:
+        """Appends a record at data_end and makes it the head of its bucket's chain"""
+        record_size: int = _RECORD_HEADER.size + len(encoded_key) + len(value)
+        self._version += 1
+        if self._data_end + record_size > len(self._mmap):
+            self._grow(min_size=self._data_end + record_size)
+
+        bucket_offset: int = self._bucket_offset(hash_code)
+        record_offset: int = self._data_end
+        previous_head: int = _OFFSET.unpack_from(self._mmap, bucket_offset)[0]
+        _RECORD_HEADER.pack_into(self._mmap, record_offset, previous_head, hash_code, flags, len(encoded_key), len(value))
+        key_start: int = record_offset + _RECORD_HEADER.size
+        self._mmap[key_start:key_start+len(encoded_key)] = encoded_key
+        self._mmap[key_start+len(encoded_key):record_offset+record_size] = value
+
+        # the record is complete before anything points at it
+        self._data_end = record_offset + record_size
+        _HEADER.pack_into(self._mmap, 0, _MAGIC, self.num_buckets, self._count, self._data_end)
+        _OFFSET.pack_into(self._mmap, bucket_offset, record_offset)
+        return None
+
+    def _set_count(self, count: int) -> None:
+        self._count = count
+        _HEADER.pack_into(self._mmap, 0, _MAGIC, self.num_buckets, self._count, self._data_end)
+        return None
+
+    def _grow(self, min_size: int) -> None:
+        new_size: int = max(min_size, len(self._mmap) * 2, len(self._mmap) + _MIN_GROWTH)
+        self._mmap.flush()
+        self._mmap.close()
+        self._file.truncate(new_size)
+        self._mmap = self._map_file()
+        return None
+
+    def _iter_live_records(self) -> Iterator[tuple[bytes, int, int]]:
+        """Yields (encoded_key, value_start, value_end) for the newest record of every live key"""
+        data: mmap.mmap = self._mmap
+        version: int = self._version
+        for bucket in range(self.num_buckets):
+            record_offset: int = _OFFSET.unpack_from(data, _HEADER_SIZE + bucket * _OFFSET.size)[0]
+            seen_keys: set[bytes] = set() # newest record first, shadowed records of a key follow it
+            while record_offset:
+                next_offset, _, flags, key_len, value_len = _RECORD_HEADER.unpack_from(data, record_offset)
+                key_start: int = record_offset + _RECORD_HEADER.size
+                encoded_key: bytes = data[key_start:key_start+key_len]
+                if encoded_key not in seen_keys:
+                    seen_keys.add(encoded_key)
+                    if not (flags & _TOMBSTONE_FLAG):
+                        yield encoded_key, key_start + key_len, key_start + key_len + value_len
+                        if self._version != version: # a write may have remapped (and closed) data
+                            raise RuntimeError("PersistentHashMap changed size during iteration")
+                record_offset = next_offset
+
+def compact(path: str, out_path: str | None = None, num_buckets: int | None = None) -> None:
+    """Rewrites only the live entries of a map file, in place (temporary file + atomic rename) unless out_path is given.
+        num_buckets defaults to the smallest power of two keeping the average chain length under 0.75.
+    """
+    target_path: str = out_path if out_path is not None else f"{path}.compacting"
+    if os.path.exists(target_path):
+        os.remove(target_path)
+
+    with PersistentHashMap(path, readonly=True) as source:
+        if num_buckets is None:
+            num_buckets = 1
+            while len(source) > num_buckets * 0.75:
+                num_buckets *= 2
+        with PersistentHashMap(target_path, num_buckets=num_buckets) as target:
+            for encoded_key, value_start, value_end in source._iter_live_records():
+                key: ImmutableType = _bytes_to_key(encoded_key)[0]
+                # keys are unique in the source, so the existence check done by add can be skipped
+                target._append_record(encoded_key=encoded_key, hash_code=fnv1a_hash(key),
+                                      value=source._mmap[value_start:value_end], flags=0)
+                target._set_count(target._count + 1)
+
+    if out_path is None:
+        os.replace(target_path, path)
+    return None
+
+#--------------------------------------------------------
+def _benchmark_script(path: str = "persistent_hashmap_benchmark.phm", num_keys: int = 200_000, num_lookups: int = 10_000):
+    """Compares opening the map file and serving lookups against rebuilding a HashMap from a pickled source file"""
+    import random
+    source_path: str = f"{path}.source.pickle"
+    kv_pairs = [(f"key-{idx}", idx+1) for idx in range(num_keys)]
+    lookup_keys = [random.choice(kv_pairs)[0] for _ in range(num_lookups)]
+    for stale_path in (path, source_path):
+        if os.path.exists(stale_path):
+            os.remove(stale_path)
+
+    with open(source_path, "wb") as file:
+        pickle.dump(kv_pairs, file)
+    with PersistentHashMap(path, num_buckets=1 << 18) as persistent:
+        for key, value in kv_pairs:
+            persistent.add(key, value)
+
+    start = time.perf_counter()
+    with open(source_path, "rb") as file:
+        hashmap = HashMap.from_pairs(pickle.load(file))
+    rebuild_time: float = time.perf_counter() - start
+    start = time.perf_counter()
+    for key in lookup_keys:
+        hashmap.get(key)
+    hashmap_get_time: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    persistent = PersistentHashMap(path, readonly=True)
+    open_time: float = time.perf_counter() - start
+    start = time.perf_counter()
+    for key in lookup_keys:
+        persistent.get(key)
+    persistent_get_time: float = time.perf_counter() - start
+    persistent.close()
+
+    print(f"{'HashMap':>18}: warm-up (rebuild) {rebuild_time * 1e3:9.2f} ms, {hashmap_get_time / num_lookups * 1e9:7.0f} ns/get")
+    print(f"{'PersistentHashMap':>18}: warm-up (open)    {open_time * 1e3:9.2f} ms, {persistent_get_time / num_lookups * 1e9:7.0f} ns/get")
+    os.remove(path)
+    os.remove(source_path)
+
+def _main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="PersistentHashMap maintenance commands.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    compact_parser = subparsers.add_parser("compact", help="rewrite only the live entries of a map file")
+    compact_parser.add_argument("path")
+    compact_parser.add_argument("--out", dest="out_path", default=None, help="write the compacted map here instead of in place")
+    compact_parser.add_argument("--buckets", dest="num_buckets", type=int, default=None, help="number of buckets of the compacted map")
+    subparsers.add_parser("benchmark", help="compare warm-up and lookup cost against rebuilding a HashMap")
+    args = parser.parse_args(argv)
+
+    if args.command == "compact":
+        before: int = os.path.getsize(args.path)
+        compact(path=args.path, out_path=args.out_path, num_buckets=args.num_buckets)
+        after: int = os.path.getsize(args.out_path or args.path)
+        print(f"compacted {args.path}: {before} -> {after} bytes")
+    else:
+        _benchmark_script()
+
+if __name__ == "__main__":
+    _main()
@@ -8,12 +8,19 @@ Plan:
         (composite class) Queue
         (composite class) SinglyLinkedList
         (class) Node
+        (class) RingBuffer
         
-          Queue
+          Queue (backend="linkedlist")
             |
         LinkedList
             |
-           head --> Node[value|next --> Node[value|next --> ... --> Node[value|None] 
+           head --> Node[value|next --> Node[value|next --> ... --> Node[value|None] <-- tail
+
+          Queue (backend="ring_buffer")
+            |
+        RingBuffer
+            |
+        Python list (power-of-two capacity, grows and shrinks) 
     
     - Node class (data-only class)
         - contains a member to store a node value 
@@ -24,8 +31,14 @@ Plan:
         - contains a length member that keeps track of the current length of the linkedlist
         - read internal docs for API info
 
+    - RingBuffer class
+        - growable power-of-two circular buffer, no per-element node allocation
+        - read internal docs for API info
+
     - Queue class
-        -contains a SinglyLinkedList member used as the underlying data structure for the Queue
+        - contains a SinglyLinkedList (backend="linkedlist", default) or RingBuffer (backend="ring_buffer") member used as the
+          underlying data structure for the Queue, selected at construction
+        - every operation is O(1) (amortized for the ring buffer): enqueue appends at the tail, dequeue unlinks the head
 
         - Public Methods:
             1. enqueue(self, value: Any): Adds an element to the end of the queue
@@ -39,54 +52,86 @@ Plan:
     
             4. is_empty(self): Returns True if the queue is empty, otherwise returns False
                 return: bool
+
+            5. enqueue_many(self, values: Iterable[Any]): Adds every value to the end of the queue in one bulk call
+                return: None
+
+            6. dequeue_many(self, count: int): Removes and returns up to count values from the front of the queue (fewer if the queue holds fewer)
+                return: list[Any]
     
-            5. __len__(self): Dunder method to implement len(linkedlist obj) functionality
+            7. __len__(self): Dunder method to implement len(linkedlist obj) functionality
                 return: int
     
-            6. __iter__(self): Dunder method to make linkedlist objects iterable, e.g. allows object to be iterated over for-loops
+            8. __iter__(self): Dunder method to make linkedlist objects iterable, e.g. allows object to be iterated over for-loops
                 return: iterator
     
-            7. __repr__(self): Dunder method to implement repr(linkedlist obj) functionality
+            9. __repr__(self): Dunder method to implement repr(linkedlist obj) functionality
                 return: str
-    
-        - Internal Methods:
-            8. _validate_not_empty(self): Internal helper method used to validate if queue is currently non-empty
-                return: bool
 """
-from typing import Any
+from typing import Any, Iterable
 
-if __name__ == "__main__":
+if not __package__: # run as a script, or imported by a module run as a script
     from singly_linked_list import SinglyLinkedList
+    from ring_buffer import RingBuffer
 else:
     from src.singly_linked_list import SinglyLinkedList
+    from src.ring_buffer import RingBuffer
+
+_BACKENDS = ("linkedlist", "ring_buffer")
 
 class Queue:
-    def __init__(self):
-        self.list = SinglyLinkedList()
+    def __init__(self, backend: str = "linkedlist"):
+        if backend not in _BACKENDS:
+            raise ValueError(f"backend must be one of {_BACKENDS}.")
+        self.backend: str = backend
+        self.list: SinglyLinkedList | RingBuffer = SinglyLinkedList() if backend == "linkedlist" else RingBuffer()
     
     def enqueue(self, value: Any) -> None:
-        """Adds an element to the end of the queue"""
+        """Adds an element to the end of the queue (O(1), the linkedlist appends at its tail)"""
         self.list.append(value)
         return None
 
     def dequeue(self) -> Any:
         """Removes and returns the value from the front of the queue, raises IndexError if empty"""
-        if not (self._validate_not_empty()):
+        if len(self.list) == 0:
             raise IndexError("Cannot dequeue from an empty queue.")
-        value : Any = self.list.get(0)
+        if self.backend == "ring_buffer":
+            return self.list.pop_first()
+        value : Any = self.list.head.value # read the head directly, remove(0) then unlinks it in O(1)
         self.list.remove(0)
         return value
 
     def peek(self) -> Any:
         """Returns the value from the front of the queue without removing it, raises IndexError if empty"""
-        if not (self._validate_not_empty()):
+        if len(self.list) == 0:
             raise IndexError("Cannot peek from an empty queue.")
-        value : Any = self.list.get(0)
-        return value
+        if self.backend == "ring_buffer":
+            return self.list.peek_first()
+        return self.list.head.value
+
+    def enqueue_many(self, values: Iterable[Any]) -> None:
+        """Adds every value to the end of the queue in one bulk call (linkedlist/ring buffer extend)"""
+        self.list.extend(values)
+        return None
+
+    def dequeue_many(self, count: int) -> list[Any]:
+        """Removes and returns up to count values from the front of the queue, fewer if the queue holds fewer (an empty list if it is empty)"""
+        if (type(count) is not int) or (count < 0):
+            raise ValueError("count must be a non-negative int.")
+        if self.backend == "ring_buffer":
+            return self.list.pop_first_many(count)
+        count = min(count, len(self.list))
+        values: list[Any] = []
+        node = self.list.head
+        for _ in range(count):
+            values.append(node.value)
+            node = node.next
+        self.list.remove_range(0, count)
+        return values
 
     def is_empty(self) -> bool:
         """Returns True if the queue is empty, otherwise returns False"""
-        return self.list._is_empty()
+        return len(self.list) == 0
 
     def __len__(self) -> int:
         """Dunder method to implement len(obj) functionality"""
@@ -97,15 +142,14 @@ class Queue:
         Dunder method to make object iterable, e.g. allows object to be iterated over for-loops
         Note: Iteration implementation returns the element at the front of the queue first and iterates to the end of the queue
         """
+        if self.backend == "ring_buffer":
+            return iter(self.list)
         return (node.value for node in self.list) 
     
     def __repr__(self) -> str:
         """Dunder method to implement repr(obj) functionality"""
-        return f"class_name=Queue, id={id(self)}, length={len(self.list)}, front={self.list.get(0)}"
-
-    def _validate_not_empty(self) -> bool:
-        """Internal helper method used to validate if queue is currently non-empty"""
-        return not (self.list._is_empty()) # True -> not empty
+        front: Any = self.peek() if len(self.list) else None
+        return f"class_name=Queue, id={id(self)}, backend={self.backend}, length={len(self.list)}, front={front}"
 
 #--------------------------------------------------------
 def _functional_test_script():
@@ -127,10 +171,48 @@ def _functional_test_script():
     print("\n", repr(queue))
     print(f"Is queue empty: {queue.is_empty()}", "\n")
     
-    for _ in queue:
+    for _ in range(len(queue)):
         print(f"Attempting to dequeue value: {queue.dequeue()}")
 
     del queue
 
+def _benchmark_script(num_items: int = 1_000_000, batch_size: int = 1_000):
+    """Enqueue/dequeue throughput of both backends at num_items items, one at a time and in batches, against collections.deque"""
+    from collections import deque
+    import time
+
+    def single(queue: Queue) -> None:
+        for value in range(num_items):
+            queue.enqueue(value)
+        for _ in range(num_items):
+            queue.dequeue()
+
+    def batched(queue: Queue) -> None:
+        for start in range(0, num_items, batch_size):
+            queue.enqueue_many(range(start, min(start + batch_size, num_items)))
+        while not queue.is_empty():
+            queue.dequeue_many(batch_size)
+
+    def builtin_deque() -> None:
+        queue = deque()
+        for value in range(num_items):
+            queue.append(value)
+        for _ in range(num_items):
+            queue.popleft()
+
+    print(f"Queue, {num_items} items enqueued then dequeued")
+    for label, run in (
+        ("linkedlist enqueue/dequeue", lambda: single(Queue())),
+        ("ring_buffer enqueue/dequeue", lambda: single(Queue(backend="ring_buffer"))),
+        (f"linkedlist *_many({batch_size})", lambda: batched(Queue())),
+        (f"ring_buffer *_many({batch_size})", lambda: batched(Queue(backend="ring_buffer"))),
+        ("collections.deque append/popleft", builtin_deque),
+    ):
+        start = time.perf_counter()
+        run()
+        seconds = time.perf_counter() - start
+        print(f"{label:>34}: {seconds:7.3f} s ({2 * num_items / seconds / 1e6:6.2f} M ops/s)")
+
 if __name__ == "__main__":
-    _functional_test_script()
\ No newline at end of file
+    _functional_test_script()
+    _benchmark_script()
\ No newline at end of file
@@ -0,0 +1,334 @@
+"""
+10/18/2026: J. BRANCH
+
+The goal is to create an implementation for a growable RingBuffer data structure from 'scratch', used as an O(1) backend for the queues.
+
+Plan:
+    - Datamodel:
+        (class) RingBuffer
+
+        RingBuffer
+            |
+        Python list (capacity is a power of two)
+            |
+   list[0] ... list[head] ... list[(head + size - 1) & mask] ... list[capacity-1]
+
+    - RingBuffer class
+        - contains a Python list member (the buffer) whose length (capacity) is always a power of two, so wrapping an index is a bitwise
+          and with mask (capacity - 1) instead of a modulo
+        - contains a head index (the first element) and a size member, the element at logical index i is at buffer[(head + i) & mask]
+        - grows (doubles) when an element is added to a full buffer and shrinks (halves, never below the initial capacity) once
+          a removal leaves it at most a quarter full, so every operation is O(1) amortized and memory stays proportional to size
+        - removed slots are reset to None, so the buffer never keeps removed values alive
+        - contains a version member that is incremented by every change in size, iterators raise RuntimeError if it changes during iteration
+
+        - Public Methods:
+            1. append(self, value: Any): Adds value at the end, growing the buffer if it is full
+                return: None
+
+            2. prepend(self, value: Any): Adds value at the beginning, growing the buffer if it is full
+                return: None
+
+            3. pop(self): Removes and returns the last value, returns None if empty
+                return: Any or None
+
+            4. pop_first(self): Removes and returns the first value, returns None if empty
+                return: Any or None
+
+            5. pop_first_many(self, count: int): Removes and returns up to count values from the front (copied out with at most two slices)
+                return: list[Any]
+
+            6. peek_first(self): Returns the first value without removing it, returns None if empty
+                return: Any or None
+
+            7. peek_last(self): Returns the last value without removing it, returns None if empty
+                return: Any or None
+
+            8. extend(self, values: Iterable[Any]): Appends every value, growing the buffer at most once and copying with at most two slice assignments
+                return: None
+
+            9. extend_front(self, values: Iterable[Any]): Prepends every value in turn (so they end up in reverse order, as deque.extendleft),
+                growing the buffer at most once
+                return: None
+
+            10. rotate(self, steps: int = 1): Rotates the values steps places to the right (to the left if negative), as deque.rotate.
+                Moves min(steps, size - steps) values with slice copies, or only moves head when the buffer is full
+                return: None
+
+            11. to_list(self): Returns a Python list of the values from first to last
+                return: list[Any]
+
+            12. clear(self): Removes every value and resets the buffer to its initial capacity
+                return: None
+
+            13. __len__(self): Dunder method to implement len(obj) functionality
+                return: int
+
+            14. __iter__(self): Dunder method to make object iterable, lazily yields the values from first to last
+                return: iterator
+
+            15. __getitem__(self, index: int) / __setitem__(self, index: int, value: Any): O(1) indexed access (negative indices count from the end),
+                raises IndexError if out of range
+                return: Any / None
+
+            16. __repr__(self): Dunder method to implement repr(obj) functionality
+                return: str
+
+        - Internal Methods:
+            17. _resize(self, capacity: int): Copies the values (unwrapped, head at 0) into a new buffer of the given power-of-two capacity
+                return: None
+
+            18. _maybe_shrink(self): Halves the buffer while it is at most a quarter full and above its initial capacity
+                return: None
+
+            19. _read(self, start: int, count: int): Returns count values of the buffer from slot start on, wrapping with at most two slices
+                return: list[Any]
+
+            20. _write(self, start: int, values: list[Any]): Copies values into the buffer from slot start on, wrapping with at most two slice assignments
+                return: None
+
+            21. _slot(self, index: int): Validates a logical index (negative counts from the end) and returns its buffer slot
+                return: int
+"""
+from typing import Any, Iterable, Iterator
+
+def _next_power_of_two(value: int) -> int:
+    return 1 << max(value - 1, 0).bit_length()
+
+
+class RingBuffer:
+    def __init__(self, capacity: int = 8):
+        if (type(capacity) is not int) or (capacity < 1):
+            raise ValueError("capacity must be an int greater than 0.")
+        self.min_capacity: int = _next_power_of_two(capacity)
+        self.buffer: list[Any] = [None] * self.min_capacity
+        self.mask: int = self.min_capacity - 1
+        self.head: int = 0
+        self.size: int = 0
+        self._version: int = 0
+
+    def append(self, value: Any) -> None:
+        """Adds value at the end, growing the buffer if it is full"""
+        if self.size == len(self.buffer):
+            self._resize(len(self.buffer) << 1)
+        self.buffer[(self.head + self.size) & self.mask] = value
+        self.size += 1
+        self._version += 1
+        return None
+
+    def prepend(self, value: Any) -> None:
+        """Adds value at the beginning, growing the buffer if it is full"""
+        if self.size == len(self.buffer):
+            self._resize(len(self.buffer) << 1)
+        self.head = (self.head - 1) & self.mask
+        self.buffer[self.head] = value
+        self.size += 1
+        self._version += 1
+        return None
+
+    def pop(self) -> Any | None:
+        """Removes and returns the last value, returns None if empty"""
+        if self.size == 0:
+            return None
+        tail: int = (self.head + self.size - 1) & self.mask
+        value: Any = self.buffer[tail]
+        self.buffer[tail] = None
+        self.size -= 1
+        self._version += 1
+        if (self.size <= len(self.buffer) >> 2) and (len(self.buffer) > self.min_capacity):
+            self._maybe_shrink()
+        return value
+
+    def pop_first(self) -> Any | None:
+        """Removes and returns the first value, returns None if empty"""
+        if self.size == 0:
+            return None
+        head: int = self.head
+        value: Any = self.buffer[head]
+        self.buffer[head] = None
+        self.head = (head + 1) & self.mask
+        self.size -= 1
+        self._version += 1
+        if (self.size <= len(self.buffer) >> 2) and (len(self.buffer) > self.min_capacity):
+            self._maybe_shrink()
+        return value
+
+    def pop_first_many(self, count: int) -> list[Any]:
+        """Removes and returns up to count values from the front, the values are copied out (and their slots cleared) with at most two slices"""
+        if (type(count) is not int) or (count < 0):
+            raise ValueError("count must be a non-negative int.")
+        count = min(count, self.size)
+        if count == 0:
+            return []
+        values: list[Any] = self._read(self.head, count)
+        self._write(self.head, [None] * count)
+        self.head = (self.head + count) & self.mask
+        self.size -= count
+        self._version += 1
+        self._maybe_shrink()
+        return values
+
+    def peek_first(self) -> Any | None:
+        """Returns the first value without removing it, returns None if empty"""
+        if self.size == 0:
+            return None
+        return self.buffer[self.head]
+
+    def peek_last(self) -> Any | None:
+        """Returns the last value without removing it, returns None if empty"""
+        if self.size == 0:
+            return None
+        return self.buffer[(self.head + self.size - 1) & self.mask]
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Appends every value, the buffer grows at most once and the values are copied in with at most two slice assignments"""
+        values = list(values)
+        count: int = len(values)
+        if count == 0:
+            return None
+        if self.size + count > len(self.buffer):
+            self._resize(_next_power_of_two(self.size + count))
+        self._write((self.head + self.size) & self.mask, values)
+        self.size += count
+        self._version += 1
+        return None
+
+    def extend_front(self, values: Iterable[Any]) -> None:
+        """Prepends every value in turn, so they end up in reverse order (as deque.extendleft).
+            The buffer grows at most once and the values are copied in with at most two slice assignments
+        """
+        values = list(values)
+        count: int = len(values)
+        if count == 0:
+            return None
+        if self.size + count > len(self.buffer):
+            self._resize(_next_power_of_two(self.size + count))
+        values.reverse()
+        self.head = (self.head - count) & self.mask
+        self._write(self.head, values)
+        self.size += count
+        self._version += 1
+        return None
+
+    def rotate(self, steps: int = 1) -> None:
+        """Rotates the values steps places to the right (to the left if negative), as deque.rotate.
+            A full buffer only moves head, otherwise min(steps, size - steps) values are moved across the gap with slice copies
+        """
+        if self.size < 2:
+            return None
+        steps %= self.size
+        if steps == 0:
+            return None
+        if self.size == len(self.buffer):
+            self.head = (self.head - steps) & self.mask
+        elif steps <= self.size >> 1: # move the last steps values in front of head
+            tail_start: int = (self.head + self.size - steps) & self.mask
+            values: list[Any] = self._read(tail_start, steps)
+            self._write(tail_start, [None] * steps)
+            self.head = (self.head - steps) & self.mask
+            self._write(self.head, values)
+        else: # move the first size - steps values after the last value
+            count: int = self.size - steps
+            values = self._read(self.head, count)
+            self._write(self.head, [None] * count)
+            self._write((self.head + self.size) & self.mask, values)
+            self.head = (self.head + count) & self.mask
+        self._version += 1
+        return None
+
+    def to_list(self) -> list[Any]:
+        """Returns a Python list of the values from first to last"""
+        return self._read(self.head, self.size)
+
+    def clear(self) -> None:
+        """Removes every value and resets the buffer to its initial capacity"""
+        self.buffer = [None] * self.min_capacity
+        self.mask = self.min_capacity - 1
+        self.head = 0
+        self.size = 0
+        self._version += 1
+        return None
+
+    def __len__(self) -> int:
+        """Dunder method to implement len(obj) functionality"""
+        return self.size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Dunder method to make object iterable, lazily yields the values from first to last"""
+        version: int = self._version
+        for offset in range(self.size):
+            yield self.buffer[(self.head + offset) & self.mask]
+            if self._version != version:
+                raise RuntimeError("RingBuffer changed size during iteration")
+
+    def __getitem__(self, index: int) -> Any:
+        """Dunder method to implement ring[index] in O(1) (negative indices count from the end, raises IndexError if out of range)"""
+        return self.buffer[self._slot(index)]
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        """Dunder method to implement ring[index] = value in O(1) (negative indices count from the end, raises IndexError if out of range)"""
+        self.buffer[self._slot(index)] = value
+
+    def __repr__(self) -> str:
+        """Dunder method to implement repr(obj) functionality"""
+        return f"class_name=RingBuffer, id={id(self)}, size={self.size}, capacity={len(self.buffer)}, first={self.peek_first()}"
+
+    def _resize(self, capacity: int) -> None:
+        """Copies the values (unwrapped, head at index 0) into a new buffer of the given power-of-two capacity"""
+        values: list[Any] = self.to_list()
+        values.extend([None] * (capacity - self.size))
+        self.buffer = values
+        self.mask = capacity - 1
+        self.head = 0
+        return None
+
+    def _maybe_shrink(self) -> None:
+        """Halves the buffer while it is at most a quarter full and above its initial capacity"""
+        capacity: int = len(self.buffer)
+        while (self.size <= capacity >> 2) and (capacity > self.min_capacity):
+            capacity >>= 1
+        if capacity != len(self.buffer):
+            self._resize(capacity)
+        return None
+
+    def _read(self, start: int, count: int) -> list[Any]:
+        """Returns count values of the buffer from slot start on, wrapping around with at most two slices"""
+        end: int = start + count
+        if end <= len(self.buffer):
+            return self.buffer[start:end]
+        return self.buffer[start:] + self.buffer[:end - len(self.buffer)]
+
+    def _write(self, start: int, values: list[Any]) -> None:
+        """Copies values into the buffer from slot start on, wrapping around with at most two slice assignments"""
+        count: int = len(values)
+        first_part: int = min(count, len(self.buffer) - start)
+        self.buffer[start:start + first_part] = values[:first_part]
+        if first_part < count:
+            self.buffer[:count - first_part] = values[first_part:]
+        return None
+
+    def _slot(self, index: int) -> int:
+        """Validates a logical index (negative indices count from the end) and returns its slot in the buffer"""
+        if index < 0:
+            index += self.size
+        if not (0 <= index < self.size):
+            raise IndexError("RingBuffer index out of range")
+        return (self.head + index) & self.mask
+
+#--------------------------------------------------------
+def _functional_test_script():
+    TEST_VALS = (-100, -10, 0, 10, 20, 30, 40, 50, 60)
+    ring = RingBuffer(capacity=4)
+
+    for val in TEST_VALS:
+        print(f"Attempting to append value: {val}")
+        ring.append(val)
+    print("\n", repr(ring), "\n")
+
+    print(f"Values returned from ring.pop_first_many(3): {ring.pop_first_many(3)}")
+    for _ in range(len(ring)):
+        print(f"Value returned from ring.pop_first(): {ring.pop_first()}")
+    print("\n", repr(ring))
+
+if __name__ == "__main__":
+    _functional_test_script()
@@ -0,0 +1,413 @@
+"""
+10/18/2026: J. BRANCH
+
+The goal is to create a HashMap from 'scratch' whose key space is partitioned across worker processes, so one map can use every core of the machine.
+
+Plan:
+    - Datamodel:
+        (composite class) ShardedHashMap
+        (composite class) HashMap (one per worker process)
+
+        ShardedHashMap (client, owning process)
+            |
+        shards: [ (Process, SharedMemory, request Semaphore, response Semaphore, Lock), ..., ]
+                      |
+                  worker process: HashMap holding every key routed to the shard
+
+    - A HashMap is a graph of Python objects, so it cannot itself live in shared memory. Every shard's HashMap lives in the heap
+      of the worker process that owns it and each shard has a multiprocessing.shared_memory segment that carries its requests and
+      responses: the client writes a length-prefixed pickled request into the segment and releases the request semaphore, the worker
+      executes it against its HashMap, writes the pickled response into the same segment and releases the response semaphore
+      (payloads are copied once into shared memory instead of being pushed through a pipe)
+        segment layout: [ payload length (uint64, little-endian) | pickled (op, args) or (ok, result) ]
+    - Keys are routed to shard hash(key) % num_shards (routing only happens in the owning process, so per-process str hash
+      randomization does not matter)
+    - Batched requests (add_many/get_many/delete_many) are grouped per shard and sent to every involved shard before any response
+      is awaited, so the shards work on their part of the batch in parallel; per-shard groups larger than batch_size are split
+      into rounds of batch_size items
+    - Each shard has a lock in the client, so a ShardedHashMap can be shared by threads of the owning process.
+      Batched requests take the locks of every shard they touch (in shard order) for the whole batch.
+    - Errors raised by a worker (KeyError, TypeError, ValueError) are sent back and re-raised by the client. If part of a batch
+      cannot be sent (e.g. too large for the shard buffer), the responses of the shards already sent to are collected first
+
+    - Public Methods:
+        1. add(self, key: ImmutableType, value: Any): Adds the k-v pair on the owning shard, see HashMap.add
+            return: None
+
+        2. get(self, key: ImmutableType, default(*optional)): Returns the value for the key if it exists, else returns default (None)
+            return: Any
+
+        3. delete(self, key: ImmutableType, target_value(*optional)): Removes the k-v pair, see HashMap.delete
+            return: None(*raises KeyError if key is not found)
+
+        4. add_many(self, kv_pairs: Iterable[tuple[ImmutableType, Any]]): Batched add, nothing is added if any pair is invalid
+            return: None
+
+        5. get_many(self, keys: Iterable[ImmutableType], default(*optional)): Batched get, results are in the same order as keys
+            return: list[Any]
+
+        6. delete_many(self, keys: Iterable[ImmutableType]): Batched delete, nothing is deleted if any key is missing
+            return: None(*raises KeyError if a key is not found)
+
+        7. items(self): Returns a list of every (key, value) pair, each shard sends its pairs in pages of batch_size pairs
+            return: list[tuple[ImmutableType, Any]]
+
+        8. clear(self): Removes every k-v pair from every shard
+            return: None
+
+        9. close(self): Stops the worker processes and releases the shared memory segments, also called by the context manager
+            return: None
+
+        10. __len__ / __contains__ / __getitem__ / __setitem__ / __delitem__ / __repr__ / __enter__ / __exit__: Dunder methods
+"""
+from typing import Any, Iterable
+from multiprocessing import shared_memory
+import multiprocessing
+import os
+import pickle
+import struct
+import threading
+import time
+
+if not __package__: # run as a script, or imported by a module run as a script
+    from hashmap import HashMap, ImmutableType
+else:
+    from src.hashmap import HashMap, ImmutableType
+
+_LENGTH = struct.Struct("<Q")
+
+def _write_message(buffer: memoryview, message: Any) -> None:
+    """Writes the length-prefixed pickled message to the start of the shared memory buffer"""
+    payload: bytes = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    if _LENGTH.size + len(payload) > len(buffer):
+        raise ValueError(f"message of {len(payload)} bytes does not fit in the shard buffer of {len(buffer)} bytes.")
+    _LENGTH.pack_into(buffer, 0, len(payload))
+    buffer[_LENGTH.size:_LENGTH.size + len(payload)] = payload
+
+def _read_message(buffer: memoryview) -> Any:
+    (length,) = _LENGTH.unpack_from(buffer, 0)
+    return pickle.loads(buffer[_LENGTH.size:_LENGTH.size + length])
+
+def _execute(hashmap: HashMap, op: str, args: tuple, snapshot: list) -> Any:
+    """Runs one request against the worker's HashMap, snapshot holds the pairs an items listing is paging through"""
+    if op == "add":
+        return hashmap.add(*args)
+    elif op == "get":
+        return hashmap.get(*args)
+    elif op == "getitem":
+        return hashmap[args[0]]
+    elif op == "delete":
+        return hashmap.delete(*args)
+    elif op == "add_many":
+        return hashmap.add_many(*args)
+    elif op == "get_many":
+        (keys, default) = args
+        return [hashmap.get(key, default) for key in keys]
+    elif op == "contains":
+        return args[0] in hashmap
+    elif op == "find_missing":
+        (keys,) = args
+        return [key for key in keys if key not in hashmap]
+    elif op == "delete_many":
+        return hashmap.delete_many(*args)
+    elif op == "len":
+        return len(hashmap)
+    elif op == "items":
+        (start, count) = args
+        if start == 0:
+            snapshot[:] = hashmap.items()
+        page: list[tuple[ImmutableType, Any]] = snapshot[start:start + count]
+        if start + count >= len(snapshot): # last page
+            snapshot.clear()
+        return page
+    elif op == "clear":
+        return hashmap.clear()
+    raise ValueError(f"unknown shard operation {op!r}.")
+
+def _shard_worker(shm: shared_memory.SharedMemory, request_sem, response_sem, hashmap_kwargs: dict) -> None:
+    """Worker process loop: owns one HashMap shard and serves requests written into its shared memory segment"""
+    hashmap = HashMap(**hashmap_kwargs)
+    snapshot: list[tuple[ImmutableType, Any]] = []
+    buffer: memoryview = shm.buf
+    try:
+        while True:
+            request_sem.acquire()
+            op, args = _read_message(buffer)
+            if op == "close":
+                break
+            try:
+                response: tuple[bool, Any] = (True, _execute(hashmap, op, args, snapshot))
+            except Exception as error:
+                response = (False, error)
+            try:
+                _write_message(buffer, response)
+            except ValueError as error:
+                _write_message(buffer, (False, error))
+            response_sem.release()
+    finally:
+        del buffer
+        shm.close()
+        response_sem.release()
+
+class ShardedHashMap:
+    def __init__(self, num_shards: int | None = None, buffer_size: int = 1 << 22, batch_size: int = 4096, **hashmap_kwargs):
+        if num_shards is None:
+            num_shards = os.cpu_count() or 1
+        if (type(num_shards) is not int) or (type(buffer_size) is not int) or (type(batch_size) is not int):
+            raise TypeError("num_shards, buffer_size and batch_size for the ShardedHashMap object must be specified as int.")
+        if (num_shards < 1) or (buffer_size <= _LENGTH.size) or (batch_size < 1):
+            raise ValueError("num_shards and batch_size for ShardedHashMap must be greater than 0 and buffer_size must be greater than 8.")
+        if hashmap_kwargs.get("multimap"):
+            raise ValueError("ShardedHashMap does not support multimap mode, containers returned by get would be copies.")
+        self.num_shards: int = num_shards
+        self.batch_size: int = batch_size
+        self._closed: bool = False
+        self._locks: list[threading.Lock] = [threading.Lock() for _ in range(num_shards)]
+        self._segments: list[shared_memory.SharedMemory] = []
+        self._request_sems: list = []
+        self._response_sems: list = []
+        self._processes: list[multiprocessing.Process] = []
+
+        context = multiprocessing.get_context()
+        try:
+            for _ in range(num_shards):
+                shm = shared_memory.SharedMemory(create=True, size=buffer_size)
+                self._segments.append(shm)
+                request_sem, response_sem = context.Semaphore(0), context.Semaphore(0)
+                self._request_sems.append(request_sem)
+                self._response_sems.append(response_sem)
+                process = context.Process(target=_shard_worker, args=(shm, request_sem, response_sem, hashmap_kwargs), daemon=True)
+                process.start()
+                self._processes.append(process)
+        except BaseException:
+            self.close()
+            raise
+
+    def add(self, key: ImmutableType, value: Any) -> None:
+        """Adds the k-v pair on the owning shard, see HashMap.add"""
+        self._request(self._shard(key), "add", (key, value))
+        return None
+
+    def get(self, key: ImmutableType, default: Any | None = None) -> Any | None:
+        """Returns the value for the key if it exists, else returns default (None)"""
+        return self._request(self._shard(key), "get", (key, default))
+
+    def delete(self, key: ImmutableType, target_value: Any | None = None) -> None:
+        """Removes the k-v pair, see HashMap.delete. Raises KeyError if the key is not found."""
+        self._request(self._shard(key), "delete", (key, target_value))
+        return None
+
+    def add_many(self, kv_pairs: Iterable[tuple[ImmutableType, Any]]) -> None:
+        """Batched add. Every pair is validated before anything is sent, so nothing is added if any pair is invalid."""
+        groups: list[list[tuple[ImmutableType, Any]]] = [[] for _ in range(self.num_shards)]
+        for key, value in kv_pairs:
+            if value is None:
+                raise ValueError
+            groups[self._shard(key)].append((key, value))
+        self._scatter("add_many", groups, lambda chunk: (chunk,))
+        return None
+
+    def get_many(self, keys: Iterable[ImmutableType], default: Any | None = None) -> list[Any | None]:
+        """Batched get, results are returned in the same order as keys"""
+        keys = list(keys)
+        shards: list[int] = [self._shard(key) for key in keys]
+        groups: list[list[ImmutableType]] = [[] for _ in range(self.num_shards)]
+        for key, shard in zip(keys, shards):
+            groups[shard].append(key)
+        shard_results: list[Iterable[Any]] = [iter(results) for results in
+                                              self._scatter("get_many", groups, lambda chunk: (chunk, default))]
+        return [next(shard_results[shard]) for shard in shards]
+
+    def delete_many(self, keys: Iterable[ImmutableType]) -> None:
+        """Batched delete. Every involved shard stays locked while the keys are checked and then deleted,
+            so if a key is missing a KeyError is raised and nothing is deleted.
+        """
+        groups: list[list[ImmutableType]] = [[] for _ in range(self.num_shards)]
+        for key in keys:
+            groups[self._shard(key)].append(key)
+        involved: list[int] = [shard for shard in range(self.num_shards) if groups[shard]]
+        for shard in involved:
+            self._locks[shard].acquire()
+        try:
+            for missing in self._scatter("find_missing", groups, lambda chunk: (chunk,), locked=True):
+                if missing:
+                    raise KeyError(missing[0])
+            self._scatter("delete_many", groups, lambda chunk: (chunk,), locked=True)
+        finally:
+            for shard in involved:
+                self._locks[shard].release()
+        return None
+
+    def items(self) -> list[tuple[ImmutableType, Any]]:
+        """Returns a list of every (key, value) pair, grouped by shard"""
+        kv_pairs: list[tuple[ImmutableType, Any]] = []
+        for shard in range(self.num_shards):
+            with self._locks[shard]: # the shard's pairs are paged out of one snapshot, batch_size pairs per response
+                start: int = 0
+                while True:
+                    self._send(shard, "items", (start, self.batch_size))
+                    page: list[tuple[ImmutableType, Any]] = self._receive(shard)
+                    kv_pairs.extend(page)
+                    if len(page) < self.batch_size:
+                        break
+                    start += self.batch_size
+        return kv_pairs
+
+    def clear(self) -> None:
+        """Removes every k-v pair from every shard"""
+        for shard in range(self.num_shards):
+            self._request(shard, "clear", ())
+        return None
+
+    def close(self) -> None:
+        """Stops the worker processes and releases the shared memory segments"""
+        if self._closed:
+            return None
+        self._closed = True
+        for shard, process in enumerate(self._processes):
+            with self._locks[shard]:
+                if process.is_alive():
+                    _write_message(self._segments[shard].buf, ("close", None))
+                    self._request_sems[shard].release()
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+        for shm in self._segments:
+            shm.close()
+            shm.unlink()
+        return None
+
+    def __enter__(self) -> "ShardedHashMap":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Dunder method to implement len(obj) functionality"""
+        return sum(self._request(shard, "len", ()) for shard in range(self.num_shards))
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, (str, int, tuple)):
+            return False
+        return self._request(self._shard(key), "contains", (key,))
+
+    def __getitem__(self, key: ImmutableType) -> Any:
+        """Returns the same value as get but raises KeyError if the key is not found (the worker's HashMap.__getitem__)"""
+        return self._request(self._shard(key), "getitem", (key,))
+
+    def __setitem__(self, key: ImmutableType, value: Any) -> None:
+        self.add(key, value)
+
+    def __delitem__(self, key: ImmutableType) -> None:
+        self.delete(key)
+
+    def __repr__(self) -> str:
+        """Dunder method to implement repr(obj) functionality"""
+        return f"class_name=ShardedHashMap, id={id(self)}, num_shards={self.num_shards}, closed={self._closed}"
+
+    def _shard(self, key: ImmutableType) -> int:
+        """Returns the index of the shard owning the key"""
+        if not isinstance(key, (str, int, tuple)):
+            raise TypeError
+        return hash(key) % self.num_shards
+
+    def _send(self, shard: int, op: str, args: tuple) -> None:
+        if self._closed:
+            raise ValueError("operation on a closed ShardedHashMap.")
+        _write_message(self._segments[shard].buf, (op, args))
+        self._request_sems[shard].release()
+
+    def _receive(self, shard: int) -> Any:
+        while not self._response_sems[shard].acquire(timeout=1.0):
+            if not self._processes[shard].is_alive():
+                raise RuntimeError(f"the worker process of shard {shard} exited.")
+        ok, result = _read_message(self._segments[shard].buf)
+        if not ok:
+            raise result
+        return result
+
+    def _request(self, shard: int, op: str, args: tuple) -> Any:
+        """Sends one request to the shard and waits for its response"""
+        with self._locks[shard]:
+            self._send(shard, op, args)
+            return self._receive(shard)
+
+    def _scatter(self, op: str, groups: list[list], make_args, locked: bool = False) -> list[Any]:
+        """Sends op for every non-empty group to its shard, in rounds of batch_size items, and gathers the responses.
+            Returns one list per shard, the concatenated (list) results of the shard's rounds.
+            Every involved shard is locked for the whole batch unless the caller already holds the locks.
+        """
+        involved: list[int] = [shard for shard in range(self.num_shards) if groups[shard]]
+        results: list[list[Any]] = [[] for _ in range(self.num_shards)]
+        if not locked:
+            for shard in involved:
+                self._locks[shard].acquire()
+        try:
+            for start in range(0, max((len(groups[shard]) for shard in involved), default=0), self.batch_size):
+                sent: list[int] = []
+                error: BaseException | None = None
+                try:
+                    for shard in involved:
+                        chunk: list = groups[shard][start:start + self.batch_size]
+                        if chunk:
+                            self._send(shard, op, make_args(chunk))
+                            sent.append(shard)
+                except BaseException:
+                    # collect the responses of the shards already sent to, so later requests do not read them
+                    for shard in sent:
+                        try:
+                            self._receive(shard)
+                        except Exception:
+                            pass
+                    raise
+                for shard in sent:
+                    try:
+                        result: Any = self._receive(shard)
+                    except Exception as shard_error:
+                        error = error or shard_error
+                        continue
+                    if result is not None:
+                        results[shard].extend(result)
+                if error is not None:
+                    raise error
+        finally:
+            if not locked:
+                for shard in involved:
+                    self._locks[shard].release()
+        return results
+
+#--------------------------------------------------------
+def _benchmark_script(num_keys: int = 200_000, shard_counts: tuple[int, ...] = (1, 2, 4, 8)):
+    """Compares batched and per-key throughput of ShardedHashMap with a single in-process HashMap"""
+    kv_pairs = [(f"key{i}", i+1) for i in range(num_keys)]
+    keys = [key for key, _ in kv_pairs]
+    print(f"cpu count: {os.cpu_count()}, keys: {num_keys}")
+
+    hashmap = HashMap()
+    start = time.perf_counter()
+    hashmap.add_many(kv_pairs)
+    add_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    hashmap.get_many(keys)
+    get_seconds = time.perf_counter() - start
+    print(f"{'HashMap':>22}: add_many {num_keys / add_seconds:>10.0f} ops/s, get_many {num_keys / get_seconds:>10.0f} ops/s")
+
+    for num_shards in shard_counts:
+        with ShardedHashMap(num_shards=num_shards) as sharded:
+            start = time.perf_counter()
+            sharded.add_many(kv_pairs)
+            add_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            sharded.get_many(keys)
+            get_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            for key in keys[:10_000]:
+                sharded.get(key)
+            single_seconds = time.perf_counter() - start
+        print(f"{f'ShardedHashMap({num_shards})':>22}: add_many {num_keys / add_seconds:>10.0f} ops/s, get_many {num_keys / get_seconds:>10.0f} ops/s,"
+              f" get {10_000 / single_seconds:>8.0f} ops/s")
+
+if __name__ == "__main__":
+    _benchmark_script()
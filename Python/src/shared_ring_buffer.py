@@ -0,0 +1,360 @@
+"""
+10/18/2026: J. BRANCH
+
+The goal is to create a ring buffer of fixed-size byte records from 'scratch' that lives in multiprocessing.shared_memory,
+so processes can hand records to each other without pickling them through pipes.
+
+Plan:
+    - Datamodel:
+        (class) SharedRingBuffer
+
+        SharedRingBuffer (any process attached to the segment)
+            |
+        SharedMemory segment:
+            [ capacity | record_size | flags | ... ]  [ head | ... ]  [ tail | overwritten | ... ]  [ slot 0 ] [ slot 1 ] ... [ slot capacity-1 ]
+              header (64 bytes)                       producer line    consumer line                 slot: [ sequence | length | record_size bytes ]
+
+    - head (records ever written) is only written by the producer and tail (records ever read) only by the consumer, each on its own
+      64-byte line so the two processes do not keep invalidating each other's cache line. Position p lives in slot p % capacity
+    - Every slot carries a sequence number: the producer sets it to 0 while it writes the slot and to p + 1 once the record at
+      position p is complete, then publishes head = p + 1. The consumer only trusts a record whose sequence is p + 1 before and after
+      it copies the record out, so it never returns a half-written record
+    - Same capacity/overwrite_if_full semantics as CircularQueue:
+        - overwrite_if_full=False: enqueue raises OverflowError when capacity records are unread
+        - overwrite_if_full=True: the producer never waits or reads tail, it overwrites the oldest records. The consumer notices
+          records that were (or are being) overwritten from their sequence numbers, skips them and counts them in overwritten
+    - SPSC (default) is lock-free: one producer process and one consumer process, the only shared writes are whole 8-byte words
+      (head, tail, sequence numbers), written through a memoryview cast to unsigned 64-bit words so they are single aligned stores.
+      Both modes rely on aligned 8-byte stores being atomic and on stores becoming visible to other processes in program order, so
+      they require x86-64 (or another total store order CPU): on weakly ordered CPUs (e.g. ARM) a consumer could see head before
+      the record it publishes, and the two MPMC locks do not order a producer's stores against a consumer's loads either.
+      Creating or attaching a ring raises RuntimeError if platform.machine() is not an x86 CPU.
+      Without overwrite_if_full a slot whose sequence does not match yet is treated as not yet published, never skipped
+    - mpmc=True allows several producers and several consumers: producers serialize on one multiprocessing.Lock and consumers on
+      another, so a producer and a consumer still never wait for each other. MPMC rings can only be shared with child processes
+      (the locks are passed when the process is started), SPSC rings can also be attached by name with attach(name)
+    - The creating process owns the segment: its close() unlinks it, close() in any other process only detaches. Other processes
+      attach without registering the segment with their resource tracker, otherwise (before Python 3.13) the tracker would
+      unlink it when the attached process exits
+
+    - Public Methods:
+        1. enqueue(self, record: bytes): Copies record (at most record_size bytes) into the next slot, raises OverflowError if full
+            (without overwrite_if_full) and ValueError if the record is too long
+            return: None
+
+        2. dequeue(self): Removes and returns the oldest record, raises IndexError if empty
+            return: bytes
+
+        3. enqueue_many(self, records: Iterable[bytes]): Enqueues every record and publishes them with one head update, nothing is
+            enqueued if they do not all fit (without overwrite_if_full) or one is too long
+            return: None
+
+        4. dequeue_many(self, max_items: int): Removes and returns up to max_items records with one tail update
+            return: list[bytes]
+
+        5. attach(cls, name: str): Classmethod, attaches to an existing SPSC ring by its shared memory name
+            return: SharedRingBuffer
+
+        6. is_empty(self) / is_full(self): Snapshot of the ring state
+            return: bool
+
+        7. close(self): Detaches from the segment, the creating process also unlinks it, also called by the context manager
+            return: None
+
+        8. __len__ / __repr__ / __enter__ / __exit__ / __getstate__ / __setstate__: Dunder methods, pickling a ring (e.g. as a
+            multiprocessing.Process argument) attaches the copy to the same segment
+"""
+from typing import Any, Iterable
+from multiprocessing import resource_tracker, shared_memory
+import multiprocessing
+import os
+import platform
+import sys
+
+_HEADER_BYTES = 192 # header line, producer line, consumer line
+_CAPACITY, _RECORD_SIZE, _FLAGS, _HEAD, _TAIL, _OVERWRITTEN = 0, 1, 2, 8, 16, 17 # word offsets
+_OVERWRITE_FLAG, _MPMC_FLAG = 1, 2
+_SLOT_HEADER_BYTES = 16 # sequence and length words
+_TSO_MACHINES = frozenset(("x86_64", "amd64", "i386", "i486", "i586", "i686", "x86")) # total store order CPUs
+
+def _check_store_order() -> None:
+    """Raises RuntimeError on CPUs without total store order, where the lock-free protocol could return unpublished records"""
+    machine: str = platform.machine()
+    if machine.lower() not in _TSO_MACHINES:
+        raise RuntimeError(f"SharedRingBuffer requires an x86 (total store order) CPU, this machine is {machine or 'unknown'!r}.")
+
+def _open_segment(name: str) -> shared_memory.SharedMemory:
+    """Attaches to an existing segment without leaving it registered with this process's resource tracker,
+        which (before Python 3.13) would unlink the segment as soon as this process exits
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+class SharedRingBuffer:
+    def __init__(self, capacity: int, record_size: int, overwrite_if_full: bool = False, mpmc: bool = False):
+        if (type(capacity) is not int) or (type(record_size) is not int):
+            raise TypeError("capacity and record_size for the SharedRingBuffer object must be specified as int.")
+        if (capacity < 1) or (record_size < 1):
+            raise ValueError("capacity and record_size for SharedRingBuffer must be greater than 0.")
+        _check_store_order()
+        slot_size: int = _SLOT_HEADER_BYTES + ((record_size + 7) & ~7)
+        shm = shared_memory.SharedMemory(create=True, size=_HEADER_BYTES + capacity * slot_size)
+        words = shm.buf.cast("Q")
+        words[_CAPACITY] = capacity
+        words[_RECORD_SIZE] = record_size
+        words[_FLAGS] = (_OVERWRITE_FLAG if overwrite_if_full else 0) | (_MPMC_FLAG if mpmc else 0)
+        words.release()
+        self._owner_pid: int | None = os.getpid()
+        locks: tuple[Any, Any] | None = (multiprocessing.Lock(), multiprocessing.Lock()) if mpmc else None
+        self._attach(shm, locks)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedRingBuffer":
+        """Attaches to an existing SPSC ring by its shared memory name (MPMC rings must be passed to child processes instead)"""
+        _check_store_order()
+        ring = cls.__new__(cls)
+        shm = _open_segment(name)
+        if shm.buf.cast("Q")[_FLAGS] & _MPMC_FLAG:
+            shm.close()
+            raise ValueError("MPMC rings can only be shared with child processes, their locks cannot be attached by name.")
+        ring._owner_pid = None
+        ring._attach(shm, None)
+        return ring
+
+    def enqueue(self, record: bytes) -> None:
+        """Copies record into the next slot. Raises OverflowError if capacity records are unread (without overwrite_if_full)
+            and ValueError if the record is longer than record_size
+        """
+        if len(record) > self.record_size:
+            raise ValueError(f"record of {len(record)} bytes is longer than record_size {self.record_size}.")
+        if self._producer_lock is None:
+            self._enqueue_records((record,))
+        else:
+            with self._producer_lock:
+                self._enqueue_records((record,))
+        return None
+
+    def dequeue(self) -> bytes:
+        """Removes and returns the oldest record, raises IndexError if empty"""
+        records: list[bytes] = self.dequeue_many(1)
+        if not records:
+            raise IndexError("Cannot dequeue from an empty SharedRingBuffer.")
+        return records[0]
+
+    def enqueue_many(self, records: Iterable[bytes]) -> None:
+        """Enqueues every record and publishes them with one head update. Nothing is enqueued if they do not all fit
+            (without overwrite_if_full) or if one of them is longer than record_size
+        """
+        records = list(records)
+        for record in records:
+            if len(record) > self.record_size:
+                raise ValueError(f"record of {len(record)} bytes is longer than record_size {self.record_size}.")
+        if self._producer_lock is None:
+            self._enqueue_records(records)
+        else:
+            with self._producer_lock:
+                self._enqueue_records(records)
+        return None
+
+    def dequeue_many(self, max_items: int) -> list[bytes]:
+        """Removes and returns up to max_items records (fewer if fewer are queued) with one tail update"""
+        if (type(max_items) is not int) or (max_items < 1):
+            raise ValueError("max_items must be an int greater than 0.")
+        if self._consumer_lock is None:
+            return self._dequeue_records(max_items)
+        with self._consumer_lock:
+            return self._dequeue_records(max_items)
+
+    def is_empty(self) -> bool:
+        """Returns True if no record is queued, otherwise returns False"""
+        return len(self) == 0
+
+    def is_full(self) -> bool:
+        """Returns True if capacity records are queued (an enqueue would raise OverflowError without overwrite_if_full)"""
+        return len(self) == self.capacity
+
+    def close(self) -> None:
+        """Detaches from the shared memory segment, the creating process also unlinks it"""
+        if self._shm is None:
+            return None
+        self._words.release()
+        self._bytes.release()
+        self._shm.close()
+        if self._owner_pid == os.getpid():
+            if sys.version_info < (3, 13): # a child sharing our resource tracker drops our registration when it attaches
+                resource_tracker.register(self._shm._name, "shared_memory")
+            self._shm.unlink()
+        self._shm = None
+        return None
+
+    @property
+    def name(self) -> str:
+        """The shared memory segment name, for attach"""
+        return self._name
+
+    @property
+    def overwritten(self) -> int:
+        """Number of records overwritten before they were dequeued (overwrite_if_full only)"""
+        return self._words[_OVERWRITTEN]
+
+    def __len__(self) -> int:
+        """Dunder method to implement len(obj) functionality, a snapshot while other processes are active"""
+        return min(self._words[_HEAD] - self._words[_TAIL], self.capacity)
+
+    def __repr__(self) -> str:
+        """Dunder method to implement repr(obj) functionality"""
+        return f"class_name=SharedRingBuffer, id={id(self)}, name={self._name}, capacity={self.capacity}," \
+            f" record_size={self.record_size}, overwrite_if_full={self.overwrite_if_full}, mpmc={self.mpmc}"
+
+    def __enter__(self) -> "SharedRingBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __getstate__(self) -> tuple:
+        return (self._name, self._producer_lock, self._consumer_lock, self._owner_pid)
+
+    def __setstate__(self, state: tuple) -> None:
+        name, producer_lock, consumer_lock, owner_pid = state
+        _check_store_order()
+        self._owner_pid = owner_pid
+        self._attach(_open_segment(name), (producer_lock, consumer_lock) if producer_lock is not None else None)
+
+    def _attach(self, shm: shared_memory.SharedMemory, locks: tuple[Any, Any] | None) -> None:
+        """Maps the segment and reads the ring geometry from its header"""
+        self._shm: shared_memory.SharedMemory | None = shm
+        self._name: str = shm.name
+        self._words = shm.buf.cast("Q")
+        self._bytes: memoryview = shm.buf[:]
+        self.capacity: int = self._words[_CAPACITY]
+        self.record_size: int = self._words[_RECORD_SIZE]
+        flags: int = self._words[_FLAGS]
+        self.overwrite_if_full: bool = bool(flags & _OVERWRITE_FLAG)
+        self.mpmc: bool = bool(flags & _MPMC_FLAG)
+        self._slot_size: int = _SLOT_HEADER_BYTES + ((self.record_size + 7) & ~7)
+        self._producer_lock, self._consumer_lock = locks if locks is not None else (None, None)
+
+    def _enqueue_records(self, records: Iterable[bytes]) -> None:
+        """Producer side (lock held in MPMC mode): writes the records after head, then publishes the new head"""
+        words, data, capacity, slot_size = self._words, self._bytes, self.capacity, self._slot_size
+        head: int = words[_HEAD]
+        if not isinstance(records, tuple):
+            records = list(records)
+        if (not self.overwrite_if_full) and (head + len(records) - words[_TAIL] > capacity):
+            raise OverflowError("Enqueue attempted after size has reached capacity.")
+        for record in records:
+            offset: int = _HEADER_BYTES + (head % capacity) * slot_size
+            sequence_word: int = offset >> 3
+            words[sequence_word] = 0 # slot being written
+            words[sequence_word + 1] = len(record)
+            data[offset + _SLOT_HEADER_BYTES:offset + _SLOT_HEADER_BYTES + len(record)] = record
+            words[sequence_word] = head + 1 # record at position head is complete
+            head += 1
+        words[_HEAD] = head
+        return None
+
+    def _dequeue_records(self, max_items: int) -> list[bytes]:
+        """Consumer side (lock held in MPMC mode): copies up to max_items records from tail on, then publishes the new tail.
+            Records overwritten before (or while) they were copied are skipped and counted, without overwrite_if_full a record
+            whose sequence does not match yet is never skipped, the copy stops in front of it
+        """
+        words, data, capacity, slot_size = self._words, self._bytes, self.capacity, self._slot_size
+        overwrite_if_full: bool = self.overwrite_if_full
+        tail: int = words[_TAIL]
+        head: int = words[_HEAD]
+        records: list[bytes] = []
+        skipped: int = 0
+        while (len(records) < max_items) and (tail < head):
+            if head - tail > capacity: # lapped by an overwriting producer
+                skipped += head - capacity - tail
+                tail = head - capacity
+            offset: int = _HEADER_BYTES + (tail % capacity) * slot_size
+            sequence_word: int = offset >> 3
+            if words[sequence_word] != tail + 1:
+                if not overwrite_if_full: # not published yet, leave tail on it for the next call
+                    break
+                skipped += 1 # being overwritten, or already overwritten by a newer record
+            else:
+                length: int = words[sequence_word + 1]
+                record: bytes = bytes(data[offset + _SLOT_HEADER_BYTES:offset + _SLOT_HEADER_BYTES + length])
+                if words[sequence_word] == tail + 1: # not overwritten while it was copied
+                    records.append(record)
+                else:
+                    skipped += 1
+            tail += 1
+            if tail == head:
+                head = words[_HEAD]
+        if skipped:
+            words[_OVERWRITTEN] += skipped
+        words[_TAIL] = tail
+        return records
+
+#--------------------------------------------------------
+def _benchmark_producer(ring: SharedRingBuffer, num_records: int, batch_size: int) -> None:
+    record: bytes = bytes(ring.record_size)
+    sent: int = 0
+    while sent < num_records:
+        count: int = min(batch_size, num_records - sent)
+        try:
+            if batch_size == 1:
+                ring.enqueue(record)
+            else:
+                ring.enqueue_many([record] * count)
+            sent += count
+        except OverflowError:
+            os.sched_yield()
+    ring.close()
+
+def _benchmark_consumer(ring: SharedRingBuffer, num_records: int, batch_size: int) -> None:
+    received: int = 0
+    while received < num_records:
+        records: list[bytes] = ring.dequeue_many(min(batch_size, num_records - received))
+        if not records:
+            os.sched_yield()
+        received += len(records)
+    ring.close()
+
+def _benchmark_pipe_producer(queue, num_records: int, record_size: int) -> None:
+    record: bytes = bytes(record_size)
+    for _ in range(num_records):
+        queue.put(record)
+
+def _benchmark_pipe_consumer(queue, num_records: int) -> None:
+    for _ in range(num_records):
+        queue.get()
+
+def _benchmark_script(num_records: int = 200_000, record_size: int = 64, capacity: int = 4_096, batch_size: int = 256):
+    """Messages/sec from a producer process to a consumer process through the shared ring, against multiprocessing.Queue"""
+    import time
+
+    def timed(processes: list[multiprocessing.Process]) -> float:
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        return num_records / (time.perf_counter() - start)
+
+    print(f"{num_records} records of {record_size} bytes, capacity {capacity}")
+    for label, mpmc, batch, num_producers in (
+        ("SPSC enqueue/dequeue", False, 1, 1),
+        (f"SPSC *_many({batch_size})", False, batch_size, 1),
+        (f"MPMC 2x2 *_many({batch_size})", True, batch_size, 2),
+    ):
+        with SharedRingBuffer(capacity=capacity, record_size=record_size, mpmc=mpmc) as ring:
+            share: int = num_records // num_producers
+            processes = [multiprocessing.Process(target=_benchmark_producer, args=(ring, share, batch)) for _ in range(num_producers)]
+            processes += [multiprocessing.Process(target=_benchmark_consumer, args=(ring, share, batch)) for _ in range(num_producers)]
+            print(f"{label:>28}: {timed(processes) / 1e3:8.1f} k msgs/s")
+
+    queue = multiprocessing.Queue(maxsize=capacity)
+    processes = [multiprocessing.Process(target=_benchmark_pipe_producer, args=(queue, num_records, record_size)),
+                 multiprocessing.Process(target=_benchmark_pipe_consumer, args=(queue, num_records))]
+    print(f"{'multiprocessing.Queue':>28}: {timed(processes) / 1e3:8.1f} k msgs/s")
+
+if __name__ == "__main__":
+    _benchmark_script()
@@ -10,15 +10,23 @@ Plan:
         
         LinkedList
             |
-           head --> Node[value|next --> Node[value|next --> ... --> Node[value|None] 
+           head --> Node[value|next --> Node[value|next --> ... --> Node[value|None] <-- tail
     
     - Node class (data-only class)
         - contains a member to store a node value 
         - contains a member to store a reference to the next node
+        - declares __slots__, so nodes have no per-instance __dict__ (see _memory_benchmark_script for bytes per element)
     
     - SinglyLinkedList class
         - contains a head member that is either None or points to the first node in the linkedlist
+        - contains a tail member that is either None or points to the last node in the linkedlist, so append is O(1)
+          (insert/remove/prepend update it whenever they change the last node, set only changes values so never needs to)
         - contains a length member that keeps track of the current length of the linkedlist
+        - contains a version member that is incremented by every structural change (nodes linked/unlinked), the iterator
+          compares it after every step and raises RuntimeError if the linkedlist was modified during iteration
+        - optionally (node_pool_size > 0) keeps up to node_pool_size removed nodes on a free-list chained through next,
+          new nodes are taken from the free-list before allocating. Removed nodes are reused, so only enable the pool when
+          callers do not hold on to nodes after removing them
 
         - Public Methods:
             1. append(self, value: Any): Creates and inserts a new node at the end of the linkedlist
@@ -39,76 +47,160 @@ Plan:
             6. set(self, index: int, value: Any): Updates the value at the specified index
                 return: None
     
-            7. find(self, value: Any): Returns the index of the first occurence of value, if not found returns -1
+            7. find(self, value: Any): Returns the index of the first occurence of value (single pass, stops at the first match), if not found returns -1
                 return: int
     
-            8. contains(self, value: Any): Returns true if the specified value is in the linkedlist, otherwise returns False
+            8. contains(self, value: Any): Returns True if the specified value is in the linkedlist, otherwise returns False
                 return: bool
+
+            9. find_all(self, value: Any): Returns the indices of every occurence of value in a single pass
+                return: list[int]
+
+            10. count(self, value: Any): Returns the number of occurences of value
+                return: int
+
+            11. index(self, value: Any, start: int = 0, stop: int | None = None): Returns the index of the first occurence of value in [start, stop),
+                raises ValueError if not found
+                return: int
     
-            9. to_list(self, return_nodes: bool = False): Returns a Python list of the linkedlist node values (default) or nodes
+            12. to_list(self, return_nodes: bool = False, copy: str = "none"): Returns a Python list of the linkedlist node values (default) or nodes,
+                values are copied according to copy ("none", "shallow" or "deep")
                 return: list[Any]
     
-            10. __len__(self): Dunder method to implement len(linkedlist obj) functionality
+            13. extend(self, values: Iterable[Any]): Appends every value in one pass
+                return: None
+
+            14. concat(self, other: SinglyLinkedList): Moves every node of other to the end of this linkedlist in O(1), other is left empty
+                return: None
+
+            15. splice(self, other: SinglyLinkedList, index: int): Moves every node of other into this linkedlist at index (O(1) relinking
+                after the walk to index), other is left empty
+                return: None
+
+            16. slice(self, start: int | None = None, stop: int | None = None, step: int | None = None): Returns a new linkedlist
+                holding the values at [start:stop:step], walking the nodes once
+                return: SinglyLinkedList
+
+            17. remove_range(self, start: int, stop: int): Removes the nodes at [start:stop], walking the nodes once
+                return: None
+
+            18. reverse(self): Reverses the linkedlist in place by relinking the nodes
+                return: None
+
+            19. sort(self, key: Callable | None = None, reverse: bool = False): Stable in-place bottom-up merge sort that relinks the nodes,
+                O(n log n) time and O(1) extra space
+                return: None
+
+            20. sorted_insert(self, value: Any, key: Callable | None = None, reverse: bool = False): Inserts value into a linkedlist
+                already sorted with the same key/reverse (after any equal values)
+                return: int (the index of the new value)
+
+            21. merge_sorted(cls, linkedlists: Iterable[SinglyLinkedList], key: Callable | None = None, reverse: bool = False): Classmethod, k-way merge
+                of sorted linkedlists through a heap, relinks their nodes into a new linkedlist and leaves them empty
+                return: SinglyLinkedList
+
+            22. __len__(self): Dunder method to implement len(linkedlist obj) functionality
                 return: int
     
-            11. __iter__(self): Dunder method to make linkedlist objects iterable, e.g. allows object to be iterated over for-loops
+            23. __iter__(self): Dunder method to make linkedlist objects iterable, lazily yields the nodes from head to tail by walking next
                 return: iterator
     
-            12. __repr__(self): Dunder method to implement repr(linkedlist obj) functionality
+            24. __getitem__(self, index: int | slice): Dunder method to implement linkedlist[index] and linkedlist[start:stop:step]
+                return: Any or SinglyLinkedList
+
+            25. __repr__(self): Dunder method to implement repr(linkedlist obj) functionality
                 return: str
     
         - Internal Methods:
             
-            13. _get_node(self, index: int): Return the node specified at index
+            26. _get_node(self, index: int): Return the node specified at index
                 return: Node
     
-            14. _validate_index(self, index: int): Returns True if the Node is in valid bounds, otherwise returns False
+            27. _validate_index(self, index: int): Returns True if the Node is in valid bounds, otherwise returns False
                 return: bool
     
-            15. _is_empty(self): Returns True if the linkedlist is empty, otherwise returns False
+            28. _is_empty(self): Returns True if the linkedlist is empty, otherwise returns False
                 return: bool
     
-            16. _get_last_node(self): Returns the last node in the linkedlist
+            29. _get_last_node(self): Returns the last node in the linkedlist (the tail, O(1))
                 return: Node
+
+            30. _new_node(self, value: Any): Returns a node holding value, recycled from the free-list when one is available
+                return: Node
+
+            31. _release_node(self, node: Node): Drops the references held by a removed node and keeps it on the free-list if the pool is not full
+                return: None
+
+            32. _link_chain(self, prev_node: Node | None, first_node: Node, last_node: Node, count: int): Links a chain of count
+                nodes right after prev_node (at the beginning if prev_node is None) in O(1)
+                return: None
 """
 
-from typing import Any
-import copy
+from typing import Any, Callable, Iterable, Iterator
+from copy import copy as shallow_copy, deepcopy
+import heapq
+
+_COPY_MODES = ("none", "shallow", "deep")
 
 class Node:
+    __slots__ = ("value", "next")
+
     def __init__(self, value: Any):
         self.value = value
         self.next = None
 
 
+def _identity(value: Any) -> Any:
+    return value
+
+def _walk_nodes(node: Node | None) -> Iterator[Node]:
+    """Yields the nodes of a chain, reading each node's next before yielding it so the caller may relink the yielded node"""
+    while node is not None:
+        next_node = node.next
+        yield node
+        node = next_node
+
+
 class SinglyLinkedList:
-    def __init__(self):
+    def __init__(self, node_pool_size: int = 0):
+        if (type(node_pool_size) is not int) or (node_pool_size < 0):
+            raise ValueError("node_pool_size must be a non-negative int.")
         self.head = None
+        self.tail = None
         self.length = 0
+        self._version = 0
+        self.node_pool_size = node_pool_size
+        self._free_head = None # free-list of removed nodes, chained through next
+        self._free_count = 0
 
     def append(self, value: Any) -> None:
         """Creates and inserts a new node at the end of the linkedlist"""
         if (self._is_empty()):
-            self.head = Node(value)
+            self.head = self.tail = self._new_node(value)
             self.length += 1
+            self._version += 1
             return
         else:
-            prev_node = self._get_last_node()
-            prev_node.next = Node(value)
+            new_node = self._new_node(value)
+            self.tail.next = new_node
+            self.tail = new_node
             self.length += 1
+            self._version += 1
             return
 
     def prepend(self, value: Any) -> None:
         """Creates and inserts a new node at the beginning of the linkedlist"""
         if (self._is_empty()):
-            self.head = Node(value)
+            self.head = self.tail = self._new_node(value)
             self.length += 1
+            self._version += 1
             return
         else:
-            new_head_node = Node(value)
+            new_head_node = self._new_node(value)
             new_head_node.next = self.head
             self.head = new_head_node
-            self.length += 1 
+            self.length += 1
+            self._version += 1
             return
         
     def insert(self, index: int, value: Any) -> None:
@@ -121,10 +213,11 @@ class SinglyLinkedList:
             return
         else:
             prev_node = self._get_node(index-1)
-            new_node = Node(value)
+            new_node = self._new_node(value)
             new_node.next = prev_node.next
             prev_node.next = new_node
             self.length += 1
+            self._version += 1
             return
         
     def remove(self, index: int) -> None: 
@@ -135,23 +228,28 @@ class SinglyLinkedList:
         if (index == 0):
             node_to_delete = self.head
             self.head = self.head.next
-            del node_to_delete
+            if (self.head is None):
+                self.tail = None
+            self._release_node(node_to_delete)
             self.length -= 1
+            self._version += 1
             return
         elif (index < self.length - 1):
             prev_node = self._get_node(index-1)
-            node_to_delete = self._get_node(index)
-            next_node = self._get_node(index+1)
-            prev_node.next = next_node
-            del node_to_delete
+            node_to_delete = prev_node.next
+            prev_node.next = node_to_delete.next
+            self._release_node(node_to_delete)
             self.length -= 1
+            self._version += 1
             return
         else:
             prev_node = self._get_node(index-1)
-            node_to_delete = self._get_node(index)
+            node_to_delete = prev_node.next
             prev_node.next = None
-            del node_to_delete
+            self.tail = prev_node
+            self._release_node(node_to_delete)
             self.length -= 1
+            self._version += 1
             return
         
     def get(self, index: int) -> Any | None:
@@ -173,43 +271,291 @@ class SinglyLinkedList:
 
     def find(self, value: Any) -> int:
         """Returns the index of the first occurence of value, if not found returns -1"""
-        try:
-            return self.to_list().index(value)
-        except ValueError:
-            return -1
+        for idx, node in enumerate(self):
+            if (node.value is value) or (node.value == value):
+                return idx
+        return -1
 
     def contains(self, value: Any) -> bool:
-        """Returns true if the specified value is in the linkedlist, otherwise returns False"""
-        return (value in self.to_list()) 
+        """Returns True if the specified value is in the linkedlist, otherwise returns False"""
+        return (self.find(value) > -1)
+
+    def find_all(self, value: Any) -> list[int]:
+        """Returns the indices of every occurence of value in a single pass"""
+        return [idx for idx, node in enumerate(self) if (node.value is value) or (node.value == value)]
+
+    def count(self, value: Any) -> int:
+        """Returns the number of occurences of value"""
+        return sum(1 for node in self if (node.value is value) or (node.value == value))
+
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        """Returns the index of the first occurence of value in [start, stop) (negative bounds count from the end, as list.index),
+            raises ValueError if not found
+        """
+        start, stop, _ = slice(start, stop).indices(self.length)
+        node = self._get_node(start)
+        for idx in range(start, stop):
+            if (node.value is value) or (node.value == value):
+                return idx
+            node = node.next
+        raise ValueError(f"{value!r} is not in linkedlist")
 
-    def to_list(self, return_nodes: bool = False) -> list[Any]:
-        """Returns a Python list of the linkedlist node values"""
-        return_list : list[Any] = []
+    def to_list(self, return_nodes: bool = False, copy: str = "none") -> list[Any]:
+        """Returns a Python list of the linkedlist node values, copy selects how values are copied: "none" (default), "shallow" or "deep".
+            return_nodes returns the linkedlist's own nodes instead (only with copy="none", copying a node would copy every node after it)
+        """
+        if copy not in _COPY_MODES:
+            raise ValueError(f"copy must be one of {_COPY_MODES}.")
+        if return_nodes:
+            if copy != "none":
+                raise ValueError("return_nodes only supports copy=\"none\".")
+            return list(self)
+        if copy == "shallow":
+            return [shallow_copy(node.value) for node in self]
+        elif copy == "deep":
+            return [deepcopy(node.value) for node in self]
+        return [node.value for node in self]
 
-        for i in range(self.length):
-            if (return_nodes):
-                return_list.append(copy.deepcopy(self._get_node(index=i)))
+    def extend(self, values: Iterable[Any]) -> None:
+        """Appends every value in one pass, the new nodes are linked only after the whole iterable has been consumed"""
+        first_node = last_node = None
+        count: int = 0
+        for value in values:
+            node = self._new_node(value)
+            if last_node is None:
+                first_node = node
             else:
-                return_list.append(copy.deepcopy(self._get_node(index=i).value))
-        
-        return return_list
+                last_node.next = node
+            last_node = node
+            count += 1
+        if first_node is not None:
+            self._link_chain(self.tail, first_node, last_node, count)
+        return
+
+    def concat(self, other: "SinglyLinkedList") -> None:
+        """Moves every node of other to the end of this linkedlist in O(1), other is left empty"""
+        self.splice(other, self.length)
+        return
+
+    def splice(self, other: "SinglyLinkedList", index: int) -> None:
+        """Moves every node of other into this linkedlist at the specified index (0 <= index <= length), other is left empty.
+            Relinking is O(1), locating index is a _get_node walk
+        """
+        if type(other) is not type(self):
+            raise TypeError("Can only splice a SinglyLinkedList.")
+        if other is self:
+            raise ValueError("Cannot splice a linkedlist into itself.")
+        if (not self._validate_index(index)) and (index != self.length):
+            raise IndexError("Invalid index")
+        if other._is_empty():
+            return
+        first_node, last_node, count = other.head, other.tail, other.length
+        other.head = other.tail = None
+        other.length = 0
+        other._version += 1
+        self._link_chain(None if index == 0 else self._get_node(index-1), first_node, last_node, count)
+        return
+
+    def slice(self, start: int | None = None, stop: int | None = None, step: int | None = None) -> "SinglyLinkedList":
+        """Returns a new linkedlist holding the values at [start:stop:step] (list slice semantics), walking the nodes once"""
+        indices: range = range(*slice(start, stop, step).indices(self.length))
+        sliced = SinglyLinkedList()
+        if not indices:
+            return sliced
+        low: int = min(indices[0], indices[-1])
+        high: int = max(indices[0], indices[-1])
+        stride: int = abs(indices.step)
+        node = self._get_node(low)
+        values: list[Any] = []
+        for offset in range(high - low + 1):
+            if offset % stride == 0:
+                values.append(node.value)
+            node = node.next
+        if indices.step < 0:
+            values.reverse()
+        sliced.extend(values)
+        return sliced
+
+    def remove_range(self, start: int, stop: int) -> None:
+        """Removes the nodes at [start:stop] (list slice semantics, negative indices count from the end), walking the nodes once"""
+        start, stop, _ = slice(start, stop).indices(self.length)
+        if start >= stop:
+            return
+        prev_node = None if start == 0 else self._get_node(start-1)
+        node = self.head if prev_node is None else prev_node.next
+        for _ in range(stop - start):
+            next_node = node.next
+            self._release_node(node)
+            node = next_node
+        if prev_node is None:
+            self.head = node
+        else:
+            prev_node.next = node
+        if node is None:
+            self.tail = prev_node
+        self.length -= stop - start
+        self._version += 1
+        return
+
+    def reverse(self) -> None:
+        """Reverses the linkedlist in place by relinking the nodes"""
+        prev_node = None
+        node = self.head
+        self.tail = node
+        while node is not None:
+            next_node = node.next
+            node.next = prev_node
+            prev_node = node
+            node = next_node
+        self.head = prev_node
+        self._version += 1
+        return
+
+    def sort(self, key: Callable[[Any], Any] | None = None, reverse: bool = False) -> None:
+        """Stable in-place bottom-up merge sort that relinks the nodes, O(n log n) time and O(1) extra space.
+            key is called during comparisons (keys are not cached, to keep the extra space O(1)).
+            As list.sort, reverse=True sorts in descending order and keeps equal values in their original order
+        """
+        if self.length < 2:
+            return
+        key_fn: Callable[[Any], Any] = _identity if key is None else key
+        head = self.head
+        width: int = 1
+        while True:
+            merged_head = merged_tail = None
+            left = head
+            num_merges: int = 0
+            while left is not None:
+                num_merges += 1
+                # split off a run of width nodes (left) followed by up to width nodes (right)
+                right = left
+                left_size: int = 0
+                while (left_size < width) and (right is not None):
+                    left_size += 1
+                    right = right.next
+                right_size: int = width
+                while (left_size > 0) or ((right_size > 0) and (right is not None)):
+                    if left_size == 0:
+                        take_left = False
+                    elif (right_size == 0) or (right is None):
+                        take_left = True
+                    elif reverse:
+                        take_left = not (key_fn(left.value) < key_fn(right.value))
+                    else:
+                        take_left = not (key_fn(right.value) < key_fn(left.value))
+                    if take_left:
+                        node = left
+                        left = left.next
+                        left_size -= 1
+                    else:
+                        node = right
+                        right = right.next
+                        right_size -= 1
+                    if merged_tail is None:
+                        merged_head = node
+                    else:
+                        merged_tail.next = node
+                    merged_tail = node
+                left = right
+            merged_tail.next = None
+            head = merged_head
+            if num_merges <= 1:
+                break
+            width *= 2
+        self.head = head
+        self.tail = merged_tail
+        self._version += 1
+        return
+
+    def sorted_insert(self, value: Any, key: Callable[[Any], Any] | None = None, reverse: bool = False) -> int:
+        """Inserts value into a linkedlist already sorted with the same key/reverse, after any equal values, returns its index"""
+        key_fn: Callable[[Any], Any] = _identity if key is None else key
+        value_key: Any = key_fn(value)
+        prev_node = None
+        node = self.head
+        index: int = 0
+        while node is not None:
+            node_key: Any = key_fn(node.value)
+            if (node_key < value_key) if reverse else (value_key < node_key):
+                break
+            prev_node = node
+            node = node.next
+            index += 1
+        new_node = self._new_node(value)
+        self._link_chain(prev_node, new_node, new_node, 1)
+        return index
+
+    @classmethod
+    def merge_sorted(cls, linkedlists: Iterable["SinglyLinkedList"], key: Callable[[Any], Any] | None = None, reverse: bool = False) -> "SinglyLinkedList":
+        """k-way merge of linkedlists that are each sorted with the same key/reverse, using a heap (heapq.merge, O(n log k)).
+            The nodes are relinked into the returned linkedlist and the input linkedlists are left empty.
+            The merge is stable, equal values keep the order of the input linkedlists
+        """
+        linkedlists = list(linkedlists)
+        if any(type(linkedlist) is not cls for linkedlist in linkedlists):
+            raise TypeError("Can only merge SinglyLinkedList objects.")
+        if len({id(linkedlist) for linkedlist in linkedlists}) != len(linkedlists):
+            raise ValueError("Cannot merge a linkedlist with itself.")
+        key_fn: Callable[[Any], Any] = _identity if key is None else key
+        chains: list[Iterator[Node]] = []
+        count: int = 0
+        for linkedlist in linkedlists:
+            chains.append(_walk_nodes(linkedlist.head))
+            count += linkedlist.length
+            linkedlist.head = linkedlist.tail = None
+            linkedlist.length = 0
+            linkedlist._version += 1
+
+        merged = cls()
+        last_node = None
+        for node in heapq.merge(*chains, key=lambda node: key_fn(node.value), reverse=reverse):
+            if last_node is None:
+                merged.head = node
+            else:
+                last_node.next = node
+            last_node = node
+        if last_node is not None:
+            last_node.next = None
+            merged.tail = last_node
+        merged.length = count
+        return merged
 
     def __len__(self) -> int:
         """Dunder method to implement len(linkedlist obj) functionality"""
         return self.length
 
-    def __iter__(self):
-        """Dunder method to make linkedlist objects iterable, e.g. allows object to be iterated over for-loops"""
-        return iter(self.to_list(return_nodes=True))
+    def __iter__(self) -> Iterator[Node]:
+        """Dunder method to make linkedlist objects iterable, lazily yields the nodes from head to tail"""
+        version: int = self._version
+        node = self.head
+        while node is not None:
+            yield node
+            if self._version != version:
+                raise RuntimeError("SinglyLinkedList changed size during iteration")
+            node = node.next
+
+    def __getitem__(self, index: "int | slice") -> Any:
+        """Dunder method to implement linkedlist[index] (negative indices count from the end, raises IndexError if out of range)
+            and linkedlist[start:stop:step] (returns a new linkedlist, see slice)
+        """
+        if isinstance(index, slice):
+            return self.slice(index.start, index.stop, index.step)
+        if index < 0:
+            index += self.length
+        if (not self._validate_index(index)):
+            raise IndexError("SinglyLinkedList index out of range")
+        return self._get_node(index).value
 
     def __repr__(self) -> str:
         """Dunder method to implement repr(linkedlist obj) functionality"""
-        return f"class_name=SinglyLinkedList, id={id(self)}, length={self.length}, head={self.head}"
+        return f"class_name=SinglyLinkedList, id={id(self)}, length={self.length}, head={self.head}, tail={self.tail}"
 
     def _get_node(self, index: int) -> Node | None:
         """Return the node specified at index"""
         if (not self._validate_index(index)):
             return None
+        if (index == self.length - 1):
+            return self.tail
         
         retrieved_node = self.head
 
@@ -227,11 +573,13 @@ class SinglyLinkedList:
 
     def _is_empty(self) -> bool:
         """Returns True if the linkedlist is empty, otherwise returns False"""
-        if (self.head is None):
+        if (self.head is None and self.tail is None):
             if (self.length == 0):
                 return True
             else:
                 raise ValueError("Error, head is assigned to None but length is non-zero")
+        elif (self.head is None or self.tail is None):
+            raise ValueError("Error, exactly one of head and tail is assigned to None")
         else:
             if (self.length > 0):
                 return False
@@ -243,4 +591,226 @@ class SinglyLinkedList:
         if (self._is_empty()):
             return None
         else:
-            return self._get_node(index=self.length-1)
\ No newline at end of file
+            return self.tail
+
+    def _new_node(self, value: Any) -> Node:
+        """Returns a node holding value, recycled from the free-list when one is available"""
+        node = self._free_head
+        if node is None:
+            return Node(value)
+        self._free_head = node.next
+        self._free_count -= 1
+        node.value = value
+        node.next = None
+        return node
+
+    def _release_node(self, node: Node) -> None:
+        """Drops the references held by a removed node and keeps it on the free-list if the pool is not full"""
+        node.value = None
+        if self._free_count < self.node_pool_size:
+            node.next = self._free_head
+            self._free_head = node
+            self._free_count += 1
+        else:
+            node.next = None
+        return
+
+    def _link_chain(self, prev_node: Node | None, first_node: Node, last_node: Node, count: int) -> None:
+        """Links a chain of count nodes (first_node ... last_node, already linked through next) right after prev_node
+            (at the beginning if prev_node is None) in O(1)
+        """
+        if prev_node is None:
+            last_node.next = self.head
+            self.head = first_node
+        else:
+            last_node.next = prev_node.next
+            prev_node.next = first_node
+        if prev_node is self.tail:
+            self.tail = last_node
+        self.length += count
+        self._version += 1
+        return
+
+#--------------------------------------------------------
+def _benchmark_script(sizes: tuple[int, ...] = (10_000, 100_000, 1_000_000)):
+    """Times building a linkedlist with append, the per-element time should stay flat as the size grows (linear build time)"""
+    import gc
+    import time
+
+    for size in sizes:
+        linkedlist = SinglyLinkedList()
+        gc.disable()
+        start = time.perf_counter()
+        for i in range(size):
+            linkedlist.append(i)
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        assert len(linkedlist) == size and linkedlist.tail.value == size - 1
+        print(f"append x {size:>9}: {elapsed:8.3f} s total, {elapsed / size * 1e9:6.0f} ns/element")
+        del linkedlist
+
+def _memory_benchmark_script(num_elements: int = 200_000):
+    """Reports the bytes per element (payload excluded) of a SinglyLinkedList, compared with an unslotted node and the builtin containers"""
+    from collections import deque
+    import tracemalloc
+
+    class DictNode: # the node layout before __slots__, for comparison
+        def __init__(self, value: Any):
+            self.value = value
+            self.next = None
+    def bytes_per_element(build) -> float:
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        container = build()
+        used = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+        del container
+        return used / num_elements
+
+    def build_unslotted():
+        head = node = DictNode(None)
+        for _ in range(num_elements - 1):
+            node.next = DictNode(None)
+            node = node.next
+        return head
+
+    def build_linkedlist():
+        linkedlist = SinglyLinkedList()
+        for _ in range(num_elements):
+            linkedlist.append(None)
+        return linkedlist
+
+    def recycled_bytes_per_element() -> float:
+        # after filling and emptying a pooled linkedlist every node comes from the free-list, so the rebuild allocates no new nodes
+        linkedlist = SinglyLinkedList(node_pool_size=num_elements)
+        for _ in range(num_elements):
+            linkedlist.append(None)
+        for _ in range(num_elements):
+            linkedlist.remove(0)
+        tracemalloc.start()
+        for _ in range(num_elements):
+            linkedlist.append(None)
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return used / num_elements
+
+    print(f"elements: {num_elements} (value=None, payload excluded)")
+    for label, build in (
+        ("unslotted node (__dict__)", build_unslotted),
+        ("SinglyLinkedList (__slots__)", build_linkedlist),
+        ("list", lambda: [None for _ in range(num_elements)]),
+        ("collections.deque", lambda: deque(None for _ in range(num_elements))),
+    ):
+        print(f"{label:>36}: {bytes_per_element(build):6.1f} bytes/element")
+    print(f"{'SinglyLinkedList (rebuild from pool)':>36}: {recycled_bytes_per_element():6.1f} new bytes/element")
+
+def _bulk_benchmark_script(num_elements: int = 20_000, chunk: int = 1_000):
+    """Times the bulk operations against their element-wise equivalents"""
+    import time
+
+    def build(size: int) -> SinglyLinkedList:
+        linkedlist = SinglyLinkedList()
+        linkedlist.extend(range(size))
+        return linkedlist
+
+    def timed(operation) -> float:
+        start = time.perf_counter()
+        operation()
+        return time.perf_counter() - start
+
+    middle: int = num_elements // 2
+    results: list[tuple[str, float, float]] = []
+
+    def append_loop():
+        linkedlist = SinglyLinkedList()
+        for value in range(num_elements):
+            linkedlist.append(value)
+    results.append((f"extend({num_elements})", timed(lambda: SinglyLinkedList().extend(range(num_elements))), timed(append_loop)))
+
+    linkedlist, other = build(num_elements), build(chunk)
+    concat_seconds = timed(lambda: linkedlist.concat(other))
+    linkedlist, other = build(num_elements), build(chunk)
+    def concat_loop():
+        while len(other):
+            linkedlist.append(other.get(0))
+            other.remove(0)
+    results.append((f"concat({chunk})", concat_seconds, timed(concat_loop)))
+
+    linkedlist, other = build(num_elements), build(chunk)
+    splice_seconds = timed(lambda: linkedlist.splice(other, middle))
+    linkedlist, other = build(num_elements), build(chunk)
+    def insert_loop():
+        for offset, value in enumerate(other.to_list()):
+            linkedlist.insert(middle + offset, value)
+    results.append((f"splice({chunk}, middle)", splice_seconds, timed(insert_loop)))
+
+    linkedlist = build(num_elements)
+    results.append((f"slice({chunk} at middle)", timed(lambda: linkedlist.slice(middle, middle + chunk)),
+                    timed(lambda: [linkedlist.get(index) for index in range(middle, middle + chunk)])))
+
+    linkedlist = build(num_elements)
+    remove_range_seconds = timed(lambda: linkedlist.remove_range(middle, middle + chunk))
+    linkedlist = build(num_elements)
+    def remove_loop():
+        for _ in range(chunk):
+            linkedlist.remove(middle)
+    results.append((f"remove_range({chunk} at middle)", remove_range_seconds, timed(remove_loop)))
+
+    linkedlist = build(num_elements)
+    def prepend_copy():
+        reversed_list = SinglyLinkedList()
+        for node in linkedlist:
+            reversed_list.prepend(node.value)
+    results.append((f"reverse({num_elements})", timed(linkedlist.reverse), timed(prepend_copy)))
+
+    print(f"SinglyLinkedList, {num_elements} elements")
+    print(f"{'operation':>28} {'bulk (s)':>10} {'element-wise (s)':>17}")
+    for label, bulk_seconds, loop_seconds in results:
+        print(f"{label:>28} {bulk_seconds:10.4f} {loop_seconds:17.4f}")
+
+def _sort_benchmark_script(num_elements: int = 100_000, num_lists: int = 8):
+    """Times the in-place merge sort against copying out, sorting and rebuilding, and merge_sorted against concat + sort"""
+    import random
+    import time
+
+    values = [random.random() for _ in range(num_elements)]
+    linkedlist = SinglyLinkedList()
+    linkedlist.extend(values)
+    start = time.perf_counter()
+    linkedlist.sort()
+    sort_seconds = time.perf_counter() - start
+
+    linkedlist = SinglyLinkedList()
+    linkedlist.extend(values)
+    start = time.perf_counter()
+    rebuilt = SinglyLinkedList()
+    rebuilt.extend(sorted(linkedlist.to_list(copy="deep")))
+    rebuild_seconds = time.perf_counter() - start
+
+    chunks = [sorted(values[idx::num_lists]) for idx in range(num_lists)]
+    linkedlists = [SinglyLinkedList() for _ in chunks]
+    for chunk, chunk_list in zip(chunks, linkedlists):
+        chunk_list.extend(chunk)
+    start = time.perf_counter()
+    SinglyLinkedList.merge_sorted(linkedlists)
+    merge_seconds = time.perf_counter() - start
+
+    for chunk, chunk_list in zip(chunks, linkedlists):
+        chunk_list.extend(chunk)
+    start = time.perf_counter()
+    for chunk_list in linkedlists[1:]:
+        linkedlists[0].concat(chunk_list)
+    linkedlists[0].sort()
+    concat_sort_seconds = time.perf_counter() - start
+
+    print(f"SinglyLinkedList, {num_elements} elements")
+    print(f"{'in-place merge sort':>36}: {sort_seconds:8.3f} s")
+    print(f"{'to_list(copy=deep) + sorted + extend':>36}: {rebuild_seconds:8.3f} s (O(n) extra space)")
+    print(f"{f'merge_sorted of {num_lists} sorted lists':>36}: {merge_seconds:8.3f} s")
+    print(f"{f'concat of {num_lists} sorted lists + sort':>36}: {concat_sort_seconds:8.3f} s")
+
+if __name__ == "__main__":
+    _benchmark_script()
+    _memory_benchmark_script()
+    _bulk_benchmark_script()
+    _sort_benchmark_script()
@@ -0,0 +1,453 @@
+"""
+10/18/2026: J. BRANCH
+
+The goal is to create an implementation for an indexable SkipList data structure from 'scratch', a linked list with express lanes
+that offers positional access (get/set/insert/remove by index) in expected O(log n), and an ordered mode that doubles as a sorted set.
+
+Plan:
+    - Datamodel:
+        (class) SkipList
+        (class) Node
+
+        SkipList
+            |
+           head --------------------------------------> Node(c) -------------------------> None    level 2 (width 3, width 3)
+           head --------------> Node(a) --------------> Node(c) ----------> Node(d) -----> None    level 1
+           head --> Node(a) --> Node(b) --> Node(c) --> Node(d) --> None                          level 0 (every width is 1)
+
+    - Node class (data-only class, __slots__)
+        - contains a member to store a node value
+        - contains a list of next references, one per level the node takes part in
+        - contains a list of widths, width[level] is the number of level 0 steps from the node to next[level]
+          (to the position one past the last node when next[level] is None)
+
+    - SkipList class
+        - contains a head sentinel node with max_level levels, position 0 (the first value is at position 1, i.e. index 0)
+        - contains a length member that keeps track of the current number of values
+        - contains a level member, the number of levels currently in use
+        - contains an ordered member:
+            - ordered=False: positional list, values are kept in insertion order (the linked-list API)
+            - ordered=True: sorted set, values are kept sorted by key(value) and equal keys are stored once. Positional access
+              (get/remove by index) still works and gives the value's rank, insert/prepend/append/set are unavailable
+        - new nodes get level k with probability p^(k-1), searches walk the top level first and drop a level whenever the next step
+          would overshoot, summing widths to track the position (expected O(log n) steps)
+        - contains a version member that is incremented by every structural change, the iterator raises RuntimeError if the
+          skip list is modified during iteration
+
+        - Public Methods (positional mode):
+            1. append(self, value: Any): Inserts value at the end of the skip list
+                return: None
+
+            2. prepend(self, value: Any): Inserts value at the beginning of the skip list
+                return: None
+
+            3. insert(self, index: int, value: Any): Inserts value at the specified index (0 <= index <= length)
+                return: None
+
+            4. set(self, index: int, value: Any): Updates the value at the specified index
+                return: None
+
+        - Public Methods (ordered mode):
+            5. add(self, value: Any): Inserts value in sorted order, returns False (and changes nothing) if an equal key is present
+                return: bool
+
+            6. discard(self, value: Any): Removes the value with an equal key, returns False if there is none
+                return: bool
+
+            7. bisect_left(self, value: Any) / bisect_right(self, value: Any): Returns the index where value would be inserted to
+                keep the order, before/after any equal key
+                return: int
+
+            8. range(self, low: Any = None, high: Any = None, inclusive: tuple[bool, bool] = (True, False)): Lazily yields the values
+                between low and high (None means unbounded)
+                return: iterator
+
+            9. count_range(self, low: Any = None, high: Any = None, inclusive: tuple[bool, bool] = (True, False)): Returns the number
+                of values between low and high in O(log n)
+                return: int
+
+        - Public Methods (both modes):
+            10. remove(self, index: int): Removes the value at the specified index
+                return: None
+
+            11. pop(self, index: int = -1): Removes and returns the value at the specified index (negative indices count from the end)
+                return: Any
+
+            12. get(self, index: int): Returns the value at the specified index (None if the index is invalid)
+                return: Any
+
+            13. find(self, value: Any): Returns the index of the first occurence of value, if not found returns -1
+                (ordered mode: O(log n) search by key)
+                return: int
+
+            14. contains(self, value: Any): Returns True if the specified value is in the skip list, otherwise returns False
+                return: bool
+
+            15. count(self, value: Any): Returns the number of occurences of value
+                return: int
+
+            16. to_list(self): Returns a Python list of the values
+                return: list[Any]
+
+            17. __len__ / __iter__ / __contains__ / __getitem__ / __repr__: Dunder methods, iteration lazily yields the values
+                return: int / iterator / bool / Any / str
+
+        - Internal Methods:
+            18. _random_level(self): Returns the level of a new node
+                return: int
+
+            19. _find_by_index(self, index: int): Returns the last node before position index+1 at every level and the positions of those nodes
+                return: tuple[list[Node], list[int]]
+
+            20. _find_by_key(self, key: Any, strict: bool = True): Returns the last node whose key is < key (<= key if not strict)
+                at every level and the positions of those nodes
+                return: tuple[list[Node], list[int]]
+
+            21. _link(self, update: list[Node], positions: list[int], value: Any): Links a new node holding value right after update[0]
+                return: None
+
+            22. _unlink(self, update: list[Node]): Unlinks the node right after update[0]
+                return: Any
+"""
+
+from typing import Any, Callable, Iterator
+import random
+
+class Node:
+    __slots__ = ("value", "next", "width")
+
+    def __init__(self, value: Any, level: int):
+        self.value = value
+        self.next: list["Node | None"] = [None] * level
+        self.width: list[int] = [1] * level
+
+
+class SkipList:
+    def __init__(self, ordered: bool = False, key: Callable[[Any], Any] | None = None, max_level: int = 32, p: float = 0.5,
+                 seed: int | None = None):
+        if (type(max_level) is not int) or (max_level < 1):
+            raise ValueError("max_level for SkipList must be an int greater than 0.")
+        if not (0 < p < 1):
+            raise ValueError("p for SkipList must be between 0 and 1.")
+        if (key is not None) and not ordered:
+            raise ValueError("key is only used by an ordered SkipList.")
+        self.ordered: bool = ordered
+        self.key: Callable[[Any], Any] = key if key is not None else (lambda value: value)
+        self.max_level: int = max_level
+        self.p: float = p
+        self.head = Node(None, max_level)
+        self.head.width = [1] * max_level # position 0 -> one past the last node (position 1) while empty
+        self.length: int = 0
+        self.level: int = 1
+        self._random = random.Random(seed)
+        self._version: int = 0
+
+    #-------- positional mode
+    def append(self, value: Any) -> None:
+        """Inserts value at the end of the skip list"""
+        self.insert(self.length, value)
+        return None
+
+    def prepend(self, value: Any) -> None:
+        """Inserts value at the beginning of the skip list"""
+        self.insert(0, value)
+        return None
+
+    def insert(self, index: int, value: Any) -> None:
+        """Inserts value at the specified index (0 <= index <= length)"""
+        if self.ordered:
+            raise ValueError("insert is not supported by an ordered SkipList, use add.")
+        if not (0 <= index <= self.length):
+            raise IndexError("Invalid index")
+        update, positions = self._find_by_index(index)
+        self._link(update, positions, value)
+        return None
+
+    def set(self, index: int, value: Any) -> None:
+        """Updates the value at the specified index"""
+        if self.ordered:
+            raise ValueError("set is not supported by an ordered SkipList, remove the value and add the new one.")
+        if not (0 <= index < self.length):
+            raise IndexError("Error, invalid index specified")
+        update, _ = self._find_by_index(index)
+        update[0].next[0].value = value
+        return None
+
+    #-------- ordered mode
+    def add(self, value: Any) -> bool:
+        """Inserts value in sorted order, returns False (and changes nothing) if an equal key is present"""
+        if not self.ordered:
+            raise ValueError("add is only supported by an ordered SkipList, use insert/append.")
+        key: Any = self.key(value)
+        update, positions = self._find_by_key(key)
+        candidate = update[0].next[0]
+        if (candidate is not None) and (self.key(candidate.value) == key):
+            return False
+        self._link(update, positions, value)
+        return True
+
+    def discard(self, value: Any) -> bool:
+        """Removes the value with an equal key, returns False if there is none"""
+        if not self.ordered:
+            raise ValueError("discard is only supported by an ordered SkipList, use remove.")
+        key: Any = self.key(value)
+        update, _ = self._find_by_key(key)
+        candidate = update[0].next[0]
+        if (candidate is None) or (self.key(candidate.value) != key):
+            return False
+        self._unlink(update)
+        return True
+
+    def bisect_left(self, value: Any) -> int:
+        """Returns the index where value would be inserted to keep the order, before any equal key"""
+        return self._find_by_key(self._ordered_key(value))[1][0]
+
+    def bisect_right(self, value: Any) -> int:
+        """Returns the index where value would be inserted to keep the order, after any equal key"""
+        return self._find_by_key(self._ordered_key(value), strict=False)[1][0]
+
+    def range(self, low: Any = None, high: Any = None, inclusive: tuple[bool, bool] = (True, False)) -> Iterator[Any]:
+        """Lazily yields the values between low and high in order (None means unbounded)"""
+        if low is None:
+            node = self.head.next[0]
+        else:
+            update, _ = self._find_by_key(self._ordered_key(low), strict=inclusive[0])
+            node = update[0].next[0]
+        high_key: Any = None if high is None else self.key(high)
+        version: int = self._version
+        while node is not None:
+            if high_key is not None:
+                node_key: Any = self.key(node.value)
+                if (node_key > high_key) or ((node_key == high_key) and not inclusive[1]):
+                    return
+            yield node.value
+            if self._version != version:
+                raise RuntimeError("SkipList changed size during iteration")
+            node = node.next[0]
+
+    def count_range(self, low: Any = None, high: Any = None, inclusive: tuple[bool, bool] = (True, False)) -> int:
+        """Returns the number of values between low and high in O(log n) (None means unbounded)"""
+        start: int = 0 if low is None else (self.bisect_left(low) if inclusive[0] else self.bisect_right(low))
+        stop: int = self.length if high is None else (self.bisect_right(high) if inclusive[1] else self.bisect_left(high))
+        return max(0, stop - start)
+
+    #-------- both modes
+    def remove(self, index: int) -> None:
+        """Removes the value at the specified index"""
+        if not (0 <= index < self.length):
+            raise IndexError("Error, invalid index specified")
+        update, _ = self._find_by_index(index)
+        self._unlink(update)
+        return None
+
+    def pop(self, index: int = -1) -> Any:
+        """Removes and returns the value at the specified index (negative indices count from the end)"""
+        if index < 0:
+            index += self.length
+        if not (0 <= index < self.length):
+            raise IndexError("pop from an empty SkipList or invalid index.")
+        update, _ = self._find_by_index(index)
+        return self._unlink(update)
+
+    def get(self, index: int) -> Any | None:
+        """Returns the value at the specified index (None if the index is invalid)"""
+        if not (0 <= index < self.length):
+            return None
+        update, _ = self._find_by_index(index)
+        return update[0].next[0].value
+
+    def find(self, value: Any) -> int:
+        """Returns the index of the first occurence of value, if not found returns -1"""
+        if self.ordered:
+            key: Any = self.key(value)
+            update, positions = self._find_by_key(key)
+            candidate = update[0].next[0]
+            if (candidate is not None) and (self.key(candidate.value) == key):
+                return positions[0]
+            return -1
+        for idx, item in enumerate(self):
+            if (item is value) or (item == value):
+                return idx
+        return -1
+
+    def contains(self, value: Any) -> bool:
+        """Returns True if the specified value is in the skip list, otherwise returns False"""
+        return (self.find(value) > -1)
+
+    def count(self, value: Any) -> int:
+        """Returns the number of occurences of value"""
+        if self.ordered:
+            return int(self.contains(value))
+        return sum(1 for item in self if (item is value) or (item == value))
+
+    def to_list(self) -> list[Any]:
+        """Returns a Python list of the values"""
+        return list(self)
+
+    def __len__(self) -> int:
+        """Dunder method to implement len(obj) functionality"""
+        return self.length
+
+    def __iter__(self) -> Iterator[Any]:
+        """Dunder method to make the skip list iterable, lazily yields the values by walking level 0"""
+        version: int = self._version
+        node = self.head.next[0]
+        while node is not None:
+            yield node.value
+            if self._version != version:
+                raise RuntimeError("SkipList changed size during iteration")
+            node = node.next[0]
+
+    def __contains__(self, value: object) -> bool:
+        return self.contains(value)
+
+    def __getitem__(self, index: int) -> Any:
+        """Dunder method to implement skiplist[index], negative indices count from the end, raises IndexError if out of range"""
+        if index < 0:
+            index += self.length
+        if not (0 <= index < self.length):
+            raise IndexError("SkipList index out of range")
+        return self.get(index)
+
+    def __repr__(self) -> str:
+        """Dunder method to implement repr(obj) functionality"""
+        return f"class_name=SkipList, id={id(self)}, length={self.length}, level={self.level}, ordered={self.ordered}"
+
+    def _ordered_key(self, value: Any) -> Any:
+        if not self.ordered:
+            raise ValueError("only supported by an ordered SkipList.")
+        return self.key(value)
+
+    def _random_level(self) -> int:
+        """Returns the level of a new node, level k has probability p^(k-1)"""
+        level: int = 1
+        random_fn = self._random.random
+        while (level < self.max_level) and (random_fn() < self.p):
+            level += 1
+        return level
+
+    def _find_by_index(self, index: int) -> tuple[list[Node], list[int]]:
+        """Returns the last node before position index+1 at every level in use and the positions of those nodes"""
+        update: list[Node] = [self.head] * self.level
+        positions: list[int] = [0] * self.level
+        node = self.head
+        position: int = 0
+        for level in range(self.level - 1, -1, -1):
+            while (node.next[level] is not None) and (position + node.width[level] <= index):
+                position += node.width[level]
+                node = node.next[level]
+            update[level] = node
+            positions[level] = position
+        return update, positions
+
+    def _find_by_key(self, key: Any, strict: bool = True) -> tuple[list[Node], list[int]]:
+        """Returns the last node whose key is < key (<= key if not strict) at every level in use and the positions of those nodes"""
+        update: list[Node] = [self.head] * self.level
+        positions: list[int] = [0] * self.level
+        key_fn: Callable[[Any], Any] = self.key
+        node = self.head
+        position: int = 0
+        for level in range(self.level - 1, -1, -1):
+            while True:
+                next_node = node.next[level]
+                if next_node is None:
+                    break
+                next_key: Any = key_fn(next_node.value)
+                if (next_key < key) if strict else (next_key <= key):
+                    position += node.width[level]
+                    node = next_node
+                else:
+                    break
+            update[level] = node
+            positions[level] = position
+        return update, positions
+
+    def _link(self, update: list[Node], positions: list[int], value: Any) -> None:
+        """Links a new node holding value right after update[0] (at position positions[0] + 1)"""
+        new_level: int = self._random_level()
+        if new_level > self.level:
+            for level in range(self.level, new_level):
+                self.head.next[level] = None
+                self.head.width[level] = self.length + 1
+                update.append(self.head)
+                positions.append(0)
+            self.level = new_level
+
+        new_node = Node(value, new_level)
+        new_position: int = positions[0] + 1
+        for level in range(new_level):
+            prev_node = update[level]
+            distance: int = new_position - positions[level]
+            new_node.next[level] = prev_node.next[level]
+            new_node.width[level] = prev_node.width[level] - distance + 1
+            prev_node.next[level] = new_node
+            prev_node.width[level] = distance
+        for level in range(new_level, self.level):
+            update[level].width[level] += 1
+        self.length += 1
+        self._version += 1
+        return None
+
+    def _unlink(self, update: list[Node]) -> Any:
+        """Unlinks the node right after update[0] and returns its value"""
+        target = update[0].next[0]
+        target_level: int = len(target.next)
+        for level in range(target_level):
+            prev_node = update[level]
+            prev_node.width[level] += target.width[level] - 1
+            prev_node.next[level] = target.next[level]
+        for level in range(target_level, self.level):
+            update[level].width[level] -= 1
+        self.length -= 1
+        self._version += 1
+        return target.value
+
+#--------------------------------------------------------
+def _benchmark_script(num_elements: int = 100_000, num_ops: int = 2_000):
+    """Compares random indexed get/insert of SkipList with the linked lists, and sorted-set add with bisect.insort on a list"""
+    import bisect
+    import time
+
+    if not __package__: # run as a script, or imported by a module run as a script
+        from singly_linked_list import SinglyLinkedList
+        from doubly_linked_list import DoublyLinkedList
+    else:
+        from src.singly_linked_list import SinglyLinkedList
+        from src.doubly_linked_list import DoublyLinkedList
+
+    rng = random.Random(17)
+    indices = [rng.randrange(num_elements) for _ in range(num_ops)]
+    print(f"elements: {num_elements}, random gets/inserts: {num_ops}")
+    for label, linkedlist in (("SinglyLinkedList", SinglyLinkedList()), ("DoublyLinkedList", DoublyLinkedList()), ("SkipList", SkipList())):
+        for i in range(num_elements):
+            linkedlist.append(i)
+        start = time.perf_counter()
+        for index in indices:
+            linkedlist.get(index)
+        get_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        for index in indices:
+            linkedlist.insert(index, index)
+        insert_seconds = time.perf_counter() - start
+        print(f"{label:>20}: get {get_seconds / num_ops * 1e6:9.1f} us/op, insert {insert_seconds / num_ops * 1e6:9.1f} us/op")
+
+    values = [rng.random() for _ in range(num_elements)]
+    start = time.perf_counter()
+    sorted_set = SkipList(ordered=True)
+    for value in values:
+        sorted_set.add(value)
+    skip_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    sorted_list: list[float] = []
+    for value in values:
+        bisect.insort(sorted_list, value)
+    insort_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(num_ops):
+        sorted_set.count_range(0.25, 0.5)
+    range_seconds = time.perf_counter() - start
+    print(f"{'ordered SkipList':>20}: add {skip_seconds / num_elements * 1e6:9.1f} us/op, count_range {range_seconds / num_ops * 1e6:9.1f} us/op")
+    print(f"{'bisect.insort list':>20}: add {insort_seconds / num_elements * 1e6:9.1f} us/op")
+
+if __name__ == "__main__":
+    _benchmark_script()
@@ -55,7 +55,7 @@ Plan:
 """
 from typing import Any
 
-if __name__ == "__main__":
+if not __package__: # run as a script, or imported by a module run as a script
     from singly_linked_list import SinglyLinkedList
 else:
     from src.singly_linked_list import SinglyLinkedList
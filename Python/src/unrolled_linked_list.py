@@ -0,0 +1,392 @@
+"""
+10/18/2026: J. BRANCH
+
+The goal is to create an implementation for an unrolled LinkedList data structure from 'scratch', a singly LinkedList whose nodes
+each hold a chunk of up to chunk_size values, so walking the list costs one pointer hop per chunk instead of one per value.
+
+Plan:
+    - Datamodel:
+        (class) UnrolledLinkedList
+        (class) Node
+
+        UnrolledLinkedList
+            |
+           head --> Node[items: [v0, v1, ..., vk]|next --> Node[items: [...]|next --> ... --> Node[items: [...]|None] <-- tail
+
+    - Node class (data-only class, __slots__)
+        - contains a member to store the node's chunk of values, a Python list or an array.array when a typecode is given
+        - contains a member to store a reference to the next node
+
+    - UnrolledLinkedList class
+        - contains a head member that is either None or points to the first node in the linkedlist
+        - contains a tail member that is either None or points to the last node in the linkedlist, so append is O(1)
+        - contains a length member that keeps track of the current number of values (not nodes)
+        - contains a chunk_size member, the maximum number of values in a node's chunk
+        - contains a typecode member, None for list chunks or an array.array typecode (e.g. "q", "d") for compact numeric chunks
+        - contains a version member that is incremented by every structural change, the iterator raises RuntimeError if the
+          linkedlist is modified during iteration
+        - every node holds at least one value. Inserting into a full chunk splits it in half, a chunk that drops
+          below half full after a remove absorbs the next node if the two fit in one chunk
+        - indexed access (get/set/insert/remove) walks chunks, O(n/chunk_size) pointer hops, plus O(chunk_size) to shift values
+          inside the chunk
+
+        - Public Methods (same semantics as SinglyLinkedList unless noted):
+            1. append(self, value: Any): Inserts value at the end of the linkedlist
+                return: None
+
+            2. prepend(self, value: Any): Inserts value at the beginning of the linkedlist
+                return: None
+
+            3. insert(self, index: int, value: Any): Inserts value at the specified index
+                return: None
+
+            4. remove(self, index: int): Removes the value at the specified index
+                return: None
+
+            5. get(self, index: int): Returns the value at the specified index (None if the index is invalid)
+                return: Any
+
+            6. set(self, index: int, value: Any): Updates the value at the specified index
+                return: None
+
+            7. find(self, value: Any): Returns the index of the first occurence of value, if not found returns -1
+                return: int
+
+            8. contains(self, value: Any): Returns True if the specified value is in the linkedlist, otherwise returns False
+                return: bool
+
+            9. find_all(self, value: Any): Returns the indices of every occurence of value in a single pass
+                return: list[int]
+
+            10. count(self, value: Any): Returns the number of occurences of value
+                return: int
+
+            11. index(self, value: Any, start: int = 0, stop: int | None = None): Returns the index of the first occurence of value
+                in [start, stop), raises ValueError if not found
+                return: int
+
+            12. to_list(self, copy: str = "none"): Returns a Python list of the values, copied according to copy ("none", "shallow" or "deep")
+                return: list[Any]
+
+            13. __len__(self): Dunder method to implement len(linkedlist obj) functionality
+                return: int
+
+            14. __iter__(self): Dunder method to make linkedlist objects iterable, lazily yields the values (not nodes) chunk by chunk
+                return: iterator
+
+            15. __repr__(self): Dunder method to implement repr(linkedlist obj) functionality
+                return: str
+
+        - Internal Methods:
+
+            16. _locate(self, index: int): Returns the node holding index and the offset of index inside the node's chunk
+                return: tuple[Node, int]
+
+            17. _new_chunk(self, values: Iterable[Any]): Returns a new chunk (list or array.array) holding values
+                return: list | array.array
+
+            18. _split_node(self, node: Node): Moves the upper half of a full node's chunk into a new node linked right after it
+                return: Node
+
+            19. _validate_index(self, index: int): Returns True if the index is in valid bounds, otherwise returns False
+                return: bool
+
+            20. _is_empty(self): Returns True if the linkedlist is empty, otherwise returns False
+                return: bool
+"""
+
+from typing import Any, Iterable, Iterator
+from copy import copy as shallow_copy, deepcopy
+from array import array
+
+_COPY_MODES = ("none", "shallow", "deep")
+
+class Node:
+    __slots__ = ("items", "next")
+
+    def __init__(self, items: list | array):
+        self.items = items
+        self.next = None
+
+
+class UnrolledLinkedList:
+    def __init__(self, chunk_size: int = 64, typecode: str | None = None):
+        if (type(chunk_size) is not int):
+            raise TypeError("chunk_size for the UnrolledLinkedList object must be specified as int.")
+        if (chunk_size < 2):
+            raise ValueError("chunk_size for UnrolledLinkedList must be at least 2.")
+        if typecode is not None:
+            array(typecode) # raises ValueError for an invalid typecode
+        self.head = None
+        self.tail = None
+        self.length = 0
+        self.chunk_size = chunk_size
+        self.typecode = typecode
+        self._version = 0
+
+    def append(self, value: Any) -> None:
+        """Inserts value at the end of the linkedlist"""
+        if (self._is_empty()) or (len(self.tail.items) >= self.chunk_size):
+            new_node = Node(self._new_chunk((value,)))
+            if (self._is_empty()):
+                self.head = self.tail = new_node
+            else:
+                self.tail.next = new_node
+                self.tail = new_node
+        else:
+            self.tail.items.append(value)
+        self.length += 1
+        self._version += 1
+        return
+
+    def prepend(self, value: Any) -> None:
+        """Inserts value at the beginning of the linkedlist"""
+        if (self._is_empty()) or (len(self.head.items) >= self.chunk_size):
+            new_node = Node(self._new_chunk((value,)))
+            if (self._is_empty()):
+                self.head = self.tail = new_node
+            else:
+                new_node.next = self.head
+                self.head = new_node
+        else:
+            self.head.items.insert(0, value)
+        self.length += 1
+        self._version += 1
+        return
+
+    def insert(self, index: int, value: Any) -> None:
+        """Inserts value at the specified index (note - use append method to insert at the end)"""
+        if (not self._validate_index(index)):
+            raise IndexError("Invalid index")
+
+        node, offset = self._locate(index)
+        if len(node.items) >= self.chunk_size:
+            new_node = self._split_node(node)
+            if offset > len(node.items):
+                offset -= len(node.items)
+                node = new_node
+        node.items.insert(offset, value)
+        self.length += 1
+        self._version += 1
+        return
+
+    def remove(self, index: int) -> None:
+        """Removes the value at the specified index"""
+        if (not self._validate_index(index)):
+            raise IndexError("Error, invalid index specified")
+
+        prev_node = None
+        node = self.head
+        offset = index
+        while offset >= len(node.items):
+            offset -= len(node.items)
+            prev_node = node
+            node = node.next
+        del node.items[offset]
+
+        if not node.items:
+            # unlink the emptied node
+            if prev_node is None:
+                self.head = node.next
+            else:
+                prev_node.next = node.next
+            if node is self.tail:
+                self.tail = prev_node
+        elif (len(node.items) < self.chunk_size // 2) and (node.next is not None) \
+                and (len(node.items) + len(node.next.items) <= self.chunk_size):
+            # absorb the next node so chunks stay at least half full
+            next_node = node.next
+            node.items.extend(next_node.items)
+            node.next = next_node.next
+            if next_node is self.tail:
+                self.tail = node
+        self.length -= 1
+        self._version += 1
+        return
+
+    def get(self, index: int) -> Any | None:
+        """Returns the value at the specified index"""
+        if (not self._validate_index(index)):
+            return None
+        node, offset = self._locate(index)
+        return node.items[offset]
+
+    def set(self, index: int, value: Any) -> None:
+        """Updates the value at the specified index"""
+        if (not self._validate_index(index)):
+            raise IndexError("Error, invalid index specified")
+        node, offset = self._locate(index)
+        node.items[offset] = value
+        return
+
+    def find(self, value: Any) -> int:
+        """Returns the index of the first occurence of value, if not found returns -1"""
+        base: int = 0
+        node = self.head
+        while node is not None:
+            try:
+                return base + node.items.index(value)
+            except (ValueError, TypeError):
+                base += len(node.items)
+                node = node.next
+        return -1
+
+    def contains(self, value: Any) -> bool:
+        """Returns True if the specified value is in the linkedlist, otherwise returns False"""
+        return (self.find(value) > -1)
+
+    def find_all(self, value: Any) -> list[int]:
+        """Returns the indices of every occurence of value in a single pass"""
+        return [idx for idx, item in enumerate(self) if (item is value) or (item == value)]
+
+    def count(self, value: Any) -> int:
+        """Returns the number of occurences of value"""
+        total: int = 0
+        node = self.head
+        while node is not None:
+            total += node.items.count(value)
+            node = node.next
+        return total
+
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        """Returns the index of the first occurence of value in [start, stop) (negative bounds count from the end, as list.index),
+            raises ValueError if not found
+        """
+        start, stop, _ = slice(start, stop).indices(self.length)
+        if start < stop:
+            node, offset = self._locate(start)
+            base: int = start - offset
+            while (node is not None) and (base < stop):
+                try:
+                    return base + node.items.index(value, offset, stop - base)
+                except (ValueError, TypeError):
+                    base += len(node.items)
+                    node = node.next
+                    offset = 0
+        raise ValueError(f"{value!r} is not in linkedlist")
+
+    def to_list(self, copy: str = "none") -> list[Any]:
+        """Returns a Python list of the values, copy selects how values are copied: "none" (default), "shallow" or "deep" """
+        if copy not in _COPY_MODES:
+            raise ValueError(f"copy must be one of {_COPY_MODES}.")
+        values: list[Any] = []
+        node = self.head
+        while node is not None:
+            values.extend(node.items)
+            node = node.next
+        if copy == "shallow":
+            return [shallow_copy(value) for value in values]
+        elif copy == "deep":
+            return [deepcopy(value) for value in values]
+        return values
+
+    def __len__(self) -> int:
+        """Dunder method to implement len(linkedlist obj) functionality"""
+        return self.length
+
+    def __iter__(self) -> Iterator[Any]:
+        """Dunder method to make linkedlist objects iterable, lazily yields the values chunk by chunk"""
+        version: int = self._version
+        node = self.head
+        while node is not None:
+            for value in node.items:
+                yield value
+                if self._version != version:
+                    raise RuntimeError("UnrolledLinkedList changed size during iteration")
+            node = node.next
+
+    def __repr__(self) -> str:
+        """Dunder method to implement repr(linkedlist obj) functionality"""
+        return f"class_name=UnrolledLinkedList, id={id(self)}, length={self.length}, chunk_size={self.chunk_size}, typecode={self.typecode}"
+
+    def _locate(self, index: int) -> tuple[Node, int]:
+        """Returns the node holding index and the offset of index inside the node's chunk (index must be valid)"""
+        tail_start: int = self.length - len(self.tail.items)
+        if index >= tail_start:
+            return self.tail, index - tail_start
+        node = self.head
+        while index >= len(node.items):
+            index -= len(node.items)
+            node = node.next
+        return node, index
+
+    def _new_chunk(self, values: Iterable[Any]) -> list | array:
+        """Returns a new chunk (list or array.array) holding values"""
+        if self.typecode is None:
+            return list(values)
+        return array(self.typecode, values)
+
+    def _split_node(self, node: Node) -> Node:
+        """Moves the upper half of a full node's chunk into a new node linked right after it"""
+        middle: int = len(node.items) // 2
+        new_node = Node(self._new_chunk(node.items[middle:]))
+        del node.items[middle:]
+        new_node.next = node.next
+        node.next = new_node
+        if node is self.tail:
+            self.tail = new_node
+        return new_node
+
+    def _validate_index(self, index: int) -> bool:
+        """Returns True if the index is in valid bounds, otherwise returns False"""
+        if (index > -1 and index < self.length):
+            return True
+        else:
+            return False
+
+    def _is_empty(self) -> bool:
+        """Returns True if the linkedlist is empty, otherwise returns False"""
+        if (self.head is None and self.tail is None):
+            if (self.length == 0):
+                return True
+            else:
+                raise ValueError("Error, head is assigned to None but length is non-zero")
+        else:
+            if (self.length > 0):
+                return False
+            else:
+                raise ValueError("Error, head is not None but length is less than or equal to zero")
+
+#--------------------------------------------------------
+def _benchmark_script(num_elements: int = 200_000, num_lookups: int = 2_000):
+    """Compares build, iteration, indexed get and mid-list insert of UnrolledLinkedList (list and array chunks) with SinglyLinkedList"""
+    import random
+    import time
+
+    if not __package__: # run as a script, or imported by a module run as a script
+        from singly_linked_list import SinglyLinkedList
+    else:
+        from src.singly_linked_list import SinglyLinkedList
+
+    lookups = [random.randrange(num_elements) for _ in range(num_lookups)]
+    print(f"elements: {num_elements}, indexed gets/inserts: {num_lookups}")
+    print(f"{'':>32} {'append':>9} {'iterate':>9} {'get':>9} {'insert':>9} (seconds)")
+    for label, make in (
+        ("SinglyLinkedList", SinglyLinkedList),
+        ("UnrolledLinkedList (list)", UnrolledLinkedList),
+        ("UnrolledLinkedList (array 'q')", lambda: UnrolledLinkedList(typecode="q")),
+    ):
+        linkedlist = make()
+        start = time.perf_counter()
+        for i in range(num_elements):
+            linkedlist.append(i)
+        append_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in linkedlist:
+            pass
+        iterate_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for index in lookups:
+            linkedlist.get(index)
+        get_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for index in lookups:
+            linkedlist.insert(index, index)
+        insert_seconds = time.perf_counter() - start
+        print(f"{label:>32} {append_seconds:9.3f} {iterate_seconds:9.3f} {get_seconds:9.3f} {insert_seconds:9.3f}")
+
+if __name__ == "__main__":
+    _benchmark_script()
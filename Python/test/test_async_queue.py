@@ -0,0 +1,160 @@
+from src.async_queue import AsyncCircularQueue, AsyncDequeue, _AsyncQueueBase
+import asyncio
+import pytest
+
+def test_async_circular_queue_put_get_and_timeouts():
+    async def scenario():
+        queue = AsyncCircularQueue(capacity=3)
+        for val in range(1, 4):
+            assert await queue.put(val) is None
+        assert queue.is_full() and len(queue) == 3
+        with pytest.raises(OverflowError):
+            queue.put_nowait(4)
+        with pytest.raises(OverflowError):
+            await queue.put(4, timeout=0.01)
+        assert await queue.get() == 1
+        assert queue.get_nowait() == 2
+        assert await queue.get(timeout=1) == 3
+        with pytest.raises(IndexError):
+            await queue.get(timeout=0.01)
+        stats = queue.stats()
+        assert (stats["puts"], stats["gets"], stats["size"], stats["high_water_mark"]) == (3, 3, 0, 3)
+        assert (stats["rejected_puts"], stats["put_waits"], stats["empty_gets"], stats["get_waits"]) == (2, 1, 1, 1)
+        assert "capacity=3" in repr(queue)
+    asyncio.run(scenario())
+
+def test_async_circular_queue_parked_putters():
+    async def scenario():
+        queue = AsyncCircularQueue(capacity=2)
+        queue.put_nowait(1)
+        queue.put_nowait(2)
+        putter = asyncio.create_task(queue.put(3))
+        await asyncio.sleep(0)
+        assert not putter.done()
+        assert await queue.get() == 1 # wakes the parked putter
+        await putter
+
+        # a put cancelled while parked does not add its value
+        cancelled = asyncio.create_task(queue.put(4))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        assert cancelled.cancelled()
+        assert await queue.get_batch(10) == [2, 3]
+        assert len(queue._putters) == 0
+    asyncio.run(scenario())
+
+def test_async_circular_queue_overwrite():
+    async def scenario():
+        queue = AsyncCircularQueue(capacity=3, overwrite_if_full=True)
+        for val in range(1, 6):
+            await queue.put(val, timeout=0) # never parks, the oldest elements are overwritten
+        assert not queue.is_full()
+        assert queue.stats()["overwritten"] == 2
+        assert await queue.get_batch(10) == [3, 4, 5]
+    asyncio.run(scenario())
+
+@pytest.mark.parametrize("backend", ["linkedlist", "ring_buffer"])
+def test_async_dequeue_both_ends(backend):
+    async def scenario():
+        queue = AsyncDequeue(backend=backend)
+        await queue.put(2)
+        await queue.put_front(1)
+        queue.put_front_nowait(0)
+        queue.put_nowait(3)
+        assert not queue.is_full() and len(queue) == 4
+        assert await queue.get_back() == 3
+        assert queue.get_back_nowait() == 2
+        assert await queue.get_batch(5) == [0, 1]
+        with pytest.raises(IndexError):
+            queue.get_back_nowait()
+        assert "backend=" + backend in repr(queue)
+    asyncio.run(scenario())
+
+def test_async_dequeue_maxsize():
+    async def scenario():
+        queue = AsyncDequeue(maxsize=2, backend="ring_buffer")
+        await queue.put(1)
+        await queue.put_front(0)
+        with pytest.raises(OverflowError):
+            await queue.put_front(-1, timeout=0.01)
+        putter = asyncio.create_task(queue.put(2))
+        await asyncio.sleep(0)
+        assert await queue.get_back() == 1 # frees room for the parked putter
+        await putter
+        assert queue.get_nowait() == 0 and queue.get_nowait() == 2
+        assert queue.stats()["put_waits"] == 2
+        with pytest.raises(ValueError):
+            AsyncDequeue(maxsize=0)
+    asyncio.run(scenario())
+
+def test_async_dequeue_micro_batching():
+    async def scenario():
+        queue = AsyncDequeue()
+        batch = asyncio.create_task(queue.get_batch(3, timeout=5))
+        for val in (1, 2):
+            await queue.put(val)
+            await asyncio.sleep(0)
+        assert not batch.done() # waits for a full batch
+        await queue.put(3)
+        assert await batch == [1, 2, 3]
+
+        await queue.put(4)
+        assert await queue.get_batch(3, timeout=0.01) == [4] # the timeout returns a partial batch
+        assert await queue.get_batch(3, timeout=0.01) == []
+        waiting = asyncio.create_task(queue.get_batch(3)) # without a timeout, one value is enough
+        await asyncio.sleep(0)
+        await queue.put(5)
+        assert await waiting == [5]
+        with pytest.raises(ValueError):
+            await queue.get_batch(0)
+    asyncio.run(scenario())
+
+def test_async_dequeue_cancellation_safety():
+    async def scenario():
+        queue = AsyncDequeue()
+        # a getter cancelled after being woken passes the wakeup on, the value is not lost
+        first, second = asyncio.create_task(queue.get()), asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        queue.put_nowait(1)
+        first.cancel()
+        assert await second == 1
+        assert first.cancelled()
+
+        # a cancelled batch does not dequeue anything
+        queue.put_nowait(2)
+        batch = asyncio.create_task(queue.get_batch(3, timeout=5))
+        await asyncio.sleep(0)
+        batch.cancel()
+        await asyncio.sleep(0)
+        assert batch.cancelled() and queue.get_nowait() == 2
+        assert len(queue._getters) == len(queue._batch_waiters) == 0
+    asyncio.run(scenario())
+
+def test_get_batch_larger_than_capacity():
+    async def scenario():
+        # a full queue cannot reach max_items, so get_batch returns without waiting for its timeout
+        for queue in (AsyncCircularQueue(capacity=2), AsyncCircularQueue(capacity=2, overwrite_if_full=True), AsyncDequeue(maxsize=2)):
+            queue.put_nowait(1)
+            batch = asyncio.create_task(queue.get_batch(4, timeout=5))
+            await asyncio.sleep(0)
+            assert not batch.done()
+            await queue.put(2)
+            assert await asyncio.wait_for(batch, timeout=1) == [1, 2]
+    asyncio.run(scenario())
+
+def test_queue_hooks_are_abstract():
+    class UnboundedQueue(_AsyncQueueBase): # missing _capacity
+        def _size(self):
+            return 0
+        def _is_full(self):
+            return False
+        def _enqueue(self, value, front):
+            pass
+        def _dequeue(self, back):
+            pass
+        def _dequeue_many(self, max_items):
+            return []
+
+    with pytest.raises(TypeError):
+        UnboundedQueue()
@@ -0,0 +1,135 @@
+from src.blocking_queue import BlockingQueue, BlockingCircularQueue, _BlockingQueueBase
+import threading
+import time
+import pytest
+
+def _run_multi_producer_multi_consumer(queue, num_producers=3, num_consumers=3, per_producer=300):
+    """Moves num_producers * per_producer values through queue, consumers stop on a -1 sentinel each, returns what they received"""
+    received, lock = [], threading.Lock()
+
+    def producer(offset):
+        for val in range(per_producer):
+            queue.put(offset + val + 1)
+
+    def consumer():
+        while True:
+            values = queue.get_many(8)
+            if -1 in values:
+                for _ in range(values.count(-1) - 1): # hand the other consumers' stop sentinels back
+                    queue.put(-1)
+                with lock:
+                    received.extend(val for val in values if val != -1)
+                return
+            with lock:
+                received.extend(values)
+
+    producers = [threading.Thread(target=producer, args=(idx * per_producer,)) for idx in range(num_producers)]
+    consumers = [threading.Thread(target=consumer) for _ in range(num_consumers)]
+    for thread in producers + consumers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    for _ in range(num_consumers):
+        queue.put(-1)
+    for thread in consumers:
+        thread.join()
+    assert queue.is_empty()
+    return sorted(received)
+
+@pytest.mark.parametrize("backend", ["linkedlist", "ring_buffer"])
+def test_blocking_queue_unbounded(backend):
+    queue = BlockingQueue(backend=backend)
+    for val in range(1, 101):
+        assert queue.put_nowait(val) is None
+    assert not queue.is_full() and len(queue) == 100
+    assert queue.get() == 1
+    assert queue.get_many(9) == list(range(2, 11))
+    assert queue.get_many(1_000) == list(range(11, 101))
+    with pytest.raises(IndexError):
+        queue.get_nowait()
+    assert queue.get_many(3, timeout=0) == []
+    assert queue.stats()["high_water_mark"] == 100
+    with pytest.raises(ValueError):
+        BlockingQueue(maxsize=0)
+    with pytest.raises(ValueError):
+        BlockingQueue(backend="array")
+
+def test_blocking_queue_maxsize_and_timeouts():
+    queue = BlockingQueue(maxsize=2, backend="ring_buffer")
+    queue.put(1)
+    queue.put(2, timeout=1)
+    assert queue.is_full()
+    with pytest.raises(OverflowError):
+        queue.put(3, block=False)
+    with pytest.raises(OverflowError):
+        queue.put(3, timeout=0.01)
+    assert queue.get_many(5) == [1, 2]
+    with pytest.raises(IndexError):
+        queue.get(timeout=0.01)
+    assert queue.get_many(5, timeout=0.01) == []
+    with pytest.raises(ValueError):
+        queue.get_many(0)
+
+    stats = queue.stats()
+    assert (stats["puts"], stats["gets"], stats["size"], stats["high_water_mark"]) == (2, 2, 0, 2)
+    # a put_nowait is rejected without waiting, the timed-out put/get/get_many each count a wait
+    assert (stats["rejected_puts"], stats["put_waits"], stats["empty_gets"], stats["get_waits"]) == (2, 1, 2, 2)
+    assert stats["put_wait_seconds"] > 0 and stats["get_wait_seconds"] > 0
+    assert "maxsize=2" in repr(queue)
+
+def test_blocking_queue_wakes_waiting_consumer():
+    queue = BlockingQueue()
+    results = []
+    consumer = threading.Thread(target=lambda: results.append(queue.get_many(10, timeout=5)))
+    consumer.start()
+    time.sleep(0.02)
+    queue.put("value")
+    consumer.join()
+    assert results == [["value"]]
+    assert queue.stats()["get_waits"] == 1
+
+def test_blocking_queue_multi_producer_multi_consumer():
+    assert _run_multi_producer_multi_consumer(BlockingQueue(maxsize=8)) == list(range(1, 901))
+
+def test_blocking_circular_queue_blocks_producers():
+    queue = BlockingCircularQueue(capacity=2)
+    queue.put(1)
+    queue.put(2)
+    with pytest.raises(OverflowError):
+        queue.put_nowait(3)
+    producer = threading.Thread(target=queue.put, args=(3,), kwargs={"timeout": 5})
+    producer.start()
+    time.sleep(0.02)
+    assert len(queue) == 2 # the producer is blocked
+    assert queue.get() == 1 # and woken by the get
+    producer.join()
+    assert queue.get_many(10) == [2, 3]
+    stats = queue.stats()
+    assert (stats["puts"], stats["rejected_puts"], stats["put_waits"], stats["overwritten"]) == (3, 1, 1, 0)
+    assert "capacity=2" in repr(queue)
+
+def test_blocking_circular_queue_overwrite():
+    queue = BlockingCircularQueue(capacity=3, overwrite_if_full=True)
+    for val in range(1, 6):
+        queue.put(val, timeout=0) # never blocks, the oldest elements are overwritten
+    assert not queue.is_full() and len(queue) == 3
+    stats = queue.stats()
+    assert (stats["overwritten"], stats["put_waits"], stats["high_water_mark"]) == (2, 0, 3)
+    assert queue.get_many(10) == [3, 4, 5]
+
+def test_blocking_circular_queue_multi_producer_multi_consumer():
+    assert _run_multi_producer_multi_consumer(BlockingCircularQueue(capacity=4), num_producers=2) == list(range(1, 601))
+
+def test_queue_hooks_are_abstract():
+    class NoBatchQueue(_BlockingQueueBase):
+        def _size(self):
+            return 0
+        def _is_full(self):
+            return False
+        def _enqueue(self, value):
+            pass
+        def _dequeue(self):
+            pass
+
+    with pytest.raises(TypeError):
+        NoBatchQueue()
@@ -0,0 +1,150 @@
+from src.cache import LRUCache, LFUCache, _BoundedCache
+import pytest
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction_order():
+    cache = LRUCache(max_entries=3)
+
+    for key in ("a", "b", "c"):
+        assert cache.put(key, key.upper()) is None
+
+    assert cache.get("a") == "A" # "b" is now the least recently used
+    cache.put("d", "D")
+
+    assert "b" not in cache
+    assert len(cache) == 3
+    assert [cache.get(key) for key in ("a", "c", "d")] == ["A", "C", "D"]
+    assert cache.evict() == ("a", "A")
+
+    stats = cache.stats()
+    assert stats["hits"] == 4
+    assert stats["misses"] == 0
+    assert stats["evictions"] == 2
+
+    assert cache.get("b") is None
+    assert cache.stats()["misses"] == 1
+
+    del cache
+
+def test_lru_update_and_delete():
+    cache = LRUCache(max_entries=2)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("a", 10) # update counts as a use
+    cache.put("c", 3)
+
+    assert cache.get("a") == 10
+    assert "b" not in cache
+
+    cache.delete("a")
+    assert "a" not in cache
+    with pytest.raises(KeyError):
+        cache.delete("a")
+
+    cache.clear()
+    assert len(cache) == 0
+    with pytest.raises(IndexError):
+        cache.evict()
+
+    del cache
+
+def test_max_weight():
+    cache = LRUCache(max_weight=10, weigher=lambda key, value: len(value))
+
+    cache.put("a", "xxxx")
+    cache.put("b", "xxxx")
+    cache.put("c", "xxxx") # total weight 12 > 10, evicts "a"
+
+    assert "a" not in cache
+    assert cache.stats()["weight"] == 8
+
+    with pytest.raises(ValueError):
+        cache.put("d", "x" * 11)
+
+    cache.put("e", "x", weight=5) # explicit weight overrides the weigher, evicts "b"
+    assert "b" not in cache and "c" in cache and "e" in cache
+
+    del cache
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    cache = LRUCache(max_entries=10, ttl=5, clock=clock)
+
+    cache.put("a", 1)
+    cache.put("b", 2, ttl=20)
+    clock.now = 6
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert "a" not in cache
+
+    cache.put("c", 3)
+    clock.now = 30
+    assert cache.purge_expired() == 2
+    assert len(cache) == 0
+    assert cache.stats()["expirations"] == 3
+
+    del cache
+
+def test_lfu_eviction_order():
+    cache = LFUCache(max_entries=3)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    for _ in range(3):
+        cache.get("a")
+    cache.get("b")
+
+    assert cache.frequency("a") == 4
+    assert cache.frequency("b") == 2
+    assert cache.frequency("c") == 1
+
+    cache.put("d", 4) # "c" is the least frequently used
+    assert "c" not in cache
+
+    cache.put("e", 5) # the new entry is never its own victim, so "d" goes
+    assert "d" not in cache
+    assert [key for key in ("a", "b", "e") if key in cache] == ["a", "b", "e"]
+
+    # ties on frequency evict the least recently used entry
+    cache.get("e")
+    assert cache.evict() == ("b", 2)
+
+    del cache
+
+def test_lfu_delete_keeps_frequency_buckets_consistent():
+    cache = LFUCache(max_entries=10)
+
+    for key in range(5):
+        cache.put(key, key+1)
+        for _ in range(key):
+            cache.get(key)
+
+    cache.delete(0)
+    cache.delete(2)
+    assert [cache.evict() for _ in range(3)] == [(1, 2), (3, 4), (4, 5)]
+    assert len(cache.frequencies) == 0
+
+    del cache
+
+def test_policy_hooks_are_abstract():
+    class NoVictimPolicy(_BoundedCache):
+        def _on_insert(self, node):
+            pass
+        def _on_access(self, node):
+            pass
+        def _on_remove(self, node):
+            pass
+
+    # a policy missing a hook fails when it is constructed, not at its first eviction
+    with pytest.raises(TypeError):
+        NoVictimPolicy(max_entries=2)
@@ -0,0 +1,39 @@
+from src.circular_queue import CircularQueue
+import pytest
+
+TEST_VALS = (-100, -10, 0, 10, 20, 30, 40, 50, 60)
+
+def test_enqueue_and_dequeue():
+    queue = CircularQueue(capacity=len(TEST_VALS))
+
+    for val in TEST_VALS:
+        assert queue.enqueue(val) is None
+    assert len(queue) == len(TEST_VALS)
+    with pytest.raises(OverflowError):
+        queue.enqueue(70)
+
+    for val in TEST_VALS:
+        assert queue.peek() == val
+        assert queue.dequeue() == val
+    assert queue.is_empty() is True
+    with pytest.raises(IndexError):
+        queue.dequeue()
+
+    del queue
+
+def test_overwrite_if_full():
+    capacity = 4
+    queue = CircularQueue(capacity=capacity, overwrite_if_full=True)
+
+    # the two oldest values are overwritten, the front moves on to the oldest survivor
+    for val in range(capacity + 2):
+        queue.enqueue(val)
+    assert len(queue) == capacity
+    assert list(queue) == [2, 3, 4, 5]
+    assert queue.peek() == 2
+
+    for val in range(2, capacity + 2):
+        assert queue.dequeue() == val
+    assert queue.is_empty() is True
+
+    del queue
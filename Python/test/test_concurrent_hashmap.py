@@ -0,0 +1,98 @@
+from src.concurrent_hashmap import ConcurrentHashMap
+import threading
+import pytest
+
+def test_add_get_delete():
+    hashmap = ConcurrentHashMap(num_stripes=4)
+    kv_pairs = [
+        ("key1", 1000),
+        (12, "John Doe"),
+        ((3, 4), "Tony Stark"),
+    ]
+
+    for key, value in kv_pairs:
+        assert hashmap.add(key=key, value=value) is None
+    assert len(hashmap) == len(kv_pairs)
+    for key, value in kv_pairs:
+        assert hashmap.get(key) == value
+        assert hashmap[key] == value
+        assert key in hashmap
+    assert hashmap.get("nonexistent") is None
+    assert "nonexistent" not in hashmap
+    assert [1] not in hashmap
+
+    hashmap["key1"] = 5
+    assert hashmap.get("key1") == 5
+    del hashmap[12]
+    assert 12 not in hashmap
+    with pytest.raises(KeyError):
+        hashmap.delete(12)
+    with pytest.raises(KeyError):
+        hashmap[12]
+    assert sorted(hashmap.items(), key=repr) == sorted([("key1", 5), ((3, 4), "Tony Stark")], key=repr)
+
+    with pytest.raises(TypeError):
+        hashmap.add([1, 2], 3)
+    with pytest.raises(ValueError):
+        ConcurrentHashMap(num_stripes=0)
+    with pytest.raises(ValueError):
+        ConcurrentHashMap(multimap=True)
+
+@pytest.mark.parametrize("lock_free_reads", [True, False])
+def test_get_or_add_and_compute(lock_free_reads):
+    hashmap = ConcurrentHashMap(lock_free_reads=lock_free_reads)
+    assert hashmap.get_or_add("a", 1) == 1
+    assert hashmap.get_or_add("a", 2) == 1
+
+    assert hashmap.compute("a", lambda key, old: old + 10) == 11
+    assert hashmap.compute("b", lambda key, old: 1 if old is None else old + 1) == 1
+    assert hashmap.get("b") == 1
+    # returning None removes the key, and is a no-op for a missing key
+    assert hashmap.compute("a", lambda key, old: None) is None
+    assert "a" not in hashmap
+    assert hashmap.compute("missing", lambda key, old: None) is None
+    assert hashmap.compute("b", lambda key, old: old - 1) == 0 # falsy results are stored
+    assert hashmap.get("b") == 0
+    assert len(hashmap) == 1
+
+@pytest.mark.parametrize("lock_free_reads", [True, False])
+def test_concurrent_updates(lock_free_reads):
+    hashmap = ConcurrentHashMap(num_stripes=4, lock_free_reads=lock_free_reads)
+    num_threads, increments = 8, 500
+    created = []
+
+    def worker(thread_id):
+        for i in range(increments):
+            hashmap.compute("counter", lambda key, old: 1 if old is None else old + 1)
+            if hashmap.get_or_add(f"key{i}", thread_id) == thread_id:
+                created.append(i)
+            hashmap.add((thread_id, i), i + 1)
+            assert hashmap.get((thread_id, i)) == i + 1
+
+    threads = [threading.Thread(target=worker, args=(thread_id,)) for thread_id in range(1, num_threads + 1)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert hashmap.get("counter") == num_threads * increments
+    # every key was created by exactly one thread
+    assert sorted(created) == list(range(increments))
+    assert len(hashmap) == 1 + increments + num_threads * increments
+
+def test_lock_free_misses():
+    class UnusableLock:
+        def __enter__(self):
+            raise AssertionError("a lock-free read took the stripe lock")
+        def __exit__(self, *exc_info):
+            return False
+
+    hashmap = ConcurrentHashMap(num_stripes=2)
+    hashmap.add("key", 1)
+    hashmap._locks = [UnusableLock() for _ in hashmap._locks]
+    # misses (membership tests and the KeyError path) stay on the lock-free path
+    assert "missing" not in hashmap
+    with pytest.raises(KeyError):
+        hashmap["missing"]
+    assert hashmap.get("missing", default=-1) == -1
+    assert hashmap["key"] == 1 and "key" in hashmap
@@ -1,9 +1,12 @@
 from src.dequeue import Dequeue
+from collections import deque
+import pytest
 
 TEST_VALS = (-100, -10, 0, 10, 20, 30, 40, 50, 60)
 
-def test_enqueue_and_dequeue():
-    dequeue = Dequeue()
+@pytest.mark.parametrize("backend", ["linkedlist", "ring_buffer"])
+def test_enqueue_and_dequeue(backend):
+    dequeue = Dequeue(backend=backend)
 
     for val in TEST_VALS:
         assert dequeue.enqueue(val) is None
@@ -14,8 +17,9 @@ def test_enqueue_and_dequeue():
     del dequeue
 
 
-def test_peek():
-    dequeue = Dequeue()
+@pytest.mark.parametrize("backend", ["linkedlist", "ring_buffer"])
+def test_peek(backend):
+    dequeue = Dequeue(backend=backend)
 
     for val in TEST_VALS:
         dequeue.enqueue(val)
@@ -26,8 +30,9 @@ def test_peek():
         
     del dequeue
 
-def test_enqueue_front_and_dequeue_back():
-    dequeue = Dequeue()
+@pytest.mark.parametrize("backend", ["linkedlist", "ring_buffer"])
+def test_enqueue_front_and_dequeue_back(backend):
+    dequeue = Dequeue(backend=backend)
 
     for val in TEST_VALS:
         assert dequeue.enqueue_front(val) is None
@@ -37,8 +42,9 @@ def test_enqueue_front_and_dequeue_back():
 
     del dequeue
 
-def test_peek_back():
-    dequeue = Dequeue()
+@pytest.mark.parametrize("backend", ["linkedlist", "ring_buffer"])
+def test_peek_back(backend):
+    dequeue = Dequeue(backend=backend)
 
     for val in TEST_VALS:
         dequeue.enqueue_front(val)
@@ -85,4 +91,27 @@ def test__repr__():
     assert type(repr(dequeue)) is str
     assert len(repr(dequeue)) > 0
 
-    del dequeue
\ No newline at end of file
+    del dequeue
+
+@pytest.mark.parametrize("backend", ["linkedlist", "ring_buffer"])
+def test_deque_operations_match_collections_deque(backend):
+    dequeue, expected = Dequeue(backend=backend), deque()
+    dequeue.extend(TEST_VALS)
+    expected.extend(TEST_VALS)
+    dequeue.extendleft([1, 2, 3])
+    expected.extendleft([1, 2, 3])
+    assert list(dequeue) == list(expected)
+    for steps in (0, 1, -1, 3, -5, 7, 100, -100, len(expected), 5):
+        dequeue.rotate(steps)
+        expected.rotate(steps)
+        assert list(dequeue) == list(expected)
+    for index in (0, 5, -1, -len(expected)):
+        assert dequeue[index] == expected[index]
+    with pytest.raises(IndexError):
+        dequeue[len(expected)]
+    assert dequeue.peek() == expected[0] and dequeue.peek_back() == expected[-1]
+    assert dequeue.dequeue_back() == expected.pop()
+    assert dequeue.dequeue() == expected.popleft()
+    assert len(dequeue) == len(expected)
+    with pytest.raises(ValueError):
+        Dequeue(backend="array")
@@ -1,4 +1,7 @@
 from src.doubly_linked_list import DoublyLinkedList
+from collections import deque
+import pytest
+import random
 
 TEST_VALS = (10, 20, 30, 40, 50, 60)
 
@@ -45,6 +48,35 @@ def test__iter__():
     for idx, node in enumerate(linkedlist):
         assert node.value == TEST_VALS[idx]
 
+    # iteration is lazy and yields the linkedlist's own nodes, not copies
+    iterator = iter(linkedlist)
+    assert next(iterator) is linkedlist.head
+    linkedlist.set(1, 25)
+    assert next(iterator).value == 25
+
+    # structural changes during iteration are detected
+    linkedlist.append(70)
+    with pytest.raises(RuntimeError):
+        next(iterator)
+    with pytest.raises(RuntimeError):
+        for node in linkedlist:
+            linkedlist.remove(0)
+
+    del linkedlist
+
+def test__reversed__():
+    linkedlist = DoublyLinkedList()
+
+    for val in TEST_VALS:
+        linkedlist.append(val)
+
+    assert [node.value for node in reversed(linkedlist)] == list(reversed(TEST_VALS))
+    assert list(reversed(DoublyLinkedList())) == []
+
+    with pytest.raises(RuntimeError):
+        for node in reversed(linkedlist):
+            linkedlist.prepend(0)
+
     del linkedlist
 
 def test__repr__():
@@ -183,4 +215,410 @@ def test_pop_first():
 
     assert linkedlist.pop_first() is None
 
-    del linkedlist
\ No newline at end of file
+    del linkedlist
+def test_to_list_copy_modes():
+    linkedlist = DoublyLinkedList()
+    values = [[1], [2, [3]]]
+    for val in values:
+        linkedlist.append(val)
+
+    # default: no copying, the values are the linkedlist's own objects
+    assert all(a is b for a, b in zip(linkedlist.to_list(), values))
+    shallow = linkedlist.to_list(copy="shallow")
+    assert shallow == values and shallow[1] is not values[1] and shallow[1][1] is values[1][1]
+    deep = linkedlist.to_list(copy="deep")
+    assert deep == values and deep[1][1] is not values[1][1]
+
+    assert linkedlist.to_list(return_nodes=True)[0] is linkedlist.head
+    with pytest.raises(ValueError):
+        linkedlist.to_list(copy="bogus")
+    with pytest.raises(ValueError):
+        linkedlist.to_list(return_nodes=True, copy="deep")
+
+    del linkedlist
+
+def test_find_all_count_index():
+    linkedlist = DoublyLinkedList()
+    for val in (10, 20, 10, 30, 10):
+        linkedlist.append(val)
+
+    assert linkedlist.find(10) == 0
+    assert linkedlist.find_all(10) == [0, 2, 4]
+    assert linkedlist.find_all(99) == []
+    assert linkedlist.count(10) == 3
+    assert linkedlist.count(99) == 0
+
+    assert linkedlist.index(10) == 0
+    assert linkedlist.index(10, 1) == 2
+    assert linkedlist.index(10, -2) == 4
+    assert linkedlist.index(30, 0, 4) == 3
+    with pytest.raises(ValueError):
+        linkedlist.index(30, 0, 3)
+    with pytest.raises(ValueError):
+        linkedlist.index(10, 5)
+    with pytest.raises(ValueError):
+        DoublyLinkedList().index(10)
+
+    del linkedlist
+
+def test_node_slots_and_pool():
+    linkedlist = DoublyLinkedList()
+    linkedlist.append(10)
+    assert not hasattr(linkedlist.head, "__dict__")
+    with pytest.raises(AttributeError):
+        linkedlist.head.extra = 1
+
+    with pytest.raises(ValueError):
+        DoublyLinkedList(node_pool_size=-1)
+
+    # removed nodes are cleared and recycled, up to node_pool_size of them
+    linkedlist = DoublyLinkedList(node_pool_size=2)
+    for val in TEST_VALS:
+        linkedlist.append(val)
+    removed_nodes = [linkedlist._get_node(idx) for idx in range(3)]
+    for _ in range(3):
+        linkedlist.remove(0)
+    assert all(node.value is None for node in removed_nodes)
+    assert linkedlist._free_count == 2
+
+    linkedlist.prepend(30)
+    linkedlist.append(70)
+    linkedlist.insert(1, 35)
+    assert linkedlist._free_count == 0
+    assert sum(node is removed for node in linkedlist for removed in removed_nodes) == 2
+    assert linkedlist.to_list() == [30, 35, 40, 50, 60, 70]
+
+    del linkedlist
+
+def test_cursor():
+    linkedlist = DoublyLinkedList()
+    for val in TEST_VALS:
+        linkedlist.append(val)
+
+    cursor = linkedlist.cursor()
+    assert cursor.value == 10 and cursor.index == 0
+    assert cursor.move_prev() is False
+    # walk front to back, editing as we go
+    while True:
+        if cursor.value == 30:
+            cursor.insert_before(25)
+            cursor.insert_after(35)
+        elif cursor.value == 50:
+            assert cursor.remove_here() == 50
+            assert cursor.value == 60
+            continue
+        else:
+            cursor.set_value(cursor.value + 1)
+        if not cursor.move_next():
+            break
+    assert linkedlist.to_list() == [11, 21, 25, 30, 36, 41, 61]
+    assert cursor.index == len(linkedlist) - 1 and cursor.node is linkedlist.tail
+
+    assert cursor.move_prev() is True and cursor.value == 41
+    cursor.move_next()
+    assert cursor.remove_here() == 61
+    assert cursor.value == 41 and cursor.index == 5 and linkedlist.tail.value == 41
+
+    first = linkedlist.cursor(0)
+    first.insert_before(1)
+    assert linkedlist.head.value == 1 and first.index == 1 and linkedlist.get(first.index) == 11
+
+    # edits made outside the cursor invalidate it
+    linkedlist.append(100)
+    with pytest.raises(RuntimeError):
+        first.move_next()
+    with pytest.raises(IndexError):
+        linkedlist.cursor(len(linkedlist))
+
+    # a cursor on an empty linkedlist inserts the first node
+    empty = DoublyLinkedList()
+    cursor = empty.cursor()
+    with pytest.raises(IndexError):
+        cursor.value
+    cursor.insert_after(5)
+    cursor.insert_before(4)
+    assert empty.to_list() == [4, 5] and cursor.value == 5 and cursor.index == 1
+    cursor.remove_here()
+    cursor.remove_here()
+    assert len(empty) == 0 and cursor.node is None and cursor.index == 0
+
+    del linkedlist
+
+def test_get_node_positional_cache():
+    linkedlist = DoublyLinkedList()
+    values = list(range(100))
+    for val in values:
+        linkedlist.append(val)
+
+    # sequential access in the middle walks from the cached node
+    for idx in range(40, 60):
+        assert linkedlist.get(idx) == idx
+        assert linkedlist._cache_index == idx
+    assert linkedlist.get(45) == 45
+
+    # edits keep the cache pointing at the node now at the edited index
+    linkedlist.remove(50)
+    values.remove(50)
+    assert linkedlist._cache_node.value == 51
+    linkedlist.insert(50, 500)
+    values.insert(50, 500)
+    assert linkedlist._cache_node.value == 500
+    linkedlist.append(1000)
+    values.append(1000)
+    assert linkedlist.to_list() == values
+    for idx in (49, 51, 10, 90, 50, 0, len(values) - 1):
+        assert linkedlist.get(idx) == values[idx]
+
+    del linkedlist
+
+def _check_links(linkedlist):
+    """Follows the next links from head and the prev links from tail, both must visit the same len(linkedlist) nodes"""
+    forward, node = [], linkedlist.head
+    while node is not None:
+        forward.append(node)
+        node = node.next
+    backward, node = [], linkedlist.tail
+    while node is not None:
+        backward.append(node)
+        node = node.prev
+    assert len(forward) == len(linkedlist)
+    assert [id(node) for node in forward] == [id(node) for node in reversed(backward)]
+
+def test_bulk_operations():
+    linkedlist = DoublyLinkedList()
+    linkedlist.extend(iter(TEST_VALS))
+    _check_links(linkedlist)
+
+    # splicing into the middle relinks prev of the node after the spliced nodes
+    other = DoublyLinkedList()
+    other.extend([1, 2])
+    linkedlist.splice(other, 2)
+    assert [node.value for node in reversed(linkedlist)] == [60, 50, 40, 30, 2, 1, 20, 10]
+    assert len(other) == 0 and other.head is None and other.tail is None
+    _check_links(linkedlist)
+
+    # the new head has no prev and the new tail no next, pop and pop_first start from them
+    other.extend([0])
+    linkedlist.splice(other, 0)
+    other.extend([9])
+    linkedlist.concat(other)
+    assert linkedlist.head.prev is None and linkedlist.tail.next is None
+    assert linkedlist.pop() == 9 and linkedlist.pop_first() == 0
+    _check_links(linkedlist)
+    with pytest.raises(IndexError):
+        linkedlist.splice(other, len(linkedlist) + 1)
+    with pytest.raises(ValueError):
+        linkedlist.splice(linkedlist, 0)
+    with pytest.raises(TypeError):
+        linkedlist.splice([1], 0)
+
+    # indexes past the middle walk prev links from the tail
+    values = linkedlist.to_list()
+    for sl in (slice(None), slice(2, 5), slice(None, None, 3), slice(-1, -5, -1)):
+        sliced = linkedlist[sl]
+        assert type(sliced) is DoublyLinkedList
+        assert sliced.to_list() == values[sl]
+        _check_links(sliced)
+    assert [linkedlist[idx] for idx in range(-len(values), len(values))] == values * 2
+    with pytest.raises(IndexError):
+        linkedlist[len(values)]
+
+    # removing ranges at both ends, then popping from each end
+    linkedlist.remove_range(0, 2)
+    del values[0:2]
+    linkedlist.remove_range(-2, len(linkedlist))
+    del values[-2:]
+    assert linkedlist.head.prev is None and linkedlist.tail.next is None
+    _check_links(linkedlist)
+    assert linkedlist.pop() == values.pop() and linkedlist.pop_first() == values.pop(0)
+    linkedlist.extend([70, 80])
+    values.extend([70, 80])
+    linkedlist.remove_range(1, 3)
+    del values[1:3]
+    assert linkedlist.to_list() == values
+    _check_links(linkedlist)
+
+    # reverse swaps every next/prev pair
+    linkedlist.reverse()
+    assert [node.value for node in reversed(linkedlist)] == values
+    _check_links(linkedlist)
+
+    linkedlist.remove_range(0, len(linkedlist))
+    assert len(linkedlist) == 0 and linkedlist.head is None and linkedlist.tail is None
+    linkedlist.reverse()
+    linkedlist.extend([1])
+    _check_links(linkedlist)
+
+    del linkedlist
+
+def test_rotate():
+    for size in (0, 1, 2, 5, 6):
+        for steps in (-7, -3, -1, 0, 1, 2, 3, 4, 13):
+            linkedlist = DoublyLinkedList()
+            linkedlist.extend(range(size))
+            expected = deque(range(size))
+            linkedlist.rotate(steps)
+            expected.rotate(steps)
+            assert linkedlist.to_list() == list(expected)
+            _check_links(linkedlist)
+            assert (linkedlist.head is None) or (linkedlist.head.prev is None and linkedlist.tail.next is None)
+
+    # nodes are relinked, not copied, and the cached node from an earlier lookup is not reused
+    linkedlist = DoublyLinkedList()
+    linkedlist.extend(TEST_VALS)
+    nodes = linkedlist.to_list(return_nodes=True)
+    assert linkedlist[4] == 50
+    linkedlist.rotate(2)
+    assert linkedlist.to_list(return_nodes=True) == nodes[-2:] + nodes[:-2]
+    assert [linkedlist[idx] for idx in range(len(TEST_VALS))] == [50, 60, 10, 20, 30, 40]
+    with pytest.raises(RuntimeError):
+        for node in linkedlist:
+            linkedlist.rotate()
+
+def test_sort():
+    rng = random.Random(19)
+    for size in (0, 1, 2, 7, 64, 257):
+        records = [(rng.randrange(10), idx) for idx in range(size)]
+        for key, reverse in ((None, False), (None, True), (lambda record: record[0], False), (lambda record: record[0], True)):
+            linkedlist = DoublyLinkedList()
+            linkedlist.extend(records)
+            linkedlist.sort(key=key, reverse=reverse)
+            # stable, like list.sort
+            assert linkedlist.to_list() == sorted(records, key=key, reverse=reverse)
+            _check_links(linkedlist)
+
+    linkedlist = DoublyLinkedList()
+    linkedlist.extend([3, 1, 2])
+    linkedlist.sort()
+    # the sorted nodes' prev links are rebuilt, so walking back from the tail works
+    assert linkedlist.pop() == 3 and [node.value for node in reversed(linkedlist)] == [2, 1]
+
+def test_sorted_insert():
+    linkedlist = DoublyLinkedList()
+    for value in (5, 1, 3, 3, 9, 0):
+        linkedlist.sorted_insert(value)
+    assert linkedlist.to_list() == [0, 1, 3, 3, 5, 9]
+    assert linkedlist.sorted_insert(10) == 6 and linkedlist.tail.value == 10
+    _check_links(linkedlist)
+
+    # equal keys go after the existing ones
+    records = DoublyLinkedList()
+    for record in (("b", 2), ("a", 1), ("c", 2), ("d", 0)):
+        records.sorted_insert(record, key=lambda record: record[1], reverse=True)
+    assert records.to_list() == [("b", 2), ("c", 2), ("a", 1), ("d", 0)]
+    _check_links(records)
+
+def test_merge_sorted():
+    first, second, third = DoublyLinkedList(), DoublyLinkedList(), DoublyLinkedList()
+    first.extend([(1, "a"), (4, "a"), (9, "a")])
+    second.extend([(1, "b"), (2, "b"), (4, "b")])
+    third.extend([(0, "c")])
+    merged = DoublyLinkedList.merge_sorted([first, second, third, DoublyLinkedList()], key=lambda record: record[0])
+    assert merged.to_list() == [(0, "c"), (1, "a"), (1, "b"), (2, "b"), (4, "a"), (4, "b"), (9, "a")]
+    assert len(first) == len(second) == len(third) == 0 and first.head is None
+    _check_links(merged)
+
+    first.extend([9, 5, 1])
+    second.extend([8, 2])
+    merged = DoublyLinkedList.merge_sorted([first, second], reverse=True)
+    assert merged.to_list() == [9, 8, 5, 2, 1]
+    _check_links(merged)
+    assert len(DoublyLinkedList.merge_sorted([])) == 0
+    with pytest.raises(ValueError):
+        DoublyLinkedList.merge_sorted([merged, merged])
+    with pytest.raises(TypeError):
+        DoublyLinkedList.merge_sorted([merged, [1]])
+
+def _check_index(linkedlist):
+    nodes = list(linkedlist)
+    indexed = [node for key in linkedlist._index for node in linkedlist._index.get(key)]
+    assert sorted(map(id, indexed)) == sorted(map(id, nodes))
+    for key in linkedlist._index:
+        assert all(linkedlist._index_key(node.value) == key for node in linkedlist._index.get(key))
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_remove_value_and_move(indexed):
+    linkedlist = DoublyLinkedList(indexed=indexed)
+    linkedlist.extend([1, 2, 3, 2, 4])
+    assert linkedlist.contains(3) and not linkedlist.contains(5) and not linkedlist.contains(1.5)
+
+    assert linkedlist.remove_value(2) is None
+    assert linkedlist.to_list() == [1, 3, 2, 4]
+    linkedlist.move_to_front(4)
+    linkedlist.move_to_back(1)
+    linkedlist.move_to_front(4)
+    assert linkedlist.to_list() == [4, 3, 2, 1]
+    _check_links(linkedlist)
+    for method in (linkedlist.remove_value, linkedlist.move_to_front, linkedlist.move_to_back):
+        with pytest.raises(ValueError):
+            method(5)
+    assert DoublyLinkedList(indexed=indexed)._find_value_node(1) is None
+
+def test_index_consistency():
+    linkedlist = DoublyLinkedList(node_pool_size=4, indexed=True)
+    linkedlist.extend(range(10))
+    linkedlist.append(10)
+    linkedlist.prepend(-1)
+    linkedlist.insert(3, 100)
+    linkedlist.set(0, 200)
+    linkedlist.remove(5)
+    linkedlist.pop()
+    linkedlist.pop_first()
+    linkedlist.remove_range(2, 4)
+    linkedlist.sorted_insert(7)
+    linkedlist.reverse()
+    linkedlist.sort()
+    cursor = linkedlist.cursor(1)
+    cursor.insert_before(300)
+    cursor.insert_after(301)
+    cursor.set_value(302)
+    cursor.remove_here()
+    other = DoublyLinkedList(indexed=True)
+    other.extend([400, 401])
+    linkedlist.splice(other, 2)
+    assert len(other._index) == 0
+    _check_index(linkedlist)
+    assert not linkedlist.contains(200) and not linkedlist.contains(100)
+    assert linkedlist.contains(300) and linkedlist.contains(400) and not linkedlist.contains(302)
+    for node in list(linkedlist):
+        assert linkedlist.contains(node.value)
+    # the index is unchanged when a value is not a valid key
+    with pytest.raises(TypeError):
+        linkedlist.append(1.5)
+    with pytest.raises(TypeError):
+        linkedlist.extend([1000, 2.5])
+    with pytest.raises(TypeError):
+        linkedlist.set(0, [1])
+    assert not linkedlist.contains(1000)
+    _check_index(linkedlist)
+
+    lists = [DoublyLinkedList(indexed=True) for _ in range(2)]
+    lists[0].extend([1, 3])
+    lists[1].extend([2])
+    merged = DoublyLinkedList.merge_sorted(lists)
+    assert merged.to_list() == [1, 2, 3] and all(len(lst._index) == 0 for lst in lists)
+
+def test_index_key():
+    linkedlist = DoublyLinkedList(indexed=True, index_key=lambda pair: pair[0])
+    linkedlist.extend([("a", 1), ("b", 2), ("c", 3)])
+    assert linkedlist.contains(("b", None))
+    linkedlist.move_to_front(("c", None))
+    linkedlist.remove_value(("a", None))
+    assert linkedlist.to_list() == [("c", 3), ("b", 2)]
+    linkedlist.set(1, ("b", 20))
+    _check_index(linkedlist)
+    with pytest.raises(ValueError):
+        DoublyLinkedList(index_key=len)
+
+def test_index_does_not_change_lookups():
+    # 1.0 is not a HashMap key and True shares the key of 1, both equal the stored 1
+    for probe in (1.0, True):
+        results = []
+        for indexed in (False, True):
+            linkedlist = DoublyLinkedList(indexed=indexed)
+            linkedlist.extend([1, "x", 1])
+            found = linkedlist.contains(probe)
+            linkedlist.remove_value(probe)
+            linkedlist.move_to_back(probe)
+            results.append((found, linkedlist.to_list()))
+        assert results[0] == results[1] == (True, ["x", 1])
@@ -1,7 +1,9 @@
-from src.hashmap import HashMap
+from src.hashmap import HashMap, builtin_hash, fnv1a_hash, ascii_sum_hash
+from collections.abc import MutableMapping
+import pytest
 
 def test_hashmap_add_get_delete():
-    hashmap = HashMap()
+    hashmap = HashMap(multimap=True)
     kv_pairs = [
         ("key1", 1000),
         (12, "John Doe"),
@@ -22,8 +24,8 @@ def test_hashmap_add_get_delete():
     print("\nValidating retrieval from hashmap...")
     assert hashmap.get("nonexistent") is None
     assert hashmap.get(kv_pairs[0][0]) == [kv_pairs[0][1], kv_pairs[3][1]]
-    assert hashmap.get(kv_pairs[1][0]) == kv_pairs[1][1]
-    assert hashmap.get(kv_pairs[2][0]) == kv_pairs[2][1]
+    assert hashmap.get(kv_pairs[1][0]) == [kv_pairs[1][1]]
+    assert hashmap.get(kv_pairs[2][0]) == [kv_pairs[2][1]]
 
     print("\n-------------------- Deleting values from hashmap --------------------")
     
@@ -37,7 +39,7 @@ def test_hashmap_add_get_delete():
     # Delete specific value
     hashmap.delete(kv_pairs[0][0], target_value=kv_pairs[0][1])
     print(f"Attempting to delete k-v pair associated with key={kv_pairs[0][0]}, value={kv_pairs[0][1]}... this should result in a successful deletion")
-    assert hashmap.get(kv_pairs[0][0]) == kv_pairs[3][1]
+    assert hashmap.get(kv_pairs[0][0]) == [kv_pairs[3][1]]
 
     # Delete the rest
     print(f"Attempting to delete k-v pair associated with key={kv_pairs[1][0]}... this should result in a successful deletion")
@@ -50,4 +52,244 @@ def test_hashmap_add_get_delete():
     hashmap.delete(kv_pairs[3][0])
 
     print("\n-------------------- Printing out k-v pairs --------------------")
-    hashmap.print_kv_pairs()
\ No newline at end of file
+    hashmap.print_kv_pairs()
+
+def test_hashmap_resize_and_incremental_rehash():
+    hashmap = HashMap(size=4, load_factor=0.75, min_load_factor=0.1, rehash_step=1)
+    num_keys = 500
+
+    for key in range(num_keys):
+        hashmap.add(key=key, value=key+1)
+        # every key added so far must stay reachable, including mid-rehash
+        assert hashmap.get(key) == key+1
+
+    assert hashmap._count == num_keys
+    assert hashmap._size > 4
+    assert hashmap._count <= hashmap._size * 0.75
+
+    for key in range(num_keys):
+        assert hashmap.get(key) == key+1
+
+    grown_size = hashmap._size
+
+    for key in range(num_keys-10):
+        hashmap.delete(key)
+        assert hashmap.get(key) is None
+
+    assert hashmap._count == 10
+    assert hashmap._size < grown_size
+
+    for key in range(num_keys-10, num_keys):
+        assert hashmap.get(key) == key+1
+
+    del hashmap
+
+
+def test_hashmap_hash_functions():
+    # nested tuples used to break the ascii sum (list.extend on an int)
+    assert ascii_sum_hash(("ab", (1, ("c",)))) == ord("a") + ord("b") + 1 + ord("c")
+    # anagrams collide under the ascii sum but not under the default hash
+    assert ascii_sum_hash("abc") == ascii_sum_hash("cab")
+    assert builtin_hash("abc") != builtin_hash("cab")
+    # fnv1a is deterministic and distinguishes keys that only differ in type
+    assert fnv1a_hash(("key", 1)) == fnv1a_hash(("key", 1))
+    assert len({fnv1a_hash("1"), fnv1a_hash(1), fnv1a_hash(("1",))}) == 3
+
+    for hash_function in (builtin_hash, fnv1a_hash, ascii_sum_hash):
+        hashmap = HashMap(hash_function=hash_function)
+        for key in ("abc", "cab", "bca", 7, (1, (2, "x"))):
+            hashmap.add(key=key, value=str(key))
+        for key in ("abc", "cab", "bca", 7, (1, (2, "x"))):
+            assert hashmap.get(key) == str(key)
+        del hashmap
+
+
+def test_hashmap_hash_code_is_cached():
+    calls = []
+
+    def counting_hash(key):
+        calls.append(key)
+        return builtin_hash(key)
+
+    hashmap = HashMap(size=2, hash_function=counting_hash)
+    for key in range(100):
+        hashmap.add(key=key, value=key+1)
+
+    # one hash per add, growing the bucket list reuses the cached hash codes
+    assert len(calls) == 100
+
+    del hashmap
+
+
+def test_hashmap_bucket_stats():
+    hashmap = HashMap()
+    keys = [f"{a}{b}{c}" for a in "abcd" for b in "abcd" for c in "abcd"]
+
+    for key in keys:
+        hashmap.add(key=key, value=1)
+
+    stats = hashmap.bucket_stats()
+    assert stats["num_entries"] == len(keys)
+    assert stats["num_buckets"] == hashmap._size or hashmap._old_hashmap is not None
+    assert sum(stats["chain_length_histogram"].values()) == stats["num_buckets"]
+    assert sum(length * count for length, count in stats["chain_length_histogram"].items()) == len(keys)
+    assert stats["max_chain_length"] < 8
+
+    del hashmap
+
+
+def test_hashmap_bulk_operations():
+    kv_pairs = [(f"key{idx}", idx+1) for idx in range(300)] + [((idx, "t"), str(idx)) for idx in range(300)]
+    hashmap = HashMap.from_pairs(kv_pairs, size=4)
+
+    assert hashmap._count == len(kv_pairs)
+    # presized: the load factor already holds and no rehash is left in flight
+    assert hashmap._old_hashmap is None
+    assert hashmap._count <= hashmap._size * hashmap._load_factor
+    assert hashmap.get_many([key for key, _ in kv_pairs]) == [value for _, value in kv_pairs]
+    assert hashmap.get_many(["missing", 10**6]) == [None, None]
+
+    # invalid input is rejected before anything is written
+    with pytest.raises(ValueError):
+        hashmap.add_many([("new key", 1), ("bad value", None)])
+    assert hashmap.get("new key") is None
+
+    # the last value added for a key wins
+    hashmap.add_many([("key0", 100), ("key0", 200)])
+    assert hashmap.get("key0") == 200
+
+    # a missing key aborts the whole batch
+    with pytest.raises(KeyError):
+        hashmap.delete_many(["key1", "missing"])
+    assert hashmap.get("key1") == 2
+
+    hashmap.delete_many([key for key, _ in kv_pairs[1:]])
+    assert len(hashmap) == 1
+    assert hashmap.get_many(["key1", (5, "t")]) == [None, None]
+
+    del hashmap
+
+
+def test_hashmap_mapping_protocol():
+    hashmap = HashMap(size=2)
+    expected = {f"key{idx}": idx+1 for idx in range(50)}
+
+    for key, value in expected.items():
+        hashmap[key] = value
+
+    assert isinstance(hashmap, MutableMapping)
+    assert len(hashmap) == len(expected)
+    assert "key0" in hashmap and "missing" not in hashmap and [1] not in hashmap
+    assert hashmap["key7"] == 8
+    with pytest.raises(KeyError):
+        hashmap["missing"]
+
+    assert sorted(hashmap) == sorted(expected)
+    assert sorted(hashmap.keys()) == sorted(expected.keys())
+    assert sorted(hashmap.values()) == sorted(expected.values())
+    assert sorted(hashmap.items()) == sorted(expected.items())
+    assert hashmap == expected
+
+    hashmap.add("key0", 100)
+    assert hashmap["key0"] == 100
+    assert len(hashmap) == len(expected)
+    hashmap["key0"] = 5
+    assert hashmap["key0"] == 5
+    assert hashmap.get("missing", "default") == "default"
+
+    del hashmap["key0"]
+    assert "key0" not in hashmap
+    assert len(hashmap) == len(expected) - 1
+    assert hashmap.pop("key1") == 2
+    assert hashmap.setdefault("key2", 999) == 3
+
+    with pytest.raises(RuntimeError):
+        for key in hashmap:
+            hashmap["new key"] = 1
+
+    hashmap.clear()
+    assert len(hashmap) == 0
+    assert list(hashmap.items()) == []
+
+    del hashmap
+
+
+def test_hashmap_single_value_mode_overwrites():
+    hashmap = HashMap(size=1)
+
+    hashmap.add("key1", 1000)
+    hashmap.add("key1", 2000)
+    hashmap.add("key2", 3000) # shares the single bucket with key1
+
+    assert len(hashmap) == 2
+    assert hashmap.get("key1") == 2000
+    assert hashmap.get("key2") == 3000
+
+    hashmap.delete("key1", target_value=1000)
+    assert hashmap.get("key1") == 2000
+    hashmap.delete("key1", target_value=2000)
+    assert "key1" not in hashmap
+    assert hashmap.get("key2") == 3000
+
+    del hashmap
+
+
+def test_hashmap_multimap_containers():
+    list_map = HashMap(multimap=True, container="list")
+    set_map = HashMap(multimap=True, container="set")
+    bag_map = HashMap(multimap=True, container="bag")
+
+    for value in ("a", "b", "a"):
+        for hashmap in (list_map, set_map, bag_map):
+            hashmap.add("key", value)
+            hashmap.add("other", value)
+
+    assert list_map.get("key") == ["a", "b", "a"]
+    assert set_map.get("key") == {"a", "b"}
+    assert bag_map.get("key") == {"a": 2, "b": 1}
+    assert len(list_map) == len(set_map) == len(bag_map) == 2
+
+    # get returns the live container
+    assert set_map.get("key") is set_map["key"]
+
+    # deleting a value not in the container is a no-op
+    for hashmap in (list_map, set_map, bag_map):
+        hashmap.delete("key", target_value="missing")
+        assert "key" in hashmap
+
+    list_map.delete("key", target_value="a")
+    assert list_map.get("key") == ["b", "a"]
+    bag_map.delete("key", target_value="a")
+    assert bag_map.get("key") == {"a": 1, "b": 1}
+
+    # removing the last value removes the key
+    set_map.delete("key", target_value="a")
+    set_map.delete("key", target_value="b")
+    assert "key" not in set_map
+    assert set_map.get("other") == {"a", "b"}
+
+    # setitem replaces the container, delete without a value removes the whole container
+    bag_map["key"] = "z"
+    assert bag_map.get("key") == {"z": 1}
+    list_map.delete("key")
+    assert "key" not in list_map
+
+    with pytest.raises(ValueError):
+        HashMap(multimap=True, container="tuple")
+
+    del list_map, set_map, bag_map
+
+def test_falsy_values():
+    hashmap = HashMap()
+    for key, value in (("zero", 0), ("empty", ""), ("false", False), ("list", [])):
+        hashmap[key] = value
+        assert hashmap[key] == value and key in hashmap
+    hashmap.add("add", 0)
+    hashmap.add_many([("many", 0)])
+    assert hashmap.setdefault("default", 0) == 0 and hashmap.setdefault("default", 1) == 0
+    assert hashmap.pop("zero") == 0 and len(hashmap) == 6
+    # None is what get returns for a missing key, so it cannot be stored
+    with pytest.raises(ValueError):
+        hashmap["none"] = None
+    with pytest.raises(ValueError):
+        hashmap.add("none", None)
@@ -0,0 +1,103 @@
+from src.open_addressing_hashmap import OpenAddressingHashMap
+from src.hashmap import ascii_sum_hash
+import pytest
+
+def test_add_get_delete():
+    hashmap = OpenAddressingHashMap()
+    kv_pairs = [
+        ("key1", 1000),
+        (12, "John Doe"),
+        ((3, 4), "Tony Stark"),
+    ]
+
+    for key, value in kv_pairs:
+        assert hashmap.add(key=key, value=value) is None
+
+    assert hashmap.get("nonexistent") is None
+    for key, value in kv_pairs:
+        assert hashmap.get(key) == value
+
+    # adding an existing key overwrites its value
+    hashmap.add(key="key1", value=[234, 456, 789, "JB"])
+    assert hashmap.get("key1") == [234, 456, 789, "JB"]
+    assert hashmap.probe_stats()["num_entries"] == len(kv_pairs)
+
+    # a non-matching target_value does not delete
+    hashmap.delete(12, target_value=9999)
+    assert hashmap.get(12) == "John Doe"
+    hashmap.delete(12, target_value="John Doe")
+    assert hashmap.get(12) is None
+
+    with pytest.raises(KeyError):
+        hashmap.delete(12)
+
+    del hashmap
+
+def test_tombstones_keep_probe_chains_intact():
+    # the ascii sum makes every anagram share a home slot, forcing one long probe chain
+    hashmap = OpenAddressingHashMap(size=64, hash_function=ascii_sum_hash)
+    keys = ["abc", "acb", "bac", "bca", "cab", "cba"]
+
+    for idx, key in enumerate(keys):
+        hashmap.add(key=key, value=idx+1)
+
+    hashmap.delete("acb")
+    hashmap.delete("bca")
+
+    for idx, key in enumerate(keys):
+        if key in ("acb", "bca"):
+            assert hashmap.get(key) is None
+        else:
+            assert hashmap.get(key) == idx+1
+
+    # re-adding reuses a tombstone instead of growing the chain
+    hashmap.add(key="bca", value=100)
+    assert hashmap.get("bca") == 100
+    stats = hashmap.probe_stats()
+    assert stats["num_entries"] == 5
+    assert stats["tombstones"] == 1
+
+    del hashmap
+
+def test_resize():
+    hashmap = OpenAddressingHashMap(size=2)
+
+    for key in range(1000):
+        hashmap.add(key=key, value=key+1)
+    for key in range(0, 1000, 2):
+        hashmap.delete(key)
+
+    for key in range(1000):
+        assert hashmap.get(key) == (None if key % 2 == 0 else key+1)
+
+    stats = hashmap.probe_stats()
+    assert stats["num_entries"] == 500
+    assert (stats["num_entries"] + stats["tombstones"]) <= stats["capacity"] * 0.7
+    assert hashmap.memory_usage() > 0
+
+    del hashmap
+
+def test_falsy_values():
+    hashmap = OpenAddressingHashMap()
+    for key, value in (("zero", 0), ("empty", ""), ("false", False)):
+        hashmap.add(key, value)
+        assert hashmap.get(key) == value
+    with pytest.raises(ValueError):
+        hashmap.add("none", None)
+
+def test_hash_array():
+    # hash codes are stored as raw 8-byte words, so adding entries without resizing does not add memory
+    hashmap = OpenAddressingHashMap(size=64)
+    empty_usage = hashmap.memory_usage()
+    for key in range(40):
+        hashmap.add(key=f"key{key}", value=key)
+    assert hashmap.memory_usage() == empty_usage
+    assert hashmap._hashes.itemsize == 8 and len(hashmap._hashes) == 64
+
+    # hash codes outside the unsigned 64-bit range are masked into it
+    hashmap = OpenAddressingHashMap(size=2, hash_function=lambda key: -key)
+    for key in range(1, 50):
+        hashmap.add(key=key, value=key)
+    assert [hashmap.get(key) for key in range(1, 50)] == list(range(1, 50))
+    hashmap.delete(7)
+    assert hashmap.get(7) is None and hashmap.get(8) == 8
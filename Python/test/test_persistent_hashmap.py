@@ -0,0 +1,98 @@
+from src.persistent_hashmap import PersistentHashMap, compact, _main
+import os
+import pytest
+
+KV_PAIRS = [
+    ("key1", 1000),
+    (12, "John Doe"),
+    ((3, ("x", -4)), "Tony Stark"),
+    ("key2", [234, 456, 789, "JB"]),
+]
+
+def test_add_get_delete_and_reopen(tmp_path):
+    path = str(tmp_path / "map.phm")
+
+    with PersistentHashMap(path, num_buckets=2) as hashmap:
+        for key, value in KV_PAIRS:
+            assert hashmap.add(key, value) is None
+        hashmap.add("key1", 2000) # overwrite
+        hashmap.delete(12, target_value="someone else") # no-op
+        hashmap.delete((3, ("x", -4)))
+        with pytest.raises(KeyError):
+            hashmap.delete("missing")
+
+        assert len(hashmap) == 3
+        assert hashmap.get("key1") == 2000
+        assert hashmap.get((3, ("x", -4))) is None
+
+    with PersistentHashMap(path, readonly=True) as hashmap:
+        assert len(hashmap) == 3
+        assert hashmap["key1"] == 2000
+        assert hashmap[12] == "John Doe"
+        assert hashmap["key2"] == [234, 456, 789, "JB"]
+        assert (3, ("x", -4)) not in hashmap
+        assert dict(hashmap.items()) == {"key1": 2000, 12: "John Doe", "key2": [234, 456, 789, "JB"]}
+        with pytest.raises(PermissionError):
+            hashmap.add("key3", 1)
+
+def test_growth_and_compaction(tmp_path):
+    path = str(tmp_path / "map.phm")
+
+    with PersistentHashMap(path, num_buckets=256) as hashmap:
+        for round_idx in range(3):
+            for key in range(3000):
+                hashmap[key] = "x" * 100 + str(round_idx) # three generations of every key, file must grow
+        for key in range(0, 3000, 2):
+            del hashmap[key]
+
+    size_before = os.path.getsize(path)
+    compact(path)
+    assert os.path.getsize(path) < size_before / 2
+
+    with PersistentHashMap(path, readonly=True) as hashmap:
+        assert len(hashmap) == 1500
+        assert hashmap.num_buckets >= 1500 / 0.75
+        for key in range(3000):
+            assert hashmap.get(key) == (None if key % 2 == 0 else "x" * 100 + "2")
+
+def test_compact_command(tmp_path, capsys):
+    path = str(tmp_path / "map.phm")
+    out_path = str(tmp_path / "compacted.phm")
+
+    with PersistentHashMap(path) as hashmap:
+        for key, value in KV_PAIRS:
+            hashmap.add(key, value)
+
+    _main(["compact", path, "--out", out_path, "--buckets", "4"])
+    assert "compacted" in capsys.readouterr().out
+
+    with PersistentHashMap(out_path, readonly=True) as hashmap:
+        assert hashmap.num_buckets == 4
+        assert dict(hashmap.items()) == dict(KV_PAIRS)
+
+def test_rejects_foreign_files(tmp_path):
+    path = str(tmp_path / "not_a_map.bin")
+    with open(path, "wb") as file:
+        file.write(b"x" * 128)
+
+    with pytest.raises(ValueError):
+        PersistentHashMap(path)
+    assert os.path.getsize(path) == 128
+
+def test_falsy_values(tmp_path):
+    with PersistentHashMap(str(tmp_path / "map.phm")) as hashmap:
+        hashmap["zero"] = 0
+        assert hashmap.setdefault("empty", "") == ""
+        assert hashmap["zero"] == 0 and hashmap["empty"] == ""
+        with pytest.raises(ValueError):
+            hashmap["none"] = None
+
+def test_writes_during_iteration(tmp_path):
+    with PersistentHashMap(str(tmp_path / "map.phm"), num_buckets=4) as hashmap:
+        for key in range(3):
+            hashmap[key] = key + 1
+        for loop, value in enumerate((1, b"x" * (3 << 20))): # a small write, and one that grows (remaps) the file
+            with pytest.raises(RuntimeError):
+                for key in hashmap.keys():
+                    hashmap[(loop, key)] = value
+        assert len(hashmap) == 5 # one write per loop went through before the iterator raised
@@ -1,9 +1,11 @@
 from src.queue import Queue
+import pytest
 
 TEST_VALS = (-100, -10, 0, 10, 20, 30, 40, 50, 60)
 
-def test_enqueue_and_dequeue():
-    queue = Queue()
+@pytest.mark.parametrize("backend", ["linkedlist", "ring_buffer"])
+def test_enqueue_and_dequeue(backend):
+    queue = Queue(backend=backend)
 
     for val in TEST_VALS:
         assert queue.enqueue(val) is None
@@ -13,8 +15,9 @@ def test_enqueue_and_dequeue():
 
     del queue
 
-def test_peek():
-    queue = Queue()
+@pytest.mark.parametrize("backend", ["linkedlist", "ring_buffer"])
+def test_peek(backend):
+    queue = Queue(backend=backend)
 
     for val in TEST_VALS:
         queue.enqueue(val)
@@ -44,8 +47,9 @@ def test__len__():
 
     del queue
 
-def test__iter__():
-    queue = Queue()
+@pytest.mark.parametrize("backend", ["linkedlist", "ring_buffer"])
+def test__iter__(backend):
+    queue = Queue(backend=backend)
 
     for val in TEST_VALS:
         queue.enqueue(val)
@@ -61,4 +65,23 @@ def test__repr__():
     assert type(repr(queue)) is str
     assert len(repr(queue)) > 0
 
-    del queue
\ No newline at end of file
+    del queue
+
+@pytest.mark.parametrize("backend", ["linkedlist", "ring_buffer"])
+def test_enqueue_many_and_dequeue_many(backend):
+    queue = Queue(backend=backend)
+    queue.enqueue_many(TEST_VALS)
+    queue.enqueue(70)
+    assert queue.dequeue_many(4) == list(TEST_VALS[:4])
+    assert queue.dequeue() == TEST_VALS[4]
+    assert queue.dequeue_many(100) == list(TEST_VALS[5:]) + [70]
+    assert queue.dequeue_many(3) == [] and queue.is_empty()
+    with pytest.raises(IndexError):
+        queue.dequeue()
+    with pytest.raises(IndexError):
+        queue.peek()
+    with pytest.raises(ValueError):
+        queue.dequeue_many(-1)
+    assert "front=None" in repr(queue)
+    with pytest.raises(ValueError):
+        Queue(backend="array")
@@ -0,0 +1,90 @@
+from src.ring_buffer import RingBuffer
+from collections import deque
+import pytest
+import random
+
+def test_append_pop_first_wraps_and_resizes():
+    ring = RingBuffer(capacity=3)
+    assert len(ring.buffer) == 4
+    ring.extend([1, 2, 3])
+    assert ring.pop_first() == 1
+    for val in (4, 5, 6):
+        ring.append(val) # wraps around, then grows while wrapped
+    assert ring.to_list() == [2, 3, 4, 5, 6] and len(ring.buffer) == 8
+    assert list(ring) == ring.to_list()
+    assert ring.peek_first() == 2
+    assert ring.pop_first_many(4) == [2, 3, 4, 5]
+    assert len(ring.buffer) == 4 # shrunk back, never below the initial capacity
+    assert ring.pop_first() == 6
+    assert ring.pop_first() is None and ring.peek_first() is None
+    assert ring.pop_first_many(2) == []
+    with pytest.raises(ValueError):
+        ring.pop_first_many(-1)
+    with pytest.raises(ValueError):
+        RingBuffer(capacity=0)
+
+def test_matches_deque_and_clears_slots():
+    rng = random.Random(7)
+    ring, expected = RingBuffer(capacity=2), deque()
+    for _ in range(2_000):
+        operation = rng.random()
+        if operation < 0.4:
+            ring.append(len(expected))
+            expected.append(len(expected))
+        elif operation < 0.55:
+            values = list(range(rng.randrange(20)))
+            ring.extend(iter(values))
+            expected.extend(values)
+        elif operation < 0.85:
+            assert ring.pop_first() == (expected.popleft() if expected else None)
+        else:
+            count = rng.randrange(25)
+            assert ring.pop_first_many(count) == [expected.popleft() for _ in range(min(count, len(expected)))]
+        assert ring.to_list() == list(expected)
+        assert len(ring.buffer) & (len(ring.buffer) - 1) == 0
+        assert sum(slot is not None for slot in ring.buffer) == sum(value is not None for value in expected)
+    ring.clear()
+    assert len(ring) == 0 and len(ring.buffer) == 2
+
+def test__iter__fail_fast():
+    ring = RingBuffer()
+    ring.extend(range(3))
+    with pytest.raises(RuntimeError):
+        for value in ring:
+            ring.append(value)
+    assert type(repr(ring)) is str
+
+def test_double_ended_rotate_and_index():
+    rng = random.Random(11)
+    ring, expected = RingBuffer(capacity=2), deque()
+    for _ in range(3_000):
+        operation = rng.random()
+        if operation < 0.25:
+            ring.prepend(len(expected))
+            expected.appendleft(len(expected))
+        elif operation < 0.35:
+            values = list(range(rng.randrange(20)))
+            ring.extend_front(values)
+            expected.extendleft(values)
+        elif operation < 0.5:
+            ring.append(len(expected))
+            expected.append(len(expected))
+        elif operation < 0.7:
+            assert ring.pop() == (expected.pop() if expected else None)
+        elif operation < 0.8:
+            assert ring.pop_first() == (expected.popleft() if expected else None)
+        elif operation < 0.9:
+            steps = rng.randrange(-40, 40)
+            ring.rotate(steps)
+            expected.rotate(steps)
+        elif expected:
+            index = rng.randrange(-len(expected), len(expected))
+            assert ring[index] == expected[index]
+            ring[index] = expected[index] = -1
+        assert ring.to_list() == list(expected)
+        assert ring.peek_last() == (expected[-1] if expected else None)
+        assert sum(slot is not None for slot in ring.buffer) == len(expected)
+    with pytest.raises(IndexError):
+        ring[len(ring)]
+    with pytest.raises(IndexError):
+        ring[-len(ring) - 1] = 0
@@ -0,0 +1,87 @@
+from src.sharded_hashmap import ShardedHashMap
+import pytest
+
+def test_add_get_delete():
+    with ShardedHashMap(num_shards=2) as hashmap:
+        kv_pairs = [
+            ("key1", 1000),
+            (12, "John Doe"),
+            ((3, 4), "Tony Stark"),
+        ]
+        for key, value in kv_pairs:
+            assert hashmap.add(key=key, value=value) is None
+        assert len(hashmap) == len(kv_pairs)
+        for key, value in kv_pairs:
+            assert hashmap.get(key) == value
+            assert hashmap[key] == value
+            assert key in hashmap
+        assert hashmap.get("nonexistent") is None
+        assert "nonexistent" not in hashmap
+
+        hashmap["key1"] = [234, 456]
+        assert hashmap.get("key1") == [234, 456]
+        del hashmap[12]
+        assert 12 not in hashmap
+        # errors raised in the worker process are re-raised by the client
+        with pytest.raises(KeyError):
+            hashmap.delete(12)
+        with pytest.raises(ValueError):
+            hashmap.add("none", None)
+        with pytest.raises(TypeError):
+            hashmap.add([1], 1)
+        assert sorted(hashmap.items(), key=repr) == sorted([("key1", [234, 456]), ((3, 4), "Tony Stark")], key=repr)
+
+        hashmap.clear()
+        assert len(hashmap) == 0
+
+    with pytest.raises(ValueError):
+        hashmap.get("key1")
+
+def test_batched_requests():
+    # batch_size smaller than the per-shard groups, so batches are split into rounds
+    with ShardedHashMap(num_shards=3, batch_size=50) as hashmap:
+        kv_pairs = [(f"key{i}", i+1) for i in range(1000)]
+        hashmap.add_many(kv_pairs)
+        assert len(hashmap) == 1000
+        assert hashmap.get_many([key for key, _ in kv_pairs]) == [value for _, value in kv_pairs]
+        assert hashmap.get_many(["missing", "key5"], default=-1) == [-1, 6]
+
+        with pytest.raises(ValueError):
+            hashmap.add_many([("a", 1), ("b", None)])
+        assert "a" not in hashmap
+
+        # a missing key aborts the whole batch
+        with pytest.raises(KeyError):
+            hashmap.delete_many(["key1", "key2", "missing"])
+        assert len(hashmap) == 1000
+        hashmap.delete_many([f"key{i}" for i in range(500)])
+        assert len(hashmap) == 500
+        assert hashmap.get("key499") is None
+        assert hashmap.get("key500") == 501
+
+def test_message_too_large():
+    with ShardedHashMap(num_shards=1, buffer_size=256) as hashmap:
+        with pytest.raises(ValueError):
+            hashmap.add("key", "x" * 1000)
+        hashmap.add("key", "value")
+        assert hashmap.get("key") == "value"
+
+def test_message_too_large_in_batch():
+    # int keys route to shard key % 2, so shard 0's part of the round is sent before shard 1's part fails
+    with ShardedHashMap(num_shards=2, buffer_size=256) as hashmap:
+        with pytest.raises(ValueError):
+            hashmap.add_many([(0, "small"), (1, "x" * 1000)])
+        assert hashmap.get(0) == "small"
+        assert hashmap.get(1) is None
+        hashmap.add(1, "value")
+        assert hashmap.get_many([0, 1]) == ["small", "value"]
+
+def test_items_paged():
+    # 1000 pairs per shard would not fit in one 4 KiB response
+    with ShardedHashMap(num_shards=2, buffer_size=4096, batch_size=100) as hashmap:
+        kv_pairs = [(i, i + 1) for i in range(2000)]
+        hashmap.add_many(kv_pairs)
+        assert sorted(hashmap.items()) == kv_pairs
+        hashmap.delete_many(range(1, 2000, 2)) # shards of exactly a multiple of batch_size pairs
+        assert sorted(hashmap.items()) == kv_pairs[::2]
+        assert hashmap.get(0) == 1
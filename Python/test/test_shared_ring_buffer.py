@@ -0,0 +1,146 @@
+from src.shared_ring_buffer import SharedRingBuffer, _HEADER_BYTES
+import multiprocessing
+import os
+import subprocess
+import sys
+import pytest
+
+def test_enqueue_dequeue():
+    with SharedRingBuffer(capacity=3, record_size=8) as ring:
+        assert ring.is_empty()
+        for record in (b"a", b"bb", b"12345678"):
+            assert ring.enqueue(record) is None
+        assert len(ring) == 3 and ring.is_full()
+        with pytest.raises(OverflowError):
+            ring.enqueue(b"c")
+        with pytest.raises(ValueError):
+            ring.enqueue(b"123456789")
+        assert ring.dequeue() == b"a"
+        ring.enqueue(bytearray(b"c")) # wraps around
+        assert [ring.dequeue() for _ in range(3)] == [b"bb", b"12345678", b"c"]
+        with pytest.raises(IndexError):
+            ring.dequeue()
+        assert ring.overwritten == 0
+
+    with pytest.raises(ValueError):
+        SharedRingBuffer(capacity=0, record_size=8)
+    with pytest.raises(TypeError):
+        SharedRingBuffer(capacity=4, record_size=8.0)
+
+def test_batched():
+    with SharedRingBuffer(capacity=4, record_size=4) as ring:
+        ring.enqueue_many([b"1", b"2", b"3"])
+        with pytest.raises(OverflowError): # all or nothing
+            ring.enqueue_many([b"4", b"5"])
+        with pytest.raises(ValueError):
+            ring.enqueue_many([b"4", b"55555"])
+        assert len(ring) == 3
+        assert ring.dequeue_many(2) == [b"1", b"2"]
+        ring.enqueue_many([b"4", b"5", b"6"])
+        assert ring.dequeue_many(10) == [b"3", b"4", b"5", b"6"]
+        assert ring.dequeue_many(10) == []
+        with pytest.raises(ValueError):
+            ring.dequeue_many(0)
+
+def test_overwrite_if_full():
+    with SharedRingBuffer(capacity=3, record_size=4, overwrite_if_full=True) as ring:
+        for value in range(5):
+            ring.enqueue(str(value).encode())
+        assert len(ring) == 3
+        assert ring.dequeue() == b"2" # the oldest records were overwritten
+        assert ring.overwritten == 2
+        ring.enqueue_many([b"5", b"6", b"7", b"8"])
+        assert ring.dequeue_many(10) == [b"6", b"7", b"8"]
+        assert ring.overwritten == 5
+
+def test_attach_by_name():
+    with SharedRingBuffer(capacity=4, record_size=16) as ring:
+        other = SharedRingBuffer.attach(ring.name)
+        assert (other.capacity, other.record_size, other.overwrite_if_full) == (4, 16, False)
+        ring.enqueue(b"hello")
+        assert other.dequeue() == b"hello"
+        other.close()
+        other.close()
+        assert ring.is_empty()
+    with SharedRingBuffer(capacity=4, record_size=16, mpmc=True) as ring:
+        with pytest.raises(ValueError):
+            SharedRingBuffer.attach(ring.name)
+
+def _producer(ring, start, count):
+    for value in range(start, start + count):
+        while True:
+            try:
+                ring.enqueue(value.to_bytes(4, "little"))
+                break
+            except OverflowError:
+                os.sched_yield()
+    ring.close()
+
+def _consumer(ring, count, results):
+    values = []
+    while len(values) < count:
+        records = ring.dequeue_many(min(16, count - len(values)))
+        if not records:
+            os.sched_yield()
+        values.extend(int.from_bytes(record, "little") for record in records)
+    results.put(values)
+    ring.close()
+
+@pytest.mark.parametrize("mpmc, num_pairs", [(False, 1), (True, 2)])
+def test_across_processes(mpmc, num_pairs):
+    count = 2_000
+    with SharedRingBuffer(capacity=8, record_size=4, mpmc=mpmc) as ring:
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=_producer, args=(ring, i * count, count)) for i in range(num_pairs)]
+        processes += [multiprocessing.Process(target=_consumer, args=(ring, count, results)) for _ in range(num_pairs)]
+        for process in processes:
+            process.start()
+        received = [results.get(timeout=60) for _ in range(num_pairs)]
+        for process in processes:
+            process.join()
+        assert sorted(value for values in received for value in values) == list(range(num_pairs * count))
+        if num_pairs == 1: # a single producer and consumer preserve order
+            assert received[0] == list(range(count))
+        assert ring.is_empty()
+
+def test_attach_from_another_interpreter():
+    code = "import sys; from src.shared_ring_buffer import SharedRingBuffer\n" \
+        "ring = SharedRingBuffer.attach(sys.argv[1]); sys.stdout.write(ring.dequeue().decode()); ring.close()"
+    with SharedRingBuffer(capacity=4, record_size=16) as ring:
+        ring.enqueue_many([b"first", b"second"])
+        result = subprocess.run([sys.executable, "-c", code, ring.name], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        assert result.returncode == 0, result.stderr
+        assert result.stdout == "first"
+        # the segment outlives the attached interpreter
+        other = SharedRingBuffer.attach(ring.name)
+        assert other.dequeue() == b"second"
+        other.close()
+
+def test_unpublished_record_is_not_skipped():
+    with SharedRingBuffer(capacity=4, record_size=8) as ring:
+        ring.enqueue_many([b"a", b"b"])
+        # simulate head becoming visible before the second record's sequence number
+        sequence_word = (_HEADER_BYTES + ring._slot_size) >> 3
+        sequence = ring._words[sequence_word]
+        ring._words[sequence_word] = 0
+        assert ring.dequeue_many(10) == [b"a"]
+        assert len(ring) == 1 and ring.overwritten == 0
+        ring._words[sequence_word] = sequence
+        assert ring.dequeue() == b"b"
+
+def test_refuses_weakly_ordered_cpu(monkeypatch):
+    with SharedRingBuffer(capacity=4, record_size=8) as ring:
+        state = ring.__getstate__()
+        monkeypatch.setattr("src.shared_ring_buffer.platform.machine", lambda: "aarch64")
+        with pytest.raises(RuntimeError):
+            SharedRingBuffer(capacity=4, record_size=8)
+        with pytest.raises(RuntimeError):
+            SharedRingBuffer.attach(ring.name)
+        with pytest.raises(RuntimeError):
+            SharedRingBuffer.__new__(SharedRingBuffer).__setstate__(state)
+        monkeypatch.setattr("src.shared_ring_buffer.platform.machine", lambda: "AMD64")
+        other = SharedRingBuffer.attach(ring.name)
+        ring.enqueue(b"x")
+        assert other.dequeue() == b"x"
+        other.close()
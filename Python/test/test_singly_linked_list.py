@@ -1,4 +1,6 @@
 from src.singly_linked_list import SinglyLinkedList
+import pytest
+import random
 
 TEST_VALS = (10, 20, 30, 40, 50, 60)
 
@@ -45,6 +47,20 @@ def test__iter__():
     for idx, node in enumerate(linkedlist):
         assert node.value == TEST_VALS[idx]
 
+    # iteration is lazy and yields the linkedlist's own nodes, not copies
+    iterator = iter(linkedlist)
+    assert next(iterator) is linkedlist.head
+    linkedlist.set(1, 25)
+    assert next(iterator).value == 25
+
+    # structural changes during iteration are detected
+    linkedlist.append(70)
+    with pytest.raises(RuntimeError):
+        next(iterator)
+    with pytest.raises(RuntimeError):
+        for node in linkedlist:
+            linkedlist.remove(0)
+
     del linkedlist
 
 def test__repr__():
@@ -154,4 +170,236 @@ def test_contains():
 
     assert linkedlist.contains(val_not_in_list) is False
 
-    del linkedlist
\ No newline at end of file
+    del linkedlist
+
+def test_tail():
+    linkedlist = SinglyLinkedList()
+    assert linkedlist.tail is None
+
+    linkedlist.prepend(20)
+    assert linkedlist.tail is linkedlist.head
+    linkedlist.append(30)
+    linkedlist.prepend(10)
+    linkedlist.insert(1, 15)
+    assert linkedlist.tail.value == 30
+    linkedlist.set(3, 35)
+    assert linkedlist.tail.value == 35 and linkedlist.get(3) == 35
+
+    # removing the last node moves the tail back, appends then go after it
+    linkedlist.remove(3)
+    assert linkedlist.tail.value == 20 and linkedlist.tail.next is None
+    linkedlist.append(40)
+    assert linkedlist.to_list() == [10, 15, 20, 40]
+
+    for _ in range(len(linkedlist)):
+        linkedlist.remove(0)
+    assert linkedlist.head is None and linkedlist.tail is None
+    linkedlist.append(50)
+    assert linkedlist.head is linkedlist.tail and linkedlist.get(0) == 50
+
+def test_to_list_copy_modes():
+    linkedlist = SinglyLinkedList()
+    values = [[1], [2, [3]]]
+    for val in values:
+        linkedlist.append(val)
+
+    # default: no copying, the values are the linkedlist's own objects
+    assert all(a is b for a, b in zip(linkedlist.to_list(), values))
+    shallow = linkedlist.to_list(copy="shallow")
+    assert shallow == values and shallow[1] is not values[1] and shallow[1][1] is values[1][1]
+    deep = linkedlist.to_list(copy="deep")
+    assert deep == values and deep[1][1] is not values[1][1]
+
+    assert linkedlist.to_list(return_nodes=True)[0] is linkedlist.head
+    with pytest.raises(ValueError):
+        linkedlist.to_list(copy="bogus")
+    with pytest.raises(ValueError):
+        linkedlist.to_list(return_nodes=True, copy="deep")
+
+    del linkedlist
+
+def test_find_all_count_index():
+    linkedlist = SinglyLinkedList()
+    for val in (10, 20, 10, 30, 10):
+        linkedlist.append(val)
+
+    assert linkedlist.find(10) == 0
+    assert linkedlist.find_all(10) == [0, 2, 4]
+    assert linkedlist.find_all(99) == []
+    assert linkedlist.count(10) == 3
+    assert linkedlist.count(99) == 0
+
+    assert linkedlist.index(10) == 0
+    assert linkedlist.index(10, 1) == 2
+    assert linkedlist.index(10, -2) == 4
+    assert linkedlist.index(30, 0, 4) == 3
+    with pytest.raises(ValueError):
+        linkedlist.index(30, 0, 3)
+    with pytest.raises(ValueError):
+        linkedlist.index(10, 5)
+    with pytest.raises(ValueError):
+        SinglyLinkedList().index(10)
+
+    del linkedlist
+
+def test_node_slots_and_pool():
+    linkedlist = SinglyLinkedList()
+    linkedlist.append(10)
+    assert not hasattr(linkedlist.head, "__dict__")
+    with pytest.raises(AttributeError):
+        linkedlist.head.extra = 1
+
+    with pytest.raises(ValueError):
+        SinglyLinkedList(node_pool_size=-1)
+
+    # removed nodes are cleared and recycled, up to node_pool_size of them
+    linkedlist = SinglyLinkedList(node_pool_size=2)
+    for val in TEST_VALS:
+        linkedlist.append(val)
+    removed_nodes = [linkedlist._get_node(idx) for idx in range(3)]
+    for _ in range(3):
+        linkedlist.remove(0)
+    assert all(node.value is None for node in removed_nodes)
+    assert linkedlist._free_count == 2
+
+    linkedlist.prepend(30)
+    linkedlist.append(70)
+    linkedlist.insert(1, 35)
+    assert linkedlist._free_count == 0
+    assert sum(node is removed for node in linkedlist for removed in removed_nodes) == 2
+    assert linkedlist.to_list() == [30, 35, 40, 50, 60, 70]
+
+    del linkedlist
+
+def _check_links(linkedlist):
+    """Follows the next links from head, they must reach tail after len(linkedlist) nodes"""
+    node, last, count = linkedlist.head, None, 0
+    while node is not None:
+        node, last, count = node.next, node, count + 1
+    assert count == len(linkedlist)
+    assert linkedlist.tail is last
+
+def test_bulk_operations():
+    linkedlist = SinglyLinkedList()
+    linkedlist.extend(iter(TEST_VALS))
+    linkedlist.extend([])
+    assert linkedlist.to_list() == list(TEST_VALS)
+    _check_links(linkedlist)
+
+    # concat and splicing at the end move tail, so the next append goes after the new nodes
+    other = SinglyLinkedList()
+    other.extend([1, 2])
+    linkedlist.concat(other)
+    assert len(other) == 0 and other.head is None and other.tail is None
+    other.extend([3])
+    linkedlist.splice(other, len(linkedlist))
+    linkedlist.append(4)
+    assert linkedlist.to_list() == [*TEST_VALS, 1, 2, 3, 4]
+    _check_links(linkedlist)
+
+    # splicing at the front or in the middle keeps the tail
+    other.extend([7, 8])
+    linkedlist.splice(other, 0)
+    other.extend([5])
+    linkedlist.splice(other, 3)
+    assert linkedlist.to_list() == [7, 8, 10, 5, 20, 30, 40, 50, 60, 1, 2, 3, 4]
+    assert linkedlist.tail.value == 4
+    _check_links(linkedlist)
+    with pytest.raises(IndexError):
+        linkedlist.splice(other, len(linkedlist) + 1)
+    with pytest.raises(ValueError):
+        linkedlist.splice(linkedlist, 0)
+    with pytest.raises(TypeError):
+        linkedlist.splice([1], 0)
+
+    # negative steps are taken from a single forward walk
+    values = linkedlist.to_list()
+    for sl in (slice(-3, None), slice(10, 2, -2), slice(None, None, -1), slice(5, 5)):
+        sliced = linkedlist[sl]
+        assert type(sliced) is SinglyLinkedList
+        assert sliced.to_list() == values[sl]
+        _check_links(sliced)
+    assert linkedlist.slice(1, 4).to_list() == values[1:4]
+    with pytest.raises(IndexError):
+        linkedlist[len(values)]
+
+    # removing a range that ends at the tail moves tail back to the node before it
+    linkedlist.remove_range(-4, len(linkedlist))
+    del values[-4:]
+    assert linkedlist.tail.value == values[-1] and linkedlist.tail.next is None
+    linkedlist.append(99)
+    values.append(99)
+    linkedlist.remove_range(0, 2)
+    del values[0:2]
+    linkedlist.remove_range(3, 3)
+    assert linkedlist.to_list() == values
+    _check_links(linkedlist)
+
+    # reverse turns the old head into the tail
+    old_head = linkedlist.head
+    linkedlist.reverse()
+    assert linkedlist.tail is old_head and linkedlist.tail.next is None
+    assert linkedlist.to_list() == values[::-1]
+    _check_links(linkedlist)
+
+    linkedlist.remove_range(0, len(linkedlist))
+    assert len(linkedlist) == 0 and linkedlist.head is None and linkedlist.tail is None
+    linkedlist.reverse()
+    linkedlist.extend([1])
+    _check_links(linkedlist)
+
+    del linkedlist
+
+def test_sort():
+    rng = random.Random(19)
+    for size in (0, 1, 2, 7, 64, 257):
+        records = [(rng.randrange(10), idx) for idx in range(size)]
+        for key, reverse in ((None, False), (None, True), (lambda record: record[0], False), (lambda record: record[0], True)):
+            linkedlist = SinglyLinkedList()
+            linkedlist.extend(records)
+            linkedlist.sort(key=key, reverse=reverse)
+            # stable, like list.sort
+            assert linkedlist.to_list() == sorted(records, key=key, reverse=reverse)
+            _check_links(linkedlist)
+
+    linkedlist = SinglyLinkedList()
+    linkedlist.extend([3, 1, 2])
+    linkedlist.sort()
+    linkedlist.append(4)
+    assert linkedlist.to_list() == [1, 2, 3, 4]
+
+def test_sorted_insert():
+    linkedlist = SinglyLinkedList()
+    for value in (5, 1, 3, 3, 9, 0):
+        linkedlist.sorted_insert(value)
+    assert linkedlist.to_list() == [0, 1, 3, 3, 5, 9]
+    assert linkedlist.sorted_insert(10) == 6 and linkedlist.tail.value == 10
+    _check_links(linkedlist)
+
+    # equal keys go after the existing ones
+    records = SinglyLinkedList()
+    for record in (("b", 2), ("a", 1), ("c", 2), ("d", 0)):
+        records.sorted_insert(record, key=lambda record: record[1], reverse=True)
+    assert records.to_list() == [("b", 2), ("c", 2), ("a", 1), ("d", 0)]
+    _check_links(records)
+
+def test_merge_sorted():
+    first, second, third = SinglyLinkedList(), SinglyLinkedList(), SinglyLinkedList()
+    first.extend([(1, "a"), (4, "a"), (9, "a")])
+    second.extend([(1, "b"), (2, "b"), (4, "b")])
+    third.extend([(0, "c")])
+    merged = SinglyLinkedList.merge_sorted([first, second, third, SinglyLinkedList()], key=lambda record: record[0])
+    assert merged.to_list() == [(0, "c"), (1, "a"), (1, "b"), (2, "b"), (4, "a"), (4, "b"), (9, "a")]
+    assert len(first) == len(second) == len(third) == 0 and first.head is None
+    _check_links(merged)
+
+    first.extend([9, 5, 1])
+    second.extend([8, 2])
+    merged = SinglyLinkedList.merge_sorted([first, second], reverse=True)
+    assert merged.to_list() == [9, 8, 5, 2, 1]
+    _check_links(merged)
+    assert len(SinglyLinkedList.merge_sorted([])) == 0
+    with pytest.raises(ValueError):
+        SinglyLinkedList.merge_sorted([merged, merged])
+    with pytest.raises(TypeError):
+        SinglyLinkedList.merge_sorted([merged, [1]])
@@ -0,0 +1,126 @@
+from src.skip_list import SkipList
+import bisect
+import random
+import pytest
+
+TEST_VALS = (10, 20, 30, 40, 50, 60)
+
+def _check_widths(skiplist):
+    """Every width must equal the number of level 0 steps to the next node at that level"""
+    positions = {id(skiplist.head): 0}
+    node, position = skiplist.head.next[0], 1
+    while node is not None:
+        positions[id(node)] = position
+        node, position = node.next[0], position + 1
+    node = skiplist.head
+    while node is not None:
+        for level in range(min(len(node.next), skiplist.level)):
+            next_position = len(skiplist) + 1 if node.next[level] is None else positions[id(node.next[level])]
+            assert node.width[level] == next_position - positions[id(node)]
+        node = node.next[0]
+
+def test_positional_api():
+    skiplist = SkipList(seed=1)
+    for val in TEST_VALS:
+        assert skiplist.append(val) is None
+    skiplist.prepend(0)
+    skiplist.insert(3, 25)
+    assert skiplist.to_list() == [0, 10, 20, 25, 30, 40, 50, 60]
+    assert len(skiplist) == 8
+    assert skiplist.get(3) == 25 and skiplist[-1] == 60
+    assert skiplist.get(8) is None
+    with pytest.raises(IndexError):
+        skiplist[8]
+    with pytest.raises(IndexError):
+        skiplist.insert(9, 1)
+
+    skiplist.set(0, 5)
+    skiplist.remove(3)
+    assert skiplist.pop() == 60
+    assert skiplist.pop(0) == 5
+    assert skiplist.to_list() == [10, 20, 30, 40, 50]
+    with pytest.raises(IndexError):
+        skiplist.remove(5)
+
+    assert skiplist.find(40) == 3 and skiplist.find(99) == -1
+    assert 30 in skiplist and skiplist.contains(99) is False
+    skiplist.append(10)
+    assert skiplist.count(10) == 2
+    with pytest.raises(ValueError):
+        skiplist.add(1)
+    with pytest.raises(ValueError):
+        skiplist.bisect_left(1)
+    with pytest.raises(RuntimeError):
+        for _ in skiplist:
+            skiplist.append(1)
+    _check_widths(skiplist)
+
+def test_positional_matches_python_list():
+    rng = random.Random(7)
+    skiplist = SkipList(seed=7)
+    expected = []
+    for i in range(3000):
+        op = rng.random()
+        if (op < 0.6) or not expected:
+            index = rng.randrange(len(expected) + 1)
+            skiplist.insert(index, i)
+            expected.insert(index, i)
+        elif op < 0.9:
+            index = rng.randrange(len(expected))
+            skiplist.remove(index)
+            del expected[index]
+        else:
+            index = rng.randrange(len(expected))
+            skiplist.set(index, -i)
+            expected[index] = -i
+    assert skiplist.to_list() == expected
+    for index in range(0, len(expected), 11):
+        assert skiplist.get(index) == expected[index]
+    _check_widths(skiplist)
+
+def test_ordered_sorted_set():
+    rng = random.Random(3)
+    sorted_set = SkipList(ordered=True, seed=3)
+    expected = set()
+    for _ in range(2000):
+        value = rng.randrange(1000)
+        if rng.random() < 0.7:
+            assert sorted_set.add(value) is (value not in expected)
+            expected.add(value)
+        else:
+            assert sorted_set.discard(value) is (value in expected)
+            expected.discard(value)
+    ordered = sorted(expected)
+    assert sorted_set.to_list() == ordered
+    _check_widths(sorted_set)
+
+    # ranks, positional access and range queries
+    for value in (-1, 0, 250, 500, 999, 1000):
+        assert sorted_set.bisect_left(value) == bisect.bisect_left(ordered, value)
+        assert sorted_set.bisect_right(value) == bisect.bisect_right(ordered, value)
+    assert sorted_set.get(10) == ordered[10]
+    assert sorted_set.find(ordered[5]) == 5
+    assert list(sorted_set.range(100, 200)) == [v for v in ordered if 100 <= v < 200]
+    assert list(sorted_set.range(100, 200, inclusive=(False, True))) == [v for v in ordered if 100 < v <= 200]
+    assert list(sorted_set.range(high=50)) == [v for v in ordered if v < 50]
+    assert list(sorted_set.range(low=950)) == [v for v in ordered if v >= 950]
+    assert sorted_set.count_range(100, 200) == len([v for v in ordered if 100 <= v < 200])
+    assert sorted_set.count_range(200, 100) == 0
+
+    sorted_set.remove(0)
+    assert sorted_set.to_list() == ordered[1:]
+    with pytest.raises(ValueError):
+        sorted_set.insert(0, 1)
+    with pytest.raises(ValueError):
+        sorted_set.set(0, 1)
+
+def test_ordered_key():
+    people = SkipList(ordered=True, key=lambda person: person[1])
+    for person in (("ann", 31), ("bob", 25), ("cy", 40), ("dee", 25)):
+        people.add(person)
+    # equal keys are stored once
+    assert people.to_list() == [("bob", 25), ("ann", 31), ("cy", 40)]
+    assert people.contains(("anyone", 31))
+    assert list(people.range(("", 26), ("", 40))) == [("ann", 31)]
+    with pytest.raises(ValueError):
+        SkipList(key=len)
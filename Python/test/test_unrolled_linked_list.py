@@ -0,0 +1,133 @@
+from src.unrolled_linked_list import UnrolledLinkedList
+import random
+import pytest
+
+TEST_VALS = (10, 20, 30, 40, 50, 60)
+
+def test_append_prepend_get():
+    linkedlist = UnrolledLinkedList(chunk_size=4)
+
+    for val in TEST_VALS:
+        assert linkedlist.append(val) is None
+    for idx, val in enumerate(TEST_VALS):
+        assert linkedlist.get(idx) == val
+    assert linkedlist.get(len(TEST_VALS)) is None
+
+    linkedlist.prepend(5)
+    linkedlist.prepend(0)
+    assert linkedlist.to_list() == [0, 5, *TEST_VALS]
+    assert len(linkedlist) == len(TEST_VALS) + 2
+    assert list(linkedlist) == linkedlist.to_list()
+    assert type(repr(linkedlist)) is str
+
+    del linkedlist
+
+def test_insert_remove_set():
+    linkedlist = UnrolledLinkedList(chunk_size=4)
+    for val in TEST_VALS:
+        linkedlist.append(val)
+
+    # inserting into a full chunk splits it
+    linkedlist.insert(1, 15)
+    linkedlist.insert(3, 25)
+    assert linkedlist.to_list() == [10, 15, 20, 25, 30, 40, 50, 60]
+    with pytest.raises(IndexError):
+        linkedlist.insert(len(linkedlist), 70)
+
+    linkedlist.set(0, 11)
+    assert linkedlist.get(0) == 11
+    with pytest.raises(IndexError):
+        linkedlist.set(-1, 0)
+
+    linkedlist.remove(0)
+    linkedlist.remove(len(linkedlist) - 1)
+    assert linkedlist.to_list() == [15, 20, 25, 30, 40, 50]
+    with pytest.raises(IndexError):
+        linkedlist.remove(len(linkedlist))
+
+    while len(linkedlist):
+        linkedlist.remove(0)
+    assert linkedlist.head is None and linkedlist.tail is None
+    linkedlist.append(1)
+    assert linkedlist.to_list() == [1]
+
+    del linkedlist
+
+def test_find_count_index():
+    linkedlist = UnrolledLinkedList(chunk_size=2)
+    for val in (10, 20, 10, 30, 10):
+        linkedlist.append(val)
+
+    assert linkedlist.find(30) == 3
+    assert linkedlist.find(99) == -1
+    assert linkedlist.contains(20) is True
+    assert linkedlist.contains(99) is False
+    assert linkedlist.find_all(10) == [0, 2, 4]
+    assert linkedlist.count(10) == 3
+    assert linkedlist.index(10, 1) == 2
+    assert linkedlist.index(10, -2) == 4
+    with pytest.raises(ValueError):
+        linkedlist.index(30, 0, 3)
+
+    del linkedlist
+
+def test_array_chunks():
+    linkedlist = UnrolledLinkedList(chunk_size=8, typecode="d")
+    for val in range(20):
+        linkedlist.append(val / 2)
+    assert linkedlist.get(3) == 1.5
+    assert linkedlist.find(9.5) == 19
+    assert linkedlist.find("not a float") == -1
+    with pytest.raises(TypeError):
+        linkedlist.append("not a float")
+    assert len(linkedlist) == 20
+
+    with pytest.raises(ValueError):
+        UnrolledLinkedList(typecode="?")
+    with pytest.raises(ValueError):
+        UnrolledLinkedList(chunk_size=1)
+
+    del linkedlist
+
+@pytest.mark.parametrize("typecode", [None, "q"])
+def test_matches_python_list(typecode):
+    rng = random.Random(15)
+    linkedlist = UnrolledLinkedList(chunk_size=8, typecode=typecode)
+    expected = []
+
+    for i in range(3000):
+        op = rng.random()
+        if (op < 0.3) or not expected:
+            linkedlist.append(i)
+            expected.append(i)
+        elif op < 0.4:
+            linkedlist.prepend(i)
+            expected.insert(0, i)
+        elif op < 0.7:
+            index = rng.randrange(len(expected))
+            linkedlist.insert(index, i)
+            expected.insert(index, i)
+        else:
+            index = rng.randrange(len(expected))
+            linkedlist.remove(index)
+            del expected[index]
+
+    assert linkedlist.to_list() == expected
+    assert len(linkedlist) == len(expected)
+    for index in range(0, len(expected), 7):
+        assert linkedlist.get(index) == expected[index]
+
+    # every chunk is non-empty and within chunk_size, and the tail is the last node
+    node, last = linkedlist.head, None
+    while node is not None:
+        assert 0 < len(node.items) <= linkedlist.chunk_size
+        node, last = node.next, node
+    assert last is linkedlist.tail
+
+def test__iter__fail_fast():
+    linkedlist = UnrolledLinkedList()
+    for val in TEST_VALS:
+        linkedlist.append(val)
+    with pytest.raises(RuntimeError):
+        for _ in linkedlist:
+            linkedlist.append(1)